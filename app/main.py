@@ -1,7 +1,14 @@
 import os
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 
+from config.crawl_executor import shutdown_crawl_executor
+from config.lifespan import LifespanHooks
+from config.webdriver.webdriver_pool import shutdown_webdriver_pools
 from naver.bootstrap import setup_module as setup_naver
+from product_review_collector.adapter.output.naver_review_html_parser import shutdown_parser_executor
+from product_review_collector.bootstrap import setup_product_review_collector
 from product_review_crawling_agents.adapter.input.web.product_review_crawling_agents_router import (
     product_review_crawling_agents_router,
 )
@@ -12,7 +19,20 @@ load_dotenv()
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI()
+# 모듈별 bootstrap 이 등록한 시작/종료 훅 (작업 워커 시작, 클라이언트/풀 정리)
+lifespan_hooks = LifespanHooks()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await lifespan_hooks.startup()
+    try:
+        yield
+    finally:
+        await lifespan_hooks.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "http://localhost:3000",  # Next.js 프론트 엔드 URL
@@ -29,8 +49,14 @@ app.add_middleware(
 app.include_router(product_review_crawling_agents_router, prefix="/product-reviews")
 
 # 모듈
-setup_review(app)
-setup_naver(app)
+setup_review(app, lifespan_hooks)
+setup_naver(app, lifespan_hooks)
+setup_product_review_collector(app, lifespan_hooks)
+
+# 크롤링 실행기 / WebDriver 풀 / 리뷰 파서 풀 정리 (모듈 종료 훅 다음에 실행)
+lifespan_hooks.on_shutdown(shutdown_crawl_executor)
+lifespan_hooks.on_shutdown(shutdown_webdriver_pools)
+lifespan_hooks.on_shutdown(shutdown_parser_executor)
 
 # 앱 실행
 if __name__ == "__main__":
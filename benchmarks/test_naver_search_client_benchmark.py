@@ -0,0 +1,98 @@
+"""
+Shopping API 클라이언트 지연 비교: 요청마다 새 연결(requests.get) vs keep-alive 풀(NaverSearchApiAdapter)
+로컬 /v1/search/shop.json 목 서버에 기록해 둔 응답을 재생한다.
+실행: pytest benchmarks/test_naver_search_client_benchmark.py
+"""
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("httpx")
+
+from benchmarks.conftest import read_fixture
+from config import naver_config
+from naver.adapter.output.naver_api_adapter import SHOP_SEARCH_PATH, NaverSearchApiAdapter
+
+PAGES = 20
+
+
+class _ShopSearchHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+    # 헤더와 본문을 나눠 쓰므로 Nagle + delayed ACK 로 keep-alive 응답마다 ~40ms 가 붙지 않게 함
+    disable_nagle_algorithm = True
+    body = b""
+
+    def do_GET(self):
+        if not self.path.startswith(SHOP_SEARCH_PATH):
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def api_base():
+    _ShopSearchHandler.body = read_fixture("naver_shop_search.json").encode("utf-8")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ShopSearchHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def adapter(api_base, monkeypatch):
+    monkeypatch.setattr(naver_config, "NAVER_API_BASE", api_base)
+    monkeypatch.setattr(naver_config, "NAVER_CLIENT_ID", "bench-id")
+    monkeypatch.setattr(naver_config, "NAVER_CLIENT_SECRET", "bench-secret")
+    adapter = NaverSearchApiAdapter()
+    yield adapter
+    adapter.close()
+    asyncio.run(adapter.aclose())
+
+
+def test_unpooled_requests_get(benchmark, api_base):
+    # 기존 구현: 페이지마다 requests.get (연결 재사용 없음)
+    url = f"{api_base}{SHOP_SEARCH_PATH}"
+    headers = {"X-Naver-Client-Id": "bench-id", "X-Naver-Client-Secret": "bench-secret"}
+
+    def fetch_pages():
+        for page in range(PAGES):
+            response = requests.get(url, headers=headers, params={"query": "이어폰", "start": page * 10 + 1})
+            assert response.status_code == 200
+
+    benchmark(fetch_pages)
+
+
+def test_pooled_session(benchmark, adapter):
+    def fetch_pages():
+        for page in range(PAGES):
+            assert len(adapter.search_products("이어폰", start=page * 10 + 1)) == 10
+
+    benchmark(fetch_pages)
+
+
+def test_pooled_async_client(benchmark, adapter):
+    loop = asyncio.new_event_loop()
+
+    async def fetch_pages():
+        pages = await asyncio.gather(*(
+            adapter.search_products_async("이어폰", start=page * 10 + 1) for page in range(PAGES)
+        ))
+        assert all(len(products) == 10 for products in pages)
+
+    try:
+        benchmark(lambda: loop.run_until_complete(fetch_pages()))
+        loop.run_until_complete(adapter.aclose())
+    finally:
+        loop.close()
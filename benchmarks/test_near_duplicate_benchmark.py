@@ -0,0 +1,55 @@
+"""
+근사 중복 제거 MinHash/LSH vs 모든 쌍 Jaccard 비교 (정제된 합성 리뷰 2,000개)
+실행: pytest benchmarks/test_near_duplicate_benchmark.py --benchmark-group-by=group
+"""
+from typing import FrozenSet, List
+
+import pytest
+
+from benchmarks.test_preprocess_benchmark import _synthetic_reviews
+from review.application.usecase.preprocess_usecase import PreprocessUseCase
+from review.infrastructure.near_duplicate import NearDuplicateIndex
+
+REVIEW_COUNT = 2_000
+THRESHOLD = 0.8
+
+
+@pytest.fixture(scope="module")
+def texts() -> List[str]:
+    # 완전 일치 중복까지만 제거한 정제 결과 (근사 중복 제거 직전 입력과 같음)
+    result = PreprocessUseCase(near_duplicate_threshold=0).execute(_synthetic_reviews(REVIEW_COUNT))
+    return [item["text"] for item in result["clean_reviews"]]
+
+
+def _minhash_dedup(texts: List[str]) -> List[str]:
+    index = NearDuplicateIndex(threshold=THRESHOLD)
+    return [text for text in texts if index.add_if_unique(text)]
+
+
+def _pairwise_dedup(texts: List[str]) -> List[str]:
+    # 기준선: 앞서 남긴 모든 리뷰와 shingle Jaccard 를 직접 비교 (O(n^2))
+    shingle = NearDuplicateIndex(threshold=THRESHOLD)._shingle
+    kept: List[str] = []
+    kept_shingles: List[FrozenSet[str]] = []
+    for text in texts:
+        shingles = shingle(text)
+        if any(len(shingles & other) / len(shingles | other) >= THRESHOLD for other in kept_shingles):
+            continue
+        kept.append(text)
+        kept_shingles.append(shingles)
+    return kept
+
+
+@pytest.mark.benchmark(group="near-duplicate-2k")
+def test_minhash_dedup(benchmark, texts):
+    assert benchmark(_minhash_dedup, texts)
+
+
+@pytest.mark.benchmark(group="near-duplicate-2k")
+def test_pairwise_dedup(benchmark, texts):
+    assert benchmark.pedantic(_pairwise_dedup, args=(texts,), rounds=3, iterations=1)
+
+
+def test_minhash_matches_pairwise(texts):
+    # 후보는 실제 Jaccard 로 다시 확인하므로, LSH 가 놓치는 쌍이 없으면 결과가 같음
+    assert _minhash_dedup(texts) == _pairwise_dedup(texts)
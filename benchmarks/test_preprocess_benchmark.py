@@ -0,0 +1,70 @@
+"""
+리뷰 전처리 단일 프로세스 vs 프로세스 풀 비교 (합성 한국어 리뷰 100,000개)
+프로세스 풀은 정제 단계만 나눠 처리하므로 근사 중복 제거는 끄고 측정
+실행: pytest benchmarks/test_preprocess_benchmark.py --benchmark-group-by=group
+"""
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from review.application.usecase.preprocess_usecase import PreprocessUseCase
+
+REVIEW_COUNT = 100_000
+WORKERS = min(4, os.cpu_count() or 1)
+
+_OPENINGS = ["배송이 정말 빨라요", "포장이 꼼꼼했어요", "생각보다 크기가 작아요", "색상이 사진이랑 똑같아요", "가격 대비 만족합니다"]
+_DETAILS = ["재구매 의사 있어요", "선물용으로 샀는데 좋아하네요", "냄새가 조금 나요", "마감이 아쉬워요", "사이즈는 정사이즈예요"]
+_NOISE = ["ㅋㅋㅋㅋ", "좋아요!!!", "<br>", "😀😀", "&amp;", "굿굿굿"]
+
+
+def _synthetic_reviews(count: int, seed: int = 22) -> list[str]:
+    # 실제 리뷰처럼 템플릿 조합 + 노이즈/태그/반복 문자를 섞고, 일부는 그대로 중복
+    rng = random.Random(seed)
+    reviews = []
+    for index in range(count):
+        if index and rng.random() < 0.1:
+            reviews.append(reviews[rng.randrange(index)])
+            continue
+        parts = [rng.choice(_OPENINGS), rng.choice(_DETAILS), rng.choice(_NOISE), f"{rng.randint(1, 999)}번째 구매"]
+        rng.shuffle(parts)
+        reviews.append(" ".join(parts) + rng.choice([".", "!!", "~~~", "요오오"]))
+    return reviews
+
+
+@pytest.fixture(scope="module")
+def reviews() -> list[str]:
+    return _synthetic_reviews(REVIEW_COUNT)
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    with ProcessPoolExecutor(max_workers=WORKERS) as pool:
+        # 워커 기동 비용은 측정에서 제외
+        list(pool.map(abs, range(WORKERS)))
+        yield pool
+
+
+def _single_process() -> PreprocessUseCase:
+    return PreprocessUseCase(near_duplicate_threshold=0)
+
+
+def _pooled(pool) -> PreprocessUseCase:
+    return PreprocessUseCase(process_pool=pool, near_duplicate_threshold=0)
+
+
+@pytest.mark.benchmark(group="preprocess-100k")
+def test_preprocess_single_process(benchmark, reviews):
+    result = benchmark.pedantic(_single_process().execute, args=(reviews,), rounds=3, iterations=1)
+    assert result["stats"]["input_count"] == REVIEW_COUNT
+
+
+@pytest.mark.benchmark(group="preprocess-100k")
+def test_preprocess_process_pool(benchmark, reviews, process_pool):
+    result = benchmark.pedantic(_pooled(process_pool).execute, args=(reviews,), rounds=3, iterations=1)
+    assert result["stats"]["input_count"] == REVIEW_COUNT
+
+
+def test_process_pool_matches_single_process(reviews, process_pool):
+    assert _pooled(process_pool).execute(reviews) == _single_process().execute(reviews)
@@ -0,0 +1,43 @@
+"""
+리뷰 페이지 파서 백엔드 비교 (저장해 둔 20개 리뷰 페이지)
+실행: pytest benchmarks/test_review_html_parser_benchmark.py --benchmark-group-by=func
+"""
+import importlib.util
+
+import pytest
+
+from benchmarks.conftest import read_fixture
+from product_review_collector.adapter.output.naver_review_html_parser import (
+    parse_review_page,
+    parse_total_review_count,
+)
+
+BACKENDS = [
+    pytest.param(
+        backend,
+        marks=pytest.mark.skipif(importlib.util.find_spec(module) is None, reason=f"{module} 미설치"),
+    )
+    for backend, module in (("bs4", "bs4"), ("lxml", "lxml"), ("selectolax", "selectolax"))
+]
+
+
+@pytest.fixture(scope="module")
+def review_html() -> str:
+    return read_fixture("naver_review_page_20.html")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_parse_review_page(benchmark, review_html, backend):
+    reviews = benchmark(parse_review_page, review_html, backend)
+    assert len(reviews) == 20
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_parse_total_review_count(benchmark, review_html, backend):
+    assert benchmark(parse_total_review_count, review_html, backend) == 3482
+
+
+@pytest.mark.parametrize("backend", BACKENDS[1:])
+def test_backend_matches_beautifulsoup(review_html, backend):
+    pytest.importorskip("bs4")
+    assert parse_review_page(review_html, backend) == parse_review_page(review_html, "bs4")
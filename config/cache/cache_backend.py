@@ -0,0 +1,162 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from config import crawler_config
+
+
+class CacheBackend(ABC):
+    """문자열 값을 TTL 과 함께 저장하는 비동기 캐시 백엔드."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def acquire_lock(self, key: str, token: str, ttl_seconds: float) -> bool:
+        """key 가 비어 있을 때만 token 으로 점유 (SET NX). 만료 시간이 지나면 자동 해제."""
+
+    @abstractmethod
+    async def release_lock(self, key: str, token: str) -> None:
+        """자신의 token 으로 점유한 경우에만 해제."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """프로세스 로컬 캐시. 테스트 및 단일 워커 환경에서 Redis 와 동일하게 동작한다.
+    max_entries 를 지정하면 가장 오래 사용하지 않은 항목부터 제거(LRU)."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl_seconds)
+            self._entries.move_to_end(key)
+            if self._max_entries is not None:
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    async def acquire_lock(self, key: str, token: str, ttl_seconds: float) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                return False
+            self._entries[key] = (token, time.monotonic() + ttl_seconds)
+            return True
+
+    async def release_lock(self, key: str, token: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == token:
+                del self._entries[key]
+
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisCacheBackend(CacheBackend):
+    """config.redis_config 의 Redis 를 사용하는 캐시 (워커 간 공유)."""
+
+    def __init__(self, redis_client):
+        self._redis = redis_client
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._redis.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        await self._redis.set(key, value, ex=ttl_seconds)
+
+    async def delete(self, key: str) -> bool:
+        return bool(await self._redis.delete(key))
+
+    async def acquire_lock(self, key: str, token: str, ttl_seconds: float) -> bool:
+        return bool(await self._redis.set(key, token, nx=True, px=int(ttl_seconds * 1000)))
+
+    async def release_lock(self, key: str, token: str) -> None:
+        await self._redis.eval(_RELEASE_LOCK_SCRIPT, 1, key, token)
+
+
+class TieredCacheBackend(CacheBackend):
+    """로컬(LRU) 캐시 앞단 + 공유(Redis) 캐시 뒷단. 로컬 미스 시 공유 캐시 값을 로컬에 채운다."""
+
+    def __init__(self, local: CacheBackend, remote: CacheBackend, *, local_ttl_seconds: int):
+        self._local = local
+        self._remote = remote
+        self._local_ttl_seconds = local_ttl_seconds
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self._local.get(key)
+        if value is not None:
+            return value
+        value = await self._remote.get(key)
+        if value is not None:
+            await self._local.set(key, value, self._local_ttl_seconds)
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        await self._local.set(key, value, min(ttl_seconds, self._local_ttl_seconds))
+        await self._remote.set(key, value, ttl_seconds)
+
+    async def delete(self, key: str) -> bool:
+        local_deleted = await self._local.delete(key)
+        return await self._remote.delete(key) or local_deleted
+
+    async def acquire_lock(self, key: str, token: str, ttl_seconds: float) -> bool:
+        return await self._remote.acquire_lock(key, token, ttl_seconds)
+
+    async def release_lock(self, key: str, token: str) -> None:
+        await self._remote.release_lock(key, token)
+
+
+_backend_instances: Dict[str, CacheBackend] = {}
+
+
+def get_cache_backend(kind: str) -> Optional[CacheBackend]:
+    """kind("memory" | "redis") 별 캐시 백엔드 (Singleton). "none" 이면 None."""
+    kind = (kind or "none").lower()
+    if kind == "none":
+        return None
+
+    if kind not in _backend_instances:
+        if kind == "memory":
+            _backend_instances[kind] = InMemoryCacheBackend(max_entries=crawler_config.CRAWL_CACHE_MAX_ENTRIES)
+        elif kind == "redis":
+            from config.redis_config import get_async_redis  # Redis 설정이 있을 때만 로딩
+
+            _backend_instances[kind] = RedisCacheBackend(get_async_redis())
+        else:
+            raise ValueError(f"unknown cache backend: {kind}")
+    return _backend_instances[kind]
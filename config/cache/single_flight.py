@@ -0,0 +1,160 @@
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from config import crawler_config
+from config.cache.cache_backend import CacheBackend, get_cache_backend
+from config.crawl_executor import DisconnectProbe
+
+# 합쳐진 작업: 모든 대기자가 연결을 끊었는지 확인하는 함수를 전달받음
+FlightFunc = Callable[[Optional[DisconnectProbe]], Awaitable[Any]]
+
+
+class SingleFlightTimeoutError(Exception):
+    pass
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"not JSON serializable: {type(value).__name__}")
+
+
+class _Flight:
+    __slots__ = ("task", "probes")
+
+    def __init__(self):
+        self.task: asyncio.Task | None = None
+        self.probes: List[Optional[DisconnectProbe]] = []
+
+    async def all_disconnected(self) -> bool:
+        # 연결 확인 수단이 없는 대기자가 하나라도 있으면 끝까지 실행
+        if not self.probes or any(probe is None for probe in self.probes):
+            return False
+        for probe in self.probes:
+            if not await probe():
+                return False
+        return True
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 작업을 하나로 합침 (request coalescing)
+    - 프로세스 내: 진행 중인 작업(asyncio.Task)을 모든 호출자가 함께 기다림
+    - 워커 간(backend 지정 시): 락을 잡은 워커만 실행하고, 나머지 워커는 결과 키가 채워질 때까지 대기
+    - 작업 취소는 기다리는 모든 클라이언트가 연결을 끊었을 때만 전달
+    - 결과는 워커 간 공유를 위해 JSON 직렬화 가능해야 함 (backend 지정 시 리더/대기자 모두 JSON 왕복 결과를 받음)
+    """
+
+    def __init__(
+            self,
+            name: str,
+            backend: CacheBackend | None = None,
+            *,
+            lock_ttl_seconds: float,
+            result_ttl_seconds: int,
+            wait_timeout_seconds: float,
+            poll_interval_seconds: float,
+    ):
+        self.name = name
+        self._backend = backend
+        self._lock_ttl_seconds = lock_ttl_seconds
+        self._result_ttl_seconds = result_ttl_seconds
+        self._wait_timeout_seconds = wait_timeout_seconds
+        self._poll_interval_seconds = poll_interval_seconds
+        self._flights: Dict[str, _Flight] = {}
+        self._counters = {"leader": 0, "coalesced_local": 0, "coalesced_remote": 0}
+
+    async def do(self, key: str, func: FlightFunc, is_disconnected: DisconnectProbe | None = None) -> Any:
+        flight = self._flights.get(key)
+        if flight is not None:
+            self._counters["coalesced_local"] += 1
+            flight.probes.append(is_disconnected)
+            # 먼저 온 호출자가 취소되어도 공유 작업은 계속되도록 shield
+            return await asyncio.shield(flight.task)
+
+        flight = _Flight()
+        flight.probes.append(is_disconnected)
+        flight.task = asyncio.create_task(self._run(key, func, flight))
+        self._flights[key] = flight
+        flight.task.add_done_callback(lambda _: self._flights.pop(key, None))
+        return await asyncio.shield(flight.task)
+
+    def stats(self) -> Dict[str, Any]:
+        total = sum(self._counters.values())
+        coalesced = self._counters["coalesced_local"] + self._counters["coalesced_remote"]
+        return {
+            "name": self.name,
+            **self._counters,
+            "in_flight": len(self._flights),
+            "hit_rate": round(coalesced / total, 4) if total else 0.0,
+        }
+
+    async def _run(self, key: str, func: FlightFunc, flight: _Flight) -> Any:
+        if self._backend is None:
+            self._counters["leader"] += 1
+            return await func(flight.all_disconnected)
+
+        lock_key = f"single-flight:{self.name}:lock:{key}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self._wait_timeout_seconds
+
+        while True:
+            if await self._backend.acquire_lock(lock_key, token, self._lock_ttl_seconds):
+                self._counters["leader"] += 1
+                try:
+                    raw = _serialize(await func(flight.all_disconnected))
+                    await self._backend.set(self._result_key(key, token), raw, self._result_ttl_seconds)
+                    # 리더도 대기자와 같은 역직렬화 결과를 반환해 워커마다 결과 타입이 달라지지 않게 함
+                    return json.loads(raw)
+                finally:
+                    await self._backend.release_lock(lock_key, token)
+
+            # 다른 워커가 실행 중: 락 값(리더의 토큰)으로 그 실행의 결과 키만 기다림
+            # (이전 실행이 남긴 결과를 받지 않음). 결과 없이 락이 풀리거나 바뀌면(리더 실패) 다시 락을 시도
+            leader_token = await self._backend.get(lock_key)
+            if leader_token is None:
+                continue
+            result_key = self._result_key(key, leader_token)
+
+            while True:
+                if time.monotonic() >= deadline:
+                    raise SingleFlightTimeoutError(f"{self.name}: waited {self._wait_timeout_seconds}s for {key}")
+                await asyncio.sleep(self._poll_interval_seconds)
+
+                # 리더는 결과를 저장한 뒤 락을 풀므로, 락 상태를 먼저 읽어야 결과를 놓치지 않음
+                lock_held = await self._backend.get(lock_key) == leader_token
+                raw = await self._backend.get(result_key)
+                if raw is not None:
+                    self._counters["coalesced_remote"] += 1
+                    return json.loads(raw)
+                if not lock_held:
+                    break
+
+    def _result_key(self, key: str, token: str) -> str:
+        return f"single-flight:{self.name}:result:{key}:{token}"
+
+
+def _serialize(result: Any) -> str:
+    return json.dumps(result, ensure_ascii=False, default=_json_default)
+
+
+_single_flight_instances: Dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """이름별 SingleFlight (Singleton). COALESCE_BACKEND=redis 면 워커 간에도 합친다."""
+    if name not in _single_flight_instances:
+        backend_kind = crawler_config.COALESCE_BACKEND
+        _single_flight_instances[name] = SingleFlight(
+            name,
+            get_cache_backend(backend_kind) if backend_kind == "redis" else None,
+            lock_ttl_seconds=crawler_config.COALESCE_LOCK_TTL_SECONDS,
+            result_ttl_seconds=crawler_config.COALESCE_RESULT_TTL_SECONDS,
+            wait_timeout_seconds=crawler_config.COALESCE_WAIT_TIMEOUT_SECONDS,
+            poll_interval_seconds=crawler_config.COALESCE_POLL_INTERVAL_SECONDS,
+        )
+    return _single_flight_instances[name]
@@ -0,0 +1,226 @@
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+from config import crawler_config
+
+logger = logging.getLogger(__name__)
+
+# 클라이언트 연결 종료 여부 확인 함수 (fastapi.Request.is_disconnected)
+DisconnectProbe = Callable[[], Awaitable[bool]]
+
+_ITEM, _DONE, _ERROR = "item", "done", "error"
+
+
+class CrawlCancelledError(Exception):
+    pass
+
+
+class CrawlTimeoutError(Exception):
+    pass
+
+
+def raise_if_cancelled(cancel_event: Optional[threading.Event]) -> None:
+    """크롤링 스레드에서 페이지 이동 사이마다 호출해 취소 요청을 반영한다."""
+    if cancel_event is not None and cancel_event.is_set():
+        raise CrawlCancelledError("crawl cancelled")
+
+
+class CrawlExecutor:
+    """
+    블로킹 Selenium 크롤링을 이벤트 루프 밖 전용 스레드 풀에서 실행
+    - max_concurrency 로 동시 크롤링 수 제한 (초과 요청은 큐에서 대기)
+    - 크롤링 단위 timeout, 클라이언트 연결 종료 시 취소
+    - 취소는 cancel_event 로 전달되며 크롤링 함수가 페이지 단위로 확인
+    - stream(): 동기 제너레이터 결과를 bounded 큐로 넘겨 async generator 로 소비
+    """
+
+    def __init__(
+            self,
+            *,
+            max_concurrency: int,
+            timeout: float,
+            disconnect_poll_interval: float = 0.5,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.disconnect_poll_interval = disconnect_poll_interval
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="crawl",
+        )
+
+    async def run(
+            self,
+            func: Callable[..., Any],
+            *args: Any,
+            timeout: float | None = None,
+            is_disconnected: DisconnectProbe | None = None,
+            **kwargs: Any,
+    ) -> Any:
+        """func(*args, cancel_event=..., **kwargs) 를 워커 스레드에서 실행하고 결과를 기다린다."""
+        loop = asyncio.get_running_loop()
+        cancel_event = threading.Event()
+        crawl_future = loop.run_in_executor(
+            self._executor,
+            functools.partial(func, *args, cancel_event=cancel_event, **kwargs),
+        )
+        crawl_future.add_done_callback(_consume_exception)
+
+        watchers = [crawl_future]
+        disconnect_task = None
+        if is_disconnected is not None:
+            disconnect_task = asyncio.create_task(self._wait_for_disconnect(is_disconnected))
+            watchers.append(disconnect_task)
+
+        try:
+            done, _ = await asyncio.wait(
+                watchers,
+                timeout=timeout or self.timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        except asyncio.CancelledError:
+            cancel_event.set()
+            crawl_future.cancel()
+            raise
+        finally:
+            if disconnect_task is not None:
+                disconnect_task.cancel()
+
+        if crawl_future in done:
+            return crawl_future.result()
+
+        # 아직 실행 중인 크롤링에는 취소 신호, 큐 대기 중이면 실행 자체를 취소
+        cancel_event.set()
+        crawl_future.cancel()
+
+        if disconnect_task is not None and disconnect_task in done:
+            logger.info("클라이언트 연결 종료로 크롤링 취소")
+            raise CrawlCancelledError("client disconnected")
+
+        raise CrawlTimeoutError(f"crawl timed out after {timeout or self.timeout}s")
+
+    async def stream(
+            self,
+            func: Callable[..., Iterator[Any]],
+            *args: Any,
+            timeout: float | None = None,
+            is_disconnected: DisconnectProbe | None = None,
+            queue_size: int = 2,
+            **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """
+        func(*args, cancel_event=..., **kwargs) 제너레이터를 워커 스레드에서 돌리며 항목을 하나씩 yield
+        - 큐가 가득 차면 크롤링 스레드가 대기하므로 메모리는 queue_size 항목 이내로 유지
+        - timeout 은 다음 항목을 기다리는 최대 시간
+        """
+        loop = asyncio.get_running_loop()
+        cancel_event = threading.Event()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+
+        def produce() -> None:
+            iterator = func(*args, cancel_event=cancel_event, **kwargs)
+            try:
+                for item in iterator:
+                    if not _put_threadsafe(loop, queue, (_ITEM, item), cancel_event):
+                        return
+            except BaseException as exc:
+                _put_threadsafe(loop, queue, (_ERROR, exc), cancel_event)
+            else:
+                _put_threadsafe(loop, queue, (_DONE, None), cancel_event)
+            finally:
+                iterator.close()
+
+        producer = loop.run_in_executor(self._executor, produce)
+        producer.add_done_callback(_consume_exception)
+
+        disconnect_task = None
+        if is_disconnected is not None:
+            disconnect_task = asyncio.create_task(self._wait_for_disconnect(is_disconnected))
+
+        try:
+            while True:
+                get_task = asyncio.ensure_future(queue.get())
+                waiters = {get_task} if disconnect_task is None else {get_task, disconnect_task}
+                done, _ = await asyncio.wait(
+                    waiters,
+                    timeout=timeout or self.timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if get_task not in done:
+                    get_task.cancel()
+                    if disconnect_task is not None and disconnect_task in done:
+                        logger.info("클라이언트 연결 종료로 크롤링 취소")
+                        raise CrawlCancelledError("client disconnected")
+                    raise CrawlTimeoutError(f"crawl produced nothing for {timeout or self.timeout}s")
+
+                kind, payload = get_task.result()
+                if kind == _DONE:
+                    return
+                if kind == _ERROR:
+                    raise payload
+                yield payload
+        finally:
+            # 소비자가 중간에 멈춘 경우에도 크롤링 스레드가 다음 페이지 전에 멈추도록 신호
+            cancel_event.set()
+            producer.cancel()
+            if disconnect_task is not None:
+                disconnect_task.cancel()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _wait_for_disconnect(self, is_disconnected: DisconnectProbe) -> None:
+        while not await is_disconnected():
+            await asyncio.sleep(self.disconnect_poll_interval)
+
+
+def _put_threadsafe(
+        loop: asyncio.AbstractEventLoop,
+        queue: asyncio.Queue,
+        entry: Any,
+        cancel_event: threading.Event,
+) -> bool:
+    """워커 스레드에서 이벤트 루프의 큐에 넣는다. 취소되면 False."""
+    future = asyncio.run_coroutine_threadsafe(queue.put(entry), loop)
+    while True:
+        try:
+            future.result(timeout=0.5)
+            return True
+        except concurrent.futures.TimeoutError:
+            if cancel_event.is_set():
+                future.cancel()
+                return False
+        except (concurrent.futures.CancelledError, RuntimeError):
+            return False
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    # 취소/타임아웃 이후 끝난 크롤링의 예외가 "never retrieved" 로그로 남지 않도록 소비
+    if not future.cancelled():
+        future.exception()
+
+
+_crawl_executor_instance = None
+
+
+def get_crawl_executor() -> CrawlExecutor:
+    global _crawl_executor_instance
+    if _crawl_executor_instance is None:
+        _crawl_executor_instance = CrawlExecutor(
+            max_concurrency=crawler_config.CRAWL_MAX_CONCURRENCY,
+            timeout=crawler_config.CRAWL_TIMEOUT_SECONDS,
+        )
+    return _crawl_executor_instance
+
+
+def shutdown_crawl_executor() -> None:
+    global _crawl_executor_instance
+    if _crawl_executor_instance is not None:
+        _crawl_executor_instance.shutdown()
+        _crawl_executor_instance = None
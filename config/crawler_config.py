@@ -0,0 +1,50 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+# WebDriver 풀 설정 (크롤러 공용)
+WEBDRIVER_POOL_MAX_SIZE = int(os.getenv("WEBDRIVER_POOL_MAX_SIZE", "2"))
+WEBDRIVER_POOL_MAX_USES = int(os.getenv("WEBDRIVER_POOL_MAX_USES", "20"))
+WEBDRIVER_POOL_WARM_SIZE = int(os.getenv("WEBDRIVER_POOL_WARM_SIZE", "0"))
+WEBDRIVER_POOL_ACQUIRE_TIMEOUT = float(os.getenv("WEBDRIVER_POOL_ACQUIRE_TIMEOUT", "60"))
+
+# 크롤링 실행기 설정 (이벤트 루프 밖 전용 스레드 풀)
+CRAWL_MAX_CONCURRENCY = int(os.getenv("CRAWL_MAX_CONCURRENCY", str(WEBDRIVER_POOL_MAX_SIZE)))
+CRAWL_TIMEOUT_SECONDS = float(os.getenv("CRAWL_TIMEOUT_SECONDS", "120"))
+
+# 페이지 대기 전략: "condition"(DOM 상태 기반) | "sleep"(기존 고정 sleep, 비교 측정용)
+CRAWL_WAIT_STRATEGY = os.getenv("CRAWL_WAIT_STRATEGY", "condition").strip().lower()
+CRAWL_WAIT_TIMEOUT = float(os.getenv("CRAWL_WAIT_TIMEOUT", "10"))
+
+# 리뷰 수집 백엔드: "selenium" | "http" (http 실패 시 selenium 으로 폴백)
+REVIEW_CRAWLER_BACKEND = os.getenv("REVIEW_CRAWLER_BACKEND", "selenium").strip().lower()
+NAVER_REVIEW_API_BASE = os.getenv("NAVER_REVIEW_API_BASE", "https://smartstore.naver.com").rstrip("/")
+NAVER_REVIEW_HTTP_CONCURRENCY = int(os.getenv("NAVER_REVIEW_HTTP_CONCURRENCY", "4"))
+NAVER_REVIEW_HTTP_TIMEOUT = float(os.getenv("NAVER_REVIEW_HTTP_TIMEOUT", "10"))
+NAVER_REVIEW_PAGE_SIZE = int(os.getenv("NAVER_REVIEW_PAGE_SIZE", "20"))
+
+# 상품당 수집할 최대 리뷰 수 (페이지 수는 여기서 계산)
+REVIEW_CRAWL_MAX_REVIEWS = int(os.getenv("REVIEW_CRAWL_MAX_REVIEWS", "100"))
+
+# 리뷰 HTML 파서 백엔드: "auto"(selectolax → lxml → bs4) | "selectolax" | "lxml" | "bs4"
+REVIEW_HTML_PARSER = os.getenv("REVIEW_HTML_PARSER", "auto").strip().lower()
+
+# 리뷰 HTML 파싱 워커 풀 (브라우저 페이지 이동과 파싱을 겹쳐 실행)
+REVIEW_PARSER_WORKERS = int(os.getenv("REVIEW_PARSER_WORKERS", "2"))
+REVIEW_PARSER_POOL_KIND = os.getenv("REVIEW_PARSER_POOL_KIND", "thread").strip().lower()  # "thread" | "process"
+
+# 크롤링 결과 캐시: "none" | "memory" | "redis"
+CRAWL_CACHE_BACKEND = os.getenv("CRAWL_CACHE_BACKEND", "none").strip().lower()
+CRAWL_CACHE_TTL_SECONDS = int(os.getenv("CRAWL_CACHE_TTL_SECONDS", str(6 * 60 * 60)))
+CRAWL_CACHE_STALE_SECONDS = int(os.getenv("CRAWL_CACHE_STALE_SECONDS", str(24 * 60 * 60)))
+# memory 백엔드에 보관할 최대 상품 수 (초과 시 가장 오래 사용하지 않은 상품부터 제거)
+CRAWL_CACHE_MAX_ENTRIES = int(os.getenv("CRAWL_CACHE_MAX_ENTRIES", "500"))
+
+# 동일 상품 동시 요청 합치기(single-flight): "memory"(프로세스 내) | "redis"(워커 간 Redis 락 포함)
+COALESCE_BACKEND = os.getenv("COALESCE_BACKEND", "memory").strip().lower()
+COALESCE_LOCK_TTL_SECONDS = float(os.getenv("COALESCE_LOCK_TTL_SECONDS", "300"))
+COALESCE_RESULT_TTL_SECONDS = int(os.getenv("COALESCE_RESULT_TTL_SECONDS", "60"))
+COALESCE_WAIT_TIMEOUT_SECONDS = float(os.getenv("COALESCE_WAIT_TIMEOUT_SECONDS", "300"))
+COALESCE_POLL_INTERVAL_SECONDS = float(os.getenv("COALESCE_POLL_INTERVAL_SECONDS", "0.5"))
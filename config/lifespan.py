@@ -0,0 +1,44 @@
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, List, Union
+
+logger = logging.getLogger(__name__)
+
+# 인자 없는 동기/비동기 함수 (예: executor.shutdown, client.aclose)
+LifespanHook = Callable[[], Union[Any, Awaitable[Any]]]
+
+
+class LifespanHooks:
+    """
+    FastAPI lifespan 에서 실행할 모듈별 시작/종료 훅 모음
+    - 각 bootstrap 이 on_startup / on_shutdown 으로 등록하고, app/main.py 의 lifespan 이 실행
+    - 시작/종료 훅 모두 등록 순서대로 실행 (공용 풀처럼 마지막에 정리할 자원은 마지막에 등록)
+    - 종료 훅 하나가 실패해도 나머지는 계속 실행
+    """
+
+    def __init__(self):
+        self._startup: List[LifespanHook] = []
+        self._shutdown: List[LifespanHook] = []
+
+    def on_startup(self, hook: LifespanHook) -> None:
+        self._startup.append(hook)
+
+    def on_shutdown(self, hook: LifespanHook) -> None:
+        self._shutdown.append(hook)
+
+    async def startup(self) -> None:
+        for hook in self._startup:
+            await _call(hook)
+
+    async def shutdown(self) -> None:
+        for hook in self._shutdown:
+            try:
+                await _call(hook)
+            except Exception:
+                logger.exception(f"종료 훅 실패: {getattr(hook, '__qualname__', hook)}")
+
+
+async def _call(hook: LifespanHook) -> None:
+    result = hook()
+    if inspect.isawaitable(result):
+        await result
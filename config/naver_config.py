@@ -14,3 +14,21 @@ def validate_naver_config() -> None:
         raise ValueError("NAVER_CLIENT_ID is not set")
     if not NAVER_CLIENT_SECRET:
         raise ValueError("NAVER_CLIENT_SECRET is not set")
+
+# Shopping API HTTP client: keep-alive pool size, retries on 429/5xx (exponential backoff with full jitter)
+NAVER_HTTP_POOL_SIZE = int(os.getenv("NAVER_HTTP_POOL_SIZE", "10"))
+NAVER_HTTP_TIMEOUT = float(os.getenv("NAVER_HTTP_TIMEOUT", "5"))
+NAVER_HTTP_MAX_RETRIES = int(os.getenv("NAVER_HTTP_MAX_RETRIES", "3"))
+NAVER_HTTP_BACKOFF_SECONDS = float(os.getenv("NAVER_HTTP_BACKOFF_SECONDS", "0.3"))
+NAVER_HTTP_BACKOFF_MAX_SECONDS = float(os.getenv("NAVER_HTTP_BACKOFF_MAX_SECONDS", "5"))
+
+# Upper bound on Shopping API pages fetched concurrently for one /naver/products request
+NAVER_SEARCH_MAX_CONCURRENCY = int(os.getenv("NAVER_SEARCH_MAX_CONCURRENCY", "4"))
+
+# Per-query cursor over the filtered SmartStore results: "memory" (in-process LRU) | "redis" (LRU + Redis) | "none"
+NAVER_CURSOR_CACHE_BACKEND = os.getenv("NAVER_CURSOR_CACHE_BACKEND", "memory").strip().lower()
+NAVER_CURSOR_CACHE_MAX_ENTRIES = int(os.getenv("NAVER_CURSOR_CACHE_MAX_ENTRIES", "256"))
+NAVER_CURSOR_CACHE_TTL_SECONDS = int(os.getenv("NAVER_CURSOR_CACHE_TTL_SECONDS", "600"))
+
+# Upstream Shopping API calls one /naver/products request may spend (quota guard)
+NAVER_SEARCH_MAX_UPSTREAM_CALLS = int(os.getenv("NAVER_SEARCH_MAX_UPSTREAM_CALLS", "10"))
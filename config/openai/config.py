@@ -1,6 +1,6 @@
 import os
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 # .env 파일 자동 로딩
 load_dotenv()
@@ -12,3 +12,4 @@ if not OPENAI_API_KEY:
 
 # OpenAI 클라이언트 초기화
 openai_client  = OpenAI(api_key=OPENAI_API_KEY)
+async_openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
@@ -0,0 +1,89 @@
+import asyncio
+import random
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """분당 허용량(per_minute)만큼 채워지는 토큰 버킷. 부족하면 채워질 때까지 (이벤트 루프를 막지 않고) 대기."""
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = per_minute / 60.0
+        self.capacity = capacity or per_minute
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+        self._updated_at = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        # 버킷보다 큰 요청은 버킷 전체를 기다리도록 상한 적용
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.rate_per_second)
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold 에 도달하면 reset_timeout 동안 호출 차단(open)
+    이후 한 번의 시험 호출(half-open)이 성공하면 닫히고, 실패하면 다시 열림
+    """
+
+    def __init__(self, *, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == "open" or (state == "half_open" and self._trial_in_flight):
+            raise CircuitOpenError("circuit is open")
+        if state == "half_open":
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        # 시험 호출이 결과 없이 취소된 경우 다음 호출이 다시 시험할 수 있게 함
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+
+def backoff_delay(attempt: int, *, base: float, cap: float, retry_after: Optional[str] = None) -> float:
+    """Retry-After(초) 가 있으면 따르고, 없으면 full jitter 지수 백오프."""
+    if retry_after:
+        try:
+            return min(max(0.0, float(retry_after)), cap)
+        except ValueError:
+            pass
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
@@ -1,5 +1,6 @@
 import os
 import redis
+import redis.asyncio as redis_async
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -23,3 +24,19 @@ def get_redis() -> redis.Redis:
             decode_responses=True
         )
     return _redis_instance
+
+
+# asyncio 용 Redis 인스턴스 (Singleton)
+_async_redis_instance = None
+
+def get_async_redis() -> redis_async.Redis:
+    global _async_redis_instance
+    if _async_redis_instance is None:
+        _async_redis_instance = redis_async.Redis(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            db=REDIS_DB,
+            password=REDIS_PASSWORD,
+            decode_responses=True
+        )
+    return _async_redis_instance
@@ -0,0 +1,68 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 요약 LLM 클라이언트: "openai" | "fake"(로컬 실행/테스트용 고정 응답 스트리밍)
+REVIEW_LLM_CLIENT = os.getenv("REVIEW_LLM_CLIENT", "openai").strip().lower()
+
+# 리뷰 요약 작업 큐: "memory"(프로세스 내) | "redis"(config.redis_config 공유)
+REVIEW_JOB_BROKER = os.getenv("REVIEW_JOB_BROKER", "memory").strip().lower()
+REVIEW_JOB_WORKERS = int(os.getenv("REVIEW_JOB_WORKERS", "2"))
+REVIEW_JOB_TTL_SECONDS = int(os.getenv("REVIEW_JOB_TTL_SECONDS", str(24 * 60 * 60)))
+# 워커 생존 표시 갱신 간격. 3배 동안 갱신이 없으면 죽은 워커로 보고 처리 중이던 작업을 다른 워커가 되돌림
+REVIEW_JOB_HEARTBEAT_SECONDS = float(os.getenv("REVIEW_JOB_HEARTBEAT_SECONDS", "10"))
+REVIEW_JOB_WEBHOOK_TIMEOUT = float(os.getenv("REVIEW_JOB_WEBHOOK_TIMEOUT", "10"))
+REVIEW_JOB_WEBHOOK_MAX_RETRIES = int(os.getenv("REVIEW_JOB_WEBHOOK_MAX_RETRIES", "3"))
+# 웹훅 허용 호스트(쉼표 구분). 비우면 공인 주소로 해석되는 https 호스트만 허용
+REVIEW_JOB_WEBHOOK_ALLOWED_HOSTS = [
+    host.strip().lower() for host in os.getenv("REVIEW_JOB_WEBHOOK_ALLOWED_HOSTS", "").split(",") if host.strip()
+]
+# SSE 연결 유지용 주석 전송 간격
+REVIEW_JOB_SSE_KEEPALIVE_SECONDS = float(os.getenv("REVIEW_JOB_SSE_KEEPALIVE_SECONDS", "15"))
+
+# LLM 요약 캐시 (모델/프롬프트 버전/상품명/전처리 텍스트 해시 키): "memory"(LRU) | "redis"(LRU + Redis) | "none"
+REVIEW_SUMMARY_CACHE_BACKEND = os.getenv("REVIEW_SUMMARY_CACHE_BACKEND", "memory").strip().lower()
+REVIEW_SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("REVIEW_SUMMARY_CACHE_MAX_ENTRIES", "512"))
+REVIEW_SUMMARY_CACHE_TTL_SECONDS = int(os.getenv("REVIEW_SUMMARY_CACHE_TTL_SECONDS", str(7 * 24 * 60 * 60)))
+REVIEW_SUMMARY_CACHE_LOCAL_TTL_SECONDS = int(os.getenv("REVIEW_SUMMARY_CACHE_LOCAL_TTL_SECONDS", str(60 * 60)))
+
+# 리뷰가 많을 때 map-reduce 요약: 한 번의 LLM 호출에 넣을 리뷰 토큰 상한 / 부분 요약 동시 호출 수
+REVIEW_SUMMARY_CHUNK_TOKENS = int(os.getenv("REVIEW_SUMMARY_CHUNK_TOKENS", "6000"))
+REVIEW_SUMMARY_MAP_CONCURRENCY = int(os.getenv("REVIEW_SUMMARY_MAP_CONCURRENCY", "4"))
+# 요약 전 리뷰 선택: 리뷰 토큰 합이 예산을 넘으면 중요도 순으로 예산 안의 대표 리뷰만 요약에 넣음 (0 이면 전체 사용)
+# 선택 후 토큰 수가 CHUNK_TOKENS 이하면 한 번에, 넘으면 map-reduce 로 요약하므로
+# 기본값은 동시 map 호출 한 차례가 처리하는 양(CHUNK_TOKENS x MAP_CONCURRENCY), CHUNK_TOKENS 보다 작게 주면 CHUNK_TOKENS 로 올림
+# (예산이 CHUNK_TOKENS 보다 작으면 map-reduce 가 쓰이지 않고 리뷰만 더 버려짐)
+_SELECTION_TOKEN_BUDGET = int(os.getenv(
+    "REVIEW_SELECTION_TOKEN_BUDGET",
+    str(REVIEW_SUMMARY_CHUNK_TOKENS * REVIEW_SUMMARY_MAP_CONCURRENCY),
+))
+REVIEW_SELECTION_TOKEN_BUDGET = max(_SELECTION_TOKEN_BUDGET, REVIEW_SUMMARY_CHUNK_TOKENS) if _SELECTION_TOKEN_BUDGET > 0 else 0
+# 요약 JSON 에서 누락/형식 오류 필드만 다시 요청하는 횟수 (0 이면 재요청 없이 빈 값)
+REVIEW_SUMMARY_REPAIR_ATTEMPTS = int(os.getenv("REVIEW_SUMMARY_REPAIR_ATTEMPTS", "1"))
+
+# 리뷰 전처리: 리뷰 수가 임계값 이상이면 프로세스 풀(워커 수, 0 이면 사용 안 함)에 묶음 단위로 분산
+REVIEW_PREPROCESS_WORKERS = int(os.getenv("REVIEW_PREPROCESS_WORKERS", "0"))
+REVIEW_PREPROCESS_PARALLEL_THRESHOLD = int(os.getenv("REVIEW_PREPROCESS_PARALLEL_THRESHOLD", "5000"))
+REVIEW_PREPROCESS_CHUNK_SIZE = int(os.getenv("REVIEW_PREPROCESS_CHUNK_SIZE", "2000"))
+# 근사 중복 리뷰 제거 (MinHash/LSH): 문자 3-gram Jaccard 유사도 임계값, 0 이면 사용 안 함
+REVIEW_NEAR_DUPLICATE_THRESHOLD = float(os.getenv("REVIEW_NEAR_DUPLICATE_THRESHOLD", "0.8"))
+REVIEW_NEAR_DUPLICATE_PERMUTATIONS = int(os.getenv("REVIEW_NEAR_DUPLICATE_PERMUTATIONS", "64"))
+# 스트리밍 전처리에서 중복 확인용으로 기억하는 최근 리뷰 수 (메모리 상한)
+REVIEW_PREPROCESS_DEDUP_MAX_ENTRIES = int(os.getenv("REVIEW_PREPROCESS_DEDUP_MAX_ENTRIES", "50000"))
+
+# LLM 호출 제한: 분당 요청/토큰 버킷, 재시도(지터 백오프, Retry-After 우선), 서킷 브레이커
+LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+LLM_TOKENS_PER_MINUTE = float(os.getenv("LLM_TOKENS_PER_MINUTE", "30000"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "4"))
+LLM_BACKOFF_BASE_SECONDS = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "1"))
+LLM_BACKOFF_MAX_SECONDS = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "30"))
+LLM_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "5"))
+LLM_CIRCUIT_RESET_SECONDS = float(os.getenv("LLM_CIRCUIT_RESET_SECONDS", "30"))
+
+# 배치 요약 (/review/batches): "openai"(Batch API, 24시간 완료 창) | "fake"(로컬 테스트용 즉시 완료)
+REVIEW_BATCH_BACKEND = os.getenv("REVIEW_BATCH_BACKEND", "openai").strip().lower()
+REVIEW_BATCH_POLL_SECONDS = float(os.getenv("REVIEW_BATCH_POLL_SECONDS", "60"))
+REVIEW_BATCH_PREPARE_CONCURRENCY = int(os.getenv("REVIEW_BATCH_PREPARE_CONCURRENCY", "2"))
+REVIEW_BATCH_MAX_PRODUCTS = int(os.getenv("REVIEW_BATCH_MAX_PRODUCTS", "500"))
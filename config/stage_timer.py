@@ -0,0 +1,37 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Mapping
+
+
+def format_server_timing(durations: Mapping[str, float]) -> str:
+    """단계별 소요 시간(초)을 Server-Timing 헤더 값으로 변환 (dur 단위: ms)."""
+    return ", ".join(f"{name};dur={elapsed * 1000:.1f}" for name, elapsed in durations.items())
+
+
+class StageTimer:
+    """단계별 소요 시간(wall-clock)을 기록하는 타이머."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.durations: Dict[str, float] = {}
+        self._started_at = time.perf_counter()
+
+    @contextmanager
+    def stage(self, stage_name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started_at
+            self.durations[stage_name] = self.durations.get(stage_name, 0.0) + elapsed
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self._started_at
+
+    def summary(self) -> str:
+        stages = " ".join(f"{name}={elapsed:.3f}s" for name, elapsed in self.durations.items())
+        return f"[{self.name}] total={self.total:.3f}s {stages}".rstrip()
+
+    def server_timing(self) -> str:
+        return format_server_timing({**self.durations, "total": self.total})
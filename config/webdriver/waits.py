@@ -0,0 +1,76 @@
+import logging
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config import crawler_config
+
+logger = logging.getLogger(__name__)
+
+_SIGNATURE_SCRIPT = """
+const items = document.querySelectorAll(arguments[0]);
+if (!items.length) { return ""; }
+return items.length + "|" + items[0].innerText.slice(0, 200) + "|" + items[items.length - 1].innerText.slice(0, 200);
+"""
+
+
+def _uses_fixed_sleep() -> bool:
+    return crawler_config.CRAWL_WAIT_STRATEGY == "sleep"
+
+
+def content_signature(driver: WebDriver, css_selector: str) -> str:
+    """목록 개수 + 첫/마지막 항목 텍스트로 현재 목록 상태를 식별한다."""
+    return driver.execute_script(_SIGNATURE_SCRIPT, css_selector) or ""
+
+
+def wait_after_load(driver: WebDriver, ready_selector: str, *, legacy_sleep: float) -> None:
+    """driver.get 이후 문서 로드 완료 + ready_selector 요소 등장까지 대기."""
+    if _uses_fixed_sleep():
+        time.sleep(legacy_sleep)
+        return
+
+    wait = WebDriverWait(driver, crawler_config.CRAWL_WAIT_TIMEOUT)
+    try:
+        wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ready_selector)))
+    except TimeoutException:
+        # 이후 단계의 명시적 대기에서 실패를 판단하도록 여기서는 경고만 남김
+        logger.warning(f"페이지 로드 대기 시간 초과: {ready_selector}")
+
+
+def wait_for_content(driver: WebDriver, content_selector: str, *, legacy_sleep: float) -> None:
+    """클릭 이후 content_selector 목록이 나타날 때까지 대기."""
+    if _uses_fixed_sleep():
+        time.sleep(legacy_sleep)
+        return
+
+    try:
+        WebDriverWait(driver, crawler_config.CRAWL_WAIT_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, content_selector))
+        )
+    except TimeoutException:
+        logger.warning(f"목록 표시 대기 시간 초과: {content_selector}")
+
+
+def wait_for_content_change(
+        driver: WebDriver,
+        content_selector: str,
+        previous_signature: str,
+        *,
+        legacy_sleep: float,
+) -> None:
+    """페이지네이션 클릭 이후 목록 내용이 이전 상태와 달라질 때까지 대기."""
+    if _uses_fixed_sleep():
+        time.sleep(legacy_sleep)
+        return
+
+    try:
+        WebDriverWait(driver, crawler_config.CRAWL_WAIT_TIMEOUT).until(
+            lambda d: content_signature(d, content_selector) not in ("", previous_signature)
+        )
+    except TimeoutException:
+        logger.warning(f"목록 변경 대기 시간 초과: {content_selector}")
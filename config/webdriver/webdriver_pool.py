@@ -0,0 +1,241 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from webdriver_manager.chrome import ChromeDriverManager
+
+from config import crawler_config
+
+logger = logging.getLogger(__name__)
+
+
+class WebDriverPoolExhaustedError(Exception):
+    pass
+
+
+@lru_cache(maxsize=1)
+def get_chromedriver_path() -> str:
+    """ChromeDriverManager().install() 결과를 프로세스 단위로 재사용한다."""
+    return ChromeDriverManager().install()
+
+
+class _PooledDriver:
+    __slots__ = ("driver", "uses")
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.uses = 0
+
+
+class WebDriverPool:
+    """
+    Chrome 세션을 재사용하는 bounded WebDriver 풀
+    - 최대 max_size 개의 브라우저만 유지하고, 초과 요청은 acquire_timeout 동안 대기
+    - 대여 전 헬스 체크, 반납 시 세션 초기화(쿠키 삭제 + about:blank)
+    - max_uses 회 사용했거나 세션이 깨진 브라우저는 폐기 후 새로 생성
+    """
+
+    def __init__(
+            self,
+            driver_factory: Callable[[], WebDriver],
+            *,
+            max_size: int,
+            max_uses: int,
+            acquire_timeout: float,
+            name: str = "webdriver",
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+
+        self.name = name
+        self.max_size = max_size
+        self.max_uses = max(1, max_uses)
+        self.acquire_timeout = acquire_timeout
+        self._factory = driver_factory
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        # idle 반납 / 폐기로 자리가 날 때 알림 (warm-up 중인 브라우저까지 max_size 에 포함)
+        self._available = threading.Condition(self._lock)
+        self._idle: List[_PooledDriver] = []
+        self._live_count = 0
+        self._closed = False
+
+    @contextmanager
+    def lease(self) -> Iterator[WebDriver]:
+        pooled = self._acquire()
+        try:
+            yield pooled.driver
+        finally:
+            self._release(pooled)
+
+    def warm_up(self, count: int) -> None:
+        """요청 전에 브라우저를 미리 띄워 idle 목록에 채워둔다."""
+        for _ in range(min(count, self.max_size)):
+            with self._lock:
+                if self._closed or self._live_count >= self.max_size:
+                    return
+                self._live_count += 1
+            try:
+                driver = self._factory()
+            except Exception as exc:
+                with self._lock:
+                    self._live_count -= 1
+                    self._available.notify()
+                logger.warning(f"[{self.name}] warm-up 실패: {exc}")
+                return
+            with self._lock:
+                self._idle.append(_PooledDriver(driver))
+                self._available.notify()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._available.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "live": self._live_count,
+                "idle": len(self._idle),
+            }
+
+    def _acquire(self) -> _PooledDriver:
+        if self._closed:
+            raise WebDriverPoolExhaustedError(f"{self.name} pool is closed")
+
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise WebDriverPoolExhaustedError(
+                f"{self.name} pool exhausted (max_size={self.max_size})"
+            )
+
+        try:
+            while True:
+                pooled = self._take_or_reserve()
+                if pooled is None:
+                    return self._create()
+
+                if self._is_healthy(pooled):
+                    return pooled
+
+                logger.info(f"[{self.name}] 비정상 세션 폐기 후 재시도")
+                self._discard(pooled)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _take_or_reserve(self) -> Optional[_PooledDriver]:
+        """
+        idle 브라우저가 있으면 꺼내고, 없으면 max_size 미만일 때만 새로 만들 자리를 예약(None 반환)
+        warm-up 중인 브라우저로 max_size 가 차 있으면 idle 로 들어오거나 자리가 날 때까지 대기
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._available:
+            while True:
+                if self._closed:
+                    raise WebDriverPoolExhaustedError(f"{self.name} pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._live_count < self.max_size:
+                    self._live_count += 1
+                    return None
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._available.wait(timeout=remaining):
+                    if self._idle or self._live_count < self.max_size:
+                        continue
+                    raise WebDriverPoolExhaustedError(
+                        f"{self.name} pool exhausted (max_size={self.max_size})"
+                    )
+
+    def _release(self, pooled: _PooledDriver) -> None:
+        try:
+            pooled.uses += 1
+            if self._closed or pooled.uses >= self.max_uses or not self._reset(pooled):
+                self._discard(pooled)
+                return
+
+            with self._lock:
+                self._idle.append(pooled)
+                self._available.notify()
+        finally:
+            self._slots.release()
+
+    def _create(self) -> _PooledDriver:
+        try:
+            return _PooledDriver(self._factory())
+        except BaseException:
+            with self._lock:
+                self._live_count -= 1
+                self._available.notify()
+            raise
+
+    def _discard(self, pooled: _PooledDriver) -> None:
+        with self._lock:
+            self._live_count -= 1
+            self._available.notify()
+        try:
+            pooled.driver.quit()
+        except WebDriverException as exc:
+            logger.debug(f"[{self.name}] driver.quit 실패: {exc}")
+
+    @staticmethod
+    def _is_healthy(pooled: _PooledDriver) -> bool:
+        try:
+            _ = pooled.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _reset(pooled: _PooledDriver) -> bool:
+        try:
+            pooled.driver.delete_all_cookies()
+            pooled.driver.get("about:blank")
+            return True
+        except WebDriverException:
+            return False
+
+
+_pools: Dict[str, WebDriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_webdriver_pool(name: str, driver_factory: Callable[[], WebDriver]) -> WebDriverPool:
+    """이름별 WebDriver 풀 (Singleton). 최초 생성 시 설정값만큼 백그라운드 warm-up."""
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = WebDriverPool(
+                driver_factory,
+                max_size=crawler_config.WEBDRIVER_POOL_MAX_SIZE,
+                max_uses=crawler_config.WEBDRIVER_POOL_MAX_USES,
+                acquire_timeout=crawler_config.WEBDRIVER_POOL_ACQUIRE_TIMEOUT,
+                name=name,
+            )
+            _pools[name] = pool
+
+            if crawler_config.WEBDRIVER_POOL_WARM_SIZE > 0:
+                threading.Thread(
+                    target=pool.warm_up,
+                    args=(crawler_config.WEBDRIVER_POOL_WARM_SIZE,),
+                    name=f"{name}-warm-up",
+                    daemon=True,
+                ).start()
+    return pool
+
+
+def shutdown_webdriver_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -12,14 +12,14 @@ def get_naver_usecase() -> NaverSearchUseCase:
 
 
 @naver_router.get("/products")
-def search_products(
+async def search_products(
     query: str,
     start: int = 1,
     display: int = 10,
     usecase: NaverSearchUseCase = Depends(get_naver_usecase),
 ):
     try:
-        products = usecase.search_products(
+        page = await usecase.search_products_async(
             query=query,
             start=start,
             display=display,
@@ -37,6 +37,9 @@ def search_products(
                 "price": product.price,
                 "info_url": product.info_url,
             }
-            for product in products
-        ]
+            for product in page.items
+        ],
+        "has_more": page.has_more,
+        "upstream_calls": page.upstream_calls,
+        "upstream_range": {"start": page.raw_start, "end": page.raw_end},
     }
@@ -1,15 +1,22 @@
+import asyncio
 import html
+import random
 import re
+import time
+from threading import Lock
 from urllib.parse import urlparse
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 
 from config import naver_config
 from naver.application.port.naver_search_port import NaverSearchPort
 from naver.domain.product import Product
 
 SHOP_SEARCH_PATH = "/v1/search/shop.json"
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 _TAG_RE = re.compile(r"<.*?>")
 
 
@@ -17,34 +24,18 @@ class NaverApiError(Exception):
     pass
 
 
-def _request_search_products(query: str, start: int = 1, display: int = 10) -> Dict[str, Any]:
-    naver_config.validate_naver_config()
-
-    url = f"{naver_config.NAVER_API_BASE}{SHOP_SEARCH_PATH}"
-    headers = {
-        "X-Naver-Client-Id": naver_config.NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": naver_config.NAVER_CLIENT_SECRET,
-    }
-    params = {
-        "query": query,
-        "start": start,
-        "display": display,
-    }
-
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=5)
-    except requests.RequestException as exc:
-        raise NaverApiError(f"Naver API request failed: {exc}") from exc
-
-    if response.status_code != 200:
-        raise NaverApiError(
-            f"Naver API returned {response.status_code}: {response.text}"
-        )
-
-    try:
-        return response.json()
-    except ValueError as exc:
-        raise NaverApiError("Failed to decode Naver API response as JSON") from exc
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Honor Retry-After when present, otherwise exponential backoff with full jitter."""
+    if retry_after:
+        try:
+            return min(float(retry_after), naver_config.NAVER_HTTP_BACKOFF_MAX_SECONDS)
+        except ValueError:
+            pass
+    ceiling = min(
+        naver_config.NAVER_HTTP_BACKOFF_MAX_SECONDS,
+        naver_config.NAVER_HTTP_BACKOFF_SECONDS * (2 ** attempt),
+    )
+    return random.uniform(0, ceiling)
 
 
 def _clean_title(title: str) -> str:
@@ -65,8 +56,107 @@ def _normalize_smartstore_url(url: str) -> str:
     return f"https://smartstore.naver.com{path}{query}"
 
 
+def _to_products(payload: Any) -> List[Product]:
+    items = payload.get("items", []) if isinstance(payload, dict) else []
+
+    products: List[Product] = []
+    for item in items:
+        price_str = item.get("lprice") or item.get("hprice") or "0"
+        try:
+            price = int(price_str)
+        except (TypeError, ValueError):
+            price = 0
+
+        products.append(
+            Product(
+                name=_clean_title(item.get("title", "")),
+                thumbnail_url=item.get("image", ""),
+                price=price,
+                info_url=_normalize_smartstore_url(item.get("link", "")),
+            )
+        )
+
+    return products
+
+
 class NaverSearchApiAdapter(NaverSearchPort):
-    """Outbound adapter: call Naver Shopping API and map to domain products."""
+    """Outbound adapter: call Naver Shopping API and map to domain products.
+
+    Requests share one keep-alive connection pool (a requests.Session for the
+    sync path, an httpx.AsyncClient for the async path), and 429/5xx responses
+    are retried with jittered backoff before surfacing as NaverApiError.
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        async_client: Optional[httpx.AsyncClient] = None,
+        *,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ):
+        self._pool_size = pool_size or naver_config.NAVER_HTTP_POOL_SIZE
+        self._timeout = timeout or naver_config.NAVER_HTTP_TIMEOUT
+        self._max_retries = naver_config.NAVER_HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self._url = f"{naver_config.NAVER_API_BASE}{SHOP_SEARCH_PATH}"
+        self._headers: Optional[Dict[str, str]] = None
+        self._headers_lock = Lock()
+
+        if session is None:
+            session = requests.Session()
+            pooled = HTTPAdapter(pool_connections=self._pool_size, pool_maxsize=self._pool_size)
+            session.mount("https://", pooled)
+            session.mount("http://", pooled)
+        self._session = session
+        self._async_client = async_client
+
+    def _auth_headers(self) -> Dict[str, str]:
+        # Validate credentials once; a missing key keeps raising ValueError until it is configured
+        if self._headers is None:
+            with self._headers_lock:
+                if self._headers is None:
+                    naver_config.validate_naver_config()
+                    self._headers = {
+                        "X-Naver-Client-Id": naver_config.NAVER_CLIENT_ID,
+                        "X-Naver-Client-Secret": naver_config.NAVER_CLIENT_SECRET,
+                    }
+        return self._headers
+
+    def _request_search_products(self, query: str, start: int = 1, display: int = 10) -> Dict[str, Any]:
+        headers = self._auth_headers()
+        params = {
+            "query": query,
+            "start": start,
+            "display": display,
+        }
+
+        attempt = 0
+        while True:
+            try:
+                response = self._session.get(self._url, headers=headers, params=params, timeout=self._timeout)
+            except requests.RequestException as exc:
+                if attempt >= self._max_retries:
+                    raise NaverApiError(f"Naver API request failed: {exc}") from exc
+                time.sleep(_retry_delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < self._max_retries:
+                time.sleep(_retry_delay(attempt, response.headers.get("Retry-After")))
+                attempt += 1
+                continue
+            break
+
+        if response.status_code != 200:
+            raise NaverApiError(
+                f"Naver API returned {response.status_code}: {response.text}"
+            )
+
+        try:
+            return response.json()
+        except ValueError as exc:
+            raise NaverApiError("Failed to decode Naver API response as JSON") from exc
 
     def search_products(
         self,
@@ -74,25 +164,68 @@ class NaverSearchApiAdapter(NaverSearchPort):
         start: int = 1,
         display: int = 10,
     ) -> List[Product]:
-        payload = _request_search_products(query=query, start=start, display=display)
+        payload = self._request_search_products(query=query, start=start, display=display)
+        return _to_products(payload)
 
-        items = payload.get("items", []) if isinstance(payload, dict) else []
-
-        products: List[Product] = []
-        for item in items:
-            price_str = item.get("lprice") or item.get("hprice") or "0"
+    async def search_products_async(
+        self,
+        query: str,
+        start: int = 1,
+        display: int = 10,
+    ) -> List[Product]:
+        payload = await self._request_search_products_async(query=query, start=start, display=display)
+        return _to_products(payload)
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=self._pool_size,
+                    max_keepalive_connections=self._pool_size,
+                ),
+            )
+        return self._async_client
+
+    async def _request_search_products_async(self, query: str, start: int = 1, display: int = 10) -> Dict[str, Any]:
+        headers = self._auth_headers()
+        params = {
+            "query": query,
+            "start": start,
+            "display": display,
+        }
+        client = self._get_async_client()
+
+        attempt = 0
+        while True:
             try:
-                price = int(price_str)
-            except (TypeError, ValueError):
-                price = 0
-
-            products.append(
-                Product(
-                    name=_clean_title(item.get("title", "")),
-                    thumbnail_url=item.get("image", ""),
-                    price=price,
-                    info_url=_normalize_smartstore_url(item.get("link", "")),
-                )
+                response = await client.get(self._url, headers=headers, params=params)
+            except httpx.HTTPError as exc:
+                if attempt >= self._max_retries:
+                    raise NaverApiError(f"Naver API request failed: {exc}") from exc
+                await asyncio.sleep(_retry_delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < self._max_retries:
+                await asyncio.sleep(_retry_delay(attempt, response.headers.get("Retry-After")))
+                attempt += 1
+                continue
+            break
+
+        if response.status_code != 200:
+            raise NaverApiError(
+                f"Naver API returned {response.status_code}: {response.text}"
             )
 
-        return products
+        try:
+            return response.json()
+        except ValueError as exc:
+            raise NaverApiError("Failed to decode Naver API response as JSON") from exc
+
+    def close(self) -> None:
+        self._session.close()
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
@@ -14,3 +14,13 @@ class NaverSearchPort(ABC):
     ) -> List[Product]:
         """Search products by keyword using Naver Shopping API."""
         raise NotImplementedError
+
+    @abstractmethod
+    async def search_products_async(
+        self,
+        query: str,
+        start: int = 1,
+        display: int = 10,
+    ) -> List[Product]:
+        """Async variant of search_products, used for concurrent page fan-out."""
+        raise NotImplementedError
@@ -1,55 +1,205 @@
-from typing import List
+import asyncio
+import math
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
 from naver.application.port.naver_search_port import NaverSearchPort
 from naver.domain.product import Product
+from naver.domain.search_cursor import SearchCursor
+from naver.domain.search_page import SearchPage
+from naver.infrastructure.cache.search_cursor_cache import SearchCursorCache
+
+SMARTSTORE_DOMAIN = "smartstore.naver.com"
+MAX_API_START = 1000  # Naver Shopping API supports start up to 1000
+MAX_API_DISPLAY = 100  # Naver API limit is 100
+# Share of raw results assumed to be SmartStore links until the first page tells us otherwise
+INITIAL_SMARTSTORE_RATIO = 0.5
+MIN_SMARTSTORE_RATIO = 0.05
+
+
+def _is_smartstore(product: Product) -> bool:
+    return SMARTSTORE_DOMAIN in (product.info_url or "")
+
+
+def _consume_page(cursor: SearchCursor, api_start: int, products: List[Product], page_size: int) -> int:
+    """Append the SmartStore items of one upstream page to the cursor; return how many were kept."""
+    cursor.next_start = api_start + page_size
+    kept = 0
+    for position, product in enumerate(products, start=api_start):
+        if _is_smartstore(product):
+            cursor.products.append(product)
+            cursor.raw_positions.append(position)
+            kept += 1
+
+    # An empty or short page means the upstream has no more results after it
+    if len(products) < page_size or cursor.next_start > MAX_API_START:
+        cursor.exhausted = True
+    return kept
+
+
+def _to_page(cursor: SearchCursor, safe_start: int, target: int, upstream_calls: int) -> SearchPage:
+    items = cursor.products[safe_start - 1:target]
+    return SearchPage(
+        items=items,
+        upstream_calls=upstream_calls,
+        has_more=not cursor.exhausted or len(cursor.products) > target,
+        raw_start=cursor.raw_offset(safe_start) if items else None,
+        raw_end=cursor.raw_offset(safe_start + len(items) - 1) if items else None,
+    )
 
 
 class NaverSearchUseCase:
-    def __init__(self, repository: NaverSearchPort):
-        self.repository = repository
+    """SmartStore-only search over the Naver Shopping API.
 
-    def search_products(
+    start/display address the *filtered* SmartStore list, which only exists from upstream
+    offset 1 onward, so collection always begins there and the filtered window is
+    translated back to upstream offsets via SearchCursor.raw_positions. Each request may
+    spend at most max_upstream_calls upstream calls; when the budget runs out the
+    (possibly short) window collected so far is returned with has_more set.
+    """
+
+    def __init__(
         self,
-        query: str,
-        start: int = 1,
-        display: int = 10,
-    ) -> List[Product]:
+        repository: NaverSearchPort,
+        max_concurrency: int = 4,
+        cursor_cache: Optional[SearchCursorCache] = None,
+        max_upstream_calls: int = 10,
+    ):
+        self.repository = repository
+        self.max_concurrency = max(1, max_concurrency)
+        self.cursor_cache = cursor_cache
+        self.max_upstream_calls = max(1, max_upstream_calls)
+
+    @staticmethod
+    def _normalize_request(query: str, start: int, display: int) -> Tuple[str, int, int]:
         if not query or not query.strip():
             raise ValueError("query is required")
 
         safe_start = max(1, start)
-        safe_display = min(max(1, display), 100)  # Naver API limit is 100
+        safe_display = min(max(1, display), MAX_API_DISPLAY)
+        return query.strip(), safe_start, safe_display
 
-        search_query = query.strip()
-        # Accumulate results until we have enough SmartStore items (or we run out)
-        collected: List[Product] = []
-        api_start = safe_start
-        # Ask for a slightly larger page to improve chances of filling the target count
-        page_size = min(max(safe_display * 2, safe_display), 100)
-        max_api_start = 1000  # Naver Shopping API supports start up to 1000
+    @staticmethod
+    def _page_size(cursor: SearchCursor, target: int) -> int:
+        # Upstream quota is per call, so ask for as much as the remaining window is likely to need
+        missing = max(1, target - len(cursor.products))
+        return min(MAX_API_DISPLAY, max(missing * 2, math.ceil(missing / INITIAL_SMARTSTORE_RATIO)))
 
-        while len(collected) < safe_start + safe_display - 1 and api_start <= max_api_start:
+    def search_products(
+        self,
+        query: str,
+        start: int = 1,
+        display: int = 10,
+    ) -> SearchPage:
+        """Sequential variant without the cursor cache; same window semantics and budget."""
+        search_query, safe_start, safe_display = self._normalize_request(query, start, display)
+        target = safe_start + safe_display - 1
+
+        cursor = SearchCursor()
+        page_size = self._page_size(cursor, target)
+        upstream_calls = 0
+        while len(cursor.products) < target and not cursor.exhausted and upstream_calls < self.max_upstream_calls:
+            api_start = cursor.next_start
             products = self.repository.search_products(
                 query=search_query,
                 start=api_start,
                 display=page_size,
             )
+            upstream_calls += 1
+            _consume_page(cursor, api_start, products, page_size)
+
+        return _to_page(cursor, safe_start, target, upstream_calls)
+
+    async def search_products_async(
+        self,
+        query: str,
+        start: int = 1,
+        display: int = 10,
+    ) -> SearchPage:
+        """Return the start/display window over the query's SmartStore results.
+
+        When a cursor cache is configured, later (deeper) pages resume from the cached
+        cursor's next upstream offset instead of refetching and refiltering the prefix.
+        """
+        search_query, safe_start, safe_display = self._normalize_request(query, start, display)
+        target = safe_start + safe_display - 1
+
+        if self.cursor_cache is None:
+            cursor = SearchCursor()
+            upstream_calls = await self._extend_cursor(search_query, cursor, target)
+            return _to_page(cursor, safe_start, target, upstream_calls)
+
+        cached = await self.cursor_cache.get(search_query)
+        if cached is not None and (cached.exhausted or len(cached.products) >= target):
+            return _to_page(cached, safe_start, target, upstream_calls=0)
+
+        # One extension per query at a time; otherwise the last writer would drop the other's pages
+        async with self.cursor_cache.lock(search_query):
+            cached = await self.cursor_cache.get(search_query)
+            if cached is not None and (cached.exhausted or len(cached.products) >= target):
+                return _to_page(cached, safe_start, target, upstream_calls=0)
+
+            cursor = SearchCursor()
+            if cached is not None:
+                # Copy so concurrent readers never see a half-extended cursor
+                cursor = SearchCursor(
+                    products=list(cached.products),
+                    raw_positions=list(cached.raw_positions),
+                    next_start=cached.next_start,
+                )
+
+            upstream_calls = await self._extend_cursor(search_query, cursor, target)
+            await self.cursor_cache.store(search_query, cursor)
+        return _to_page(cursor, safe_start, target, upstream_calls)
+
+    async def _extend_cursor(self, search_query: str, cursor: SearchCursor, target: int) -> int:
+        """Fetch pages after cursor.next_start until the cursor holds target items; return calls spent.
 
-            if not products:
-                break
+        Pages are requested through a sliding window sized from the SmartStore ratio observed
+        so far (capped by max_concurrency and the remaining call budget) and merged in page
+        order. Once enough items are collected, or the upstream runs dry, the requests still
+        in flight are cancelled.
+        """
+        page_size = self._page_size(cursor, target)
+        api_starts = iter(range(cursor.next_start, MAX_API_START + 1, page_size))
+        upstream_calls = 0
+        raw_seen = 0
+        found = 0
+        pending: Deque[Tuple[int, asyncio.Task]] = deque()
+        try:
+            while len(cursor.products) < target and not cursor.exhausted:
+                ratio = found / raw_seen if raw_seen else INITIAL_SMARTSTORE_RATIO
+                missing = target - len(cursor.products)
+                pages_needed = math.ceil(missing / (max(ratio, MIN_SMARTSTORE_RATIO) * page_size))
+                window = min(self.max_concurrency, max(1, pages_needed))
 
-            products = [
-                product
-                for product in products
-                if "smartstore.naver.com" in (product.info_url or "")
-            ]
+                while len(pending) < window and upstream_calls < self.max_upstream_calls:
+                    api_start = next(api_starts, None)
+                    if api_start is None:
+                        break
+                    pending.append((api_start, asyncio.create_task(
+                        self.repository.search_products_async(
+                            query=search_query,
+                            start=api_start,
+                            display=page_size,
+                        )
+                    )))
+                    upstream_calls += 1
 
-            collected.extend(products)
+                if not pending:
+                    # Either the call budget is spent or MAX_API_START was reached
+                    if cursor.next_start > MAX_API_START:
+                        cursor.exhausted = True
+                    break
 
-            # Move the API start forward by the page_size to avoid requesting the same slice
-            api_start += page_size
+                api_start, task = pending.popleft()
+                products = await task
+                raw_seen += len(products)
+                found += _consume_page(cursor, api_start, products, page_size)
+        finally:
+            for _, task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
 
-        # Apply user-facing start/display over the filtered list
-        start_index = safe_start - 1
-        end_index = start_index + safe_display
-        return collected[start_index:end_index]
+        return upstream_calls
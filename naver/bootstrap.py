@@ -1,14 +1,25 @@
 from fastapi import FastAPI
 
+from config import naver_config
+from config.lifespan import LifespanHooks
 from naver.adapter.input.naver_router import get_naver_usecase, naver_router
 from naver.adapter.output.naver_api_adapter import NaverSearchApiAdapter
 from naver.application.usecase.naver_search_usecase import NaverSearchUseCase
+from naver.infrastructure.cache.search_cursor_cache import build_search_cursor_cache
 
 
-def setup_module(app: FastAPI) -> None:
+def setup_module(app: FastAPI, lifespan: LifespanHooks) -> None:
     """Wire Naver module into the FastAPI app."""
     search_adapter = NaverSearchApiAdapter()
-    naver_usecase = NaverSearchUseCase(repository=search_adapter)
+    naver_usecase = NaverSearchUseCase(
+        repository=search_adapter,
+        max_concurrency=naver_config.NAVER_SEARCH_MAX_CONCURRENCY,
+        cursor_cache=build_search_cursor_cache(),
+        max_upstream_calls=naver_config.NAVER_SEARCH_MAX_UPSTREAM_CALLS,
+    )
 
     app.dependency_overrides[get_naver_usecase] = lambda: naver_usecase
+    # Close the pooled requests.Session and httpx.AsyncClient on shutdown
+    lifespan.on_shutdown(search_adapter.close)
+    lifespan.on_shutdown(search_adapter.aclose)
     app.include_router(naver_router, prefix="/naver")
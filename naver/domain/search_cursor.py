@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from naver.domain.product import Product
+
+
+@dataclass
+class SearchCursor:
+    """Filtered SmartStore products collected so far for one query, and where upstream paging resumes."""
+
+    products: List[Product] = field(default_factory=list)
+    # raw_positions[i] is the 1-based upstream (unfiltered) position of products[i]
+    raw_positions: List[int] = field(default_factory=list)
+    next_start: int = 1
+    exhausted: bool = False
+
+    def raw_offset(self, filtered_offset: int) -> Optional[int]:
+        """Translate a 1-based offset in the filtered list to its upstream offset, if collected."""
+        if 1 <= filtered_offset <= len(self.raw_positions):
+            return self.raw_positions[filtered_offset - 1]
+        return None
@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from naver.domain.product import Product
+
+
+@dataclass
+class SearchPage:
+    """One start/display window of SmartStore results plus what it cost upstream."""
+
+    items: List[Product] = field(default_factory=list)
+    upstream_calls: int = 0
+    has_more: bool = False
+    # Upstream offsets of the first/last returned item (None when the window is empty)
+    raw_start: Optional[int] = None
+    raw_end: Optional[int] = None
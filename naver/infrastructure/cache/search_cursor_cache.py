@@ -0,0 +1,117 @@
+import asyncio
+import json
+import logging
+import re
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import asdict
+from threading import Lock
+from typing import Optional, Tuple
+
+from config import naver_config
+from config.cache.cache_backend import CacheBackend, get_cache_backend
+from naver.domain.product import Product
+from naver.domain.search_cursor import SearchCursor
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class SearchCursorCache:
+    """Per-query SearchCursor store.
+
+    A bounded in-process LRU answers repeat pages for hot queries; when a shared
+    backend (Redis) is configured it is written through and consulted on local
+    misses, so other workers can resume the same cursor. Extensions of one cursor
+    are serialized in-process via lock(), so concurrent deeper pages of the same
+    query do not overwrite each other's progress.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        *,
+        max_entries: int,
+        ttl_seconds: int,
+    ):
+        self._backend = backend
+        self._max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[SearchCursor, float]]" = OrderedDict()
+        self._lock = Lock()
+        # Dropped automatically once no request holds or waits on the key's lock
+        self._extend_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    @staticmethod
+    def key(query: str) -> str:
+        return f"naver:search-cursor:{_WHITESPACE_RE.sub(' ', query.strip()).lower()}"
+
+    def lock(self, query: str) -> asyncio.Lock:
+        """Lock guarding read-extend-store of one query's cursor."""
+        key = self.key(query)
+        with self._lock:
+            lock = self._extend_locks.get(key)
+            if lock is None:
+                lock = asyncio.Lock()
+                self._extend_locks[key] = lock
+            return lock
+
+    async def get(self, query: str) -> Optional[SearchCursor]:
+        key = self.key(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                cursor, expires_at = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return cursor
+                del self._entries[key]
+
+        if self._backend is None:
+            return None
+
+        raw = await self._backend.get(key)
+        if raw is None:
+            return None
+        try:
+            payload = json.loads(raw)
+            cursor = SearchCursor(
+                products=[Product(**product) for product in payload["products"]],
+                raw_positions=[int(position) for position in payload["raw_positions"]],
+                next_start=int(payload["next_start"]),
+                exhausted=bool(payload["exhausted"]),
+            )
+        except (ValueError, KeyError, TypeError) as exc:
+            logger.warning(f"Discarding unreadable search cursor {key}: {exc}")
+            return None
+
+        self._remember(key, cursor)
+        return cursor
+
+    async def store(self, query: str, cursor: SearchCursor) -> None:
+        key = self.key(query)
+        self._remember(key, cursor)
+        if self._backend is not None:
+            await self._backend.set(key, json.dumps(asdict(cursor), ensure_ascii=False), self.ttl_seconds)
+
+    def _remember(self, key: str, cursor: SearchCursor) -> None:
+        with self._lock:
+            self._entries[key] = (cursor, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+def build_search_cursor_cache() -> Optional[SearchCursorCache]:
+    """Cursor cache per NAVER_CURSOR_CACHE_BACKEND; None when disabled."""
+    kind = naver_config.NAVER_CURSOR_CACHE_BACKEND
+    if kind == "none":
+        return None
+
+    return SearchCursorCache(
+        get_cache_backend(kind) if kind == "redis" else None,
+        max_entries=naver_config.NAVER_CURSOR_CACHE_MAX_ENTRIES,
+        ttl_seconds=naver_config.NAVER_CURSOR_CACHE_TTL_SECONDS,
+    )
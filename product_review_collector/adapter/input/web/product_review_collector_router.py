@@ -1,39 +1,92 @@
-from fastapi import APIRouter, HTTPException
+import json
+import logging
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from config.crawl_executor import CrawlCancelledError, CrawlTimeoutError
 from product_review_collector.adapter.input.web.request.collect_reviews_request import (
     CollectReviewsRequest,
 )
-from product_review_collector.adapter.output.naver_crawler_adapter import (
-    NaverCrawlerAdapter,
-)
 from product_review_collector.application.usecase.collect_reviews_usecase import (
     CollectReviewsUseCase,
 )
+from product_review_collector.domain.product_review import ProductReview
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["product_review_collector"])
-usecase = CollectReviewsUseCase(NaverCrawlerAdapter())
+
+
+def _to_item(review: ProductReview) -> dict:
+    return {
+        "id": review.id,
+        "content": review.content,
+        "rating": review.grade,
+        "writer": review.review_writer,
+        "created_at": review.created_at.date().isoformat() if review.created_at else None,
+    }
+
+
+def get_collect_reviews_usecase() -> CollectReviewsUseCase:
+    # Provided via dependency override in product_review_collector.bootstrap
+    raise RuntimeError("CollectReviewsUseCase dependency is not wired")
 
 
 @router.post("/naver")
-async def collect_reviews(request: CollectReviewsRequest):
+async def collect_reviews(
+    request: CollectReviewsRequest,
+    http_request: Request,
+    usecase: CollectReviewsUseCase = Depends(get_collect_reviews_usecase),
+):
     try:
-        reviews = await usecase.collect(str(request.product_url))
-        return {
-            "items": [
-                {
-                    "id": review.id,
-                    "content": review.content,
-                    "rating": review.grade,
-                    "writer": review.review_writer,
-                    "created_at": review.created_at.date().isoformat() if review.created_at else None,
-                }
-                for review in reviews
-            ]
-        }
+        reviews = await usecase.collect(
+            str(request.product_url),
+            is_disconnected=http_request.is_disconnected,
+        )
+        return {"items": [_to_item(review) for review in reviews]}
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
+    except CrawlTimeoutError as exc:
+        raise HTTPException(status_code=504, detail=str(exc))
+    except CrawlCancelledError as exc:
+        raise HTTPException(status_code=499, detail=str(exc))
     except HTTPException:
         # 이미 매핑된 HTTP 오류는 그대로 전달
         raise
     except Exception as exc:
         raise HTTPException(status_code=502, detail=f"review collector failed: {exc}")
+
+
+@router.delete("/naver/cache")
+async def invalidate_reviews_cache(
+    product_url: str = Query(..., description="캐시를 삭제할 상품 URL"),
+    usecase: CollectReviewsUseCase = Depends(get_collect_reviews_usecase),
+):
+    try:
+        invalidated = await usecase.invalidate_cache(product_url)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"product_url": product_url, "invalidated": invalidated}
+
+
+@router.post("/naver/stream")
+async def stream_reviews(
+    request: CollectReviewsRequest,
+    http_request: Request,
+    usecase: CollectReviewsUseCase = Depends(get_collect_reviews_usecase),
+):
+    """수집되는 리뷰를 NDJSON 한 줄씩 바로 전달 (리뷰 수와 무관하게 메모리 일정)."""
+    async def ndjson_lines():
+        try:
+            async for review in usecase.stream(
+                    str(request.product_url),
+                    is_disconnected=http_request.is_disconnected,
+            ):
+                yield json.dumps(_to_item(review), ensure_ascii=False) + "\n"
+        except Exception as exc:
+            # 스트림이 이미 시작된 뒤라 상태 코드를 바꿀 수 없으므로 마지막 줄에 오류를 기록
+            logger.warning(f"review stream failed: {exc}")
+            yield json.dumps({"error": str(exc)}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
@@ -0,0 +1,57 @@
+from typing import Any, AsyncIterator, Dict, List, Mapping
+
+from config.crawl_executor import DisconnectProbe
+from product_review_collector.adapter.output.naver_review_pagination import REVIEWS_PER_PAGE
+from product_review_collector.application.port.review_crawler_port import ReviewCrawlerPort
+from product_review_collector.infrastructure.cache.crawl_result_cache import CrawlResultCache
+
+
+class CachedReviewCrawler(ReviewCrawlerPort):
+    """크롤러 앞단 캐시: 같은 상품 URL 은 캐시된 리뷰를 반환하고, 오래된 캐시는 백그라운드에서 갱신한다."""
+
+    def __init__(self, crawler: ReviewCrawlerPort, cache: CrawlResultCache):
+        self._crawler = crawler
+        self._cache = cache
+
+    async def fetch_reviews(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> Dict[Any, Any]:
+        return await self._cache.get_or_crawl(
+            product_url,
+            lambda probe: self._crawler.fetch_reviews(product_url, is_disconnected=probe),
+            is_disconnected,
+        )
+
+    async def stream_reviews(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        cached = await self._cache.lookup(product_url)
+        if cached is not None:
+            reviews, is_stale = cached
+            if is_stale:
+                self._cache.refresh_in_background(
+                    product_url,
+                    lambda probe: self._crawler.fetch_reviews(product_url, is_disconnected=probe),
+                )
+
+            values = list(reviews.values())
+            for start in range(0, len(values), REVIEWS_PER_PAGE):
+                yield values[start:start + REVIEWS_PER_PAGE]
+            return
+
+        # 캐시 미스: 페이지는 받는 즉시 내보내고, 끝까지 수집된 경우에만 저장
+        collected: Dict[int, Mapping[str, Any]] = {}
+        async for page_reviews in self._crawler.stream_reviews(product_url, is_disconnected=is_disconnected):
+            for review in page_reviews:
+                collected[len(collected) + 1] = review
+            yield page_reviews
+
+        if collected:
+            await self._cache.store(product_url, collected)
+
+    async def invalidate(self, product_url: str) -> bool:
+        return await self._cache.invalidate(product_url)
@@ -0,0 +1,51 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Mapping
+
+from config.crawl_executor import CrawlCancelledError, DisconnectProbe
+from product_review_collector.application.port.review_crawler_port import ReviewCrawlerPort
+
+logger = logging.getLogger(__name__)
+
+
+class FallbackReviewCrawler(ReviewCrawlerPort):
+    """primary 크롤러가 실패하면 fallback 크롤러로 다시 수집한다. (HTTP → Selenium)"""
+
+    def __init__(self, primary: ReviewCrawlerPort, fallback: ReviewCrawlerPort):
+        self._primary = primary
+        self._fallback = fallback
+
+    async def fetch_reviews(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> Dict[Any, Any]:
+        try:
+            return await self._primary.fetch_reviews(product_url, is_disconnected=is_disconnected)
+        except (CrawlCancelledError, asyncio.CancelledError):
+            raise
+        except Exception as exc:
+            logger.warning(f"{type(self._primary).__name__} 실패, {type(self._fallback).__name__} 로 재시도: {exc}")
+            return await self._fallback.fetch_reviews(product_url, is_disconnected=is_disconnected)
+
+    async def stream_reviews(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        # 이미 일부 페이지를 내보낸 뒤의 실패는 중복 수집이 되므로 폴백하지 않고 그대로 전달
+        yielded = False
+        try:
+            async for page_reviews in self._primary.stream_reviews(product_url, is_disconnected=is_disconnected):
+                yielded = True
+                yield page_reviews
+            return
+        except (CrawlCancelledError, asyncio.CancelledError):
+            raise
+        except Exception as exc:
+            if yielded:
+                raise
+            logger.warning(f"{type(self._primary).__name__} 실패, {type(self._fallback).__name__} 로 재시도: {exc}")
+
+        async for page_reviews in self._fallback.stream_reviews(product_url, is_disconnected=is_disconnected):
+            yield page_reviews
@@ -1,7 +1,10 @@
-import re
-import time
-from datetime import datetime
-from typing import Dict, List, Mapping, Any
+import asyncio
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Executor
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Mapping
 
 import selenium.common
 from fastapi import HTTPException
@@ -11,18 +14,98 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
 
+from config import crawler_config
+from config.crawl_executor import CrawlExecutor, DisconnectProbe, get_crawl_executor, raise_if_cancelled
+from config.stage_timer import StageTimer
+from config.webdriver.waits import content_signature, wait_after_load, wait_for_content, wait_for_content_change
+from config.webdriver.webdriver_pool import WebDriverPool, get_chromedriver_path, get_webdriver_pool
+from product_review_collector.adapter.output.naver_review_html_parser import (
+    get_parser_executor,
+    parse_review_page,
+    parse_total_review_count,
+)
+from product_review_collector.adapter.output.naver_review_pagination import click_review_page, count_review_pages
 from product_review_collector.application.port.review_crawler_port import ReviewCrawlerPort
 
+logger = logging.getLogger(__name__)
+
+REVIEW_ITEM_SELECTOR = "li.PxsZltB5tV"
+
 
 class NaverCrawlerAdapter(ReviewCrawlerPort):
     """네이버 쇼핑 리뷰를 Selenium으로 수집하는 collector 전용 어댑터."""
 
-    async def fetch_reviews(self, product_url: str) -> Dict[Any, Any]:
-        html_list = self._analyze_naver_shopping_product_url_and_get_html_list(product_url)
-        return self._parse_reviews_from_html_list(html_list)
+    def __init__(
+            self,
+            driver_pool: WebDriverPool | None = None,
+            crawl_executor: CrawlExecutor | None = None,
+            max_reviews: int | None = None,
+            parser_executor: Executor | None = None,
+    ):
+        self._driver_pool = driver_pool or get_webdriver_pool("product-review-collector", self._create_driver)
+        self._crawl_executor = crawl_executor or get_crawl_executor()
+        self._max_reviews = max_reviews or crawler_config.REVIEW_CRAWL_MAX_REVIEWS
+        self._parser_executor = parser_executor or get_parser_executor()
+
+    async def fetch_reviews(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> Dict[Any, Any]:
+        reviews_dict: Dict[int, Mapping[str, Any]] = {}
+        async for page_reviews in self.stream_reviews(product_url, is_disconnected=is_disconnected):
+            for review in page_reviews:
+                reviews_dict[len(reviews_dict) + 1] = review
+        return reviews_dict
+
+    async def stream_reviews(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        """
+        producer/consumer 파이프라인
+        - producer: 크롤링 스레드가 page_source 를 한 장씩 넘김 (Selenium 은 블로킹이므로 전용 실행기)
+        - consumer: 받은 즉시 파싱 워커 풀에 제출하고 다음 페이지를 기다리므로 파싱과 페이지 이동이 겹침
+        - 파싱 결과는 페이지 순서대로 yield
+        """
+        loop = asyncio.get_running_loop()
+        max_pending = max(1, crawler_config.REVIEW_PARSER_WORKERS) + 1
+        pending: Deque[asyncio.Future] = deque()
+        remaining = self._max_reviews
+
+        def take(page_reviews: List[Mapping[str, Any]]) -> List[Mapping[str, Any]]:
+            nonlocal remaining
+            page_reviews = page_reviews[:remaining]
+            remaining -= len(page_reviews)
+            return page_reviews
+
+        try:
+            async with aclosing(self._crawl_executor.stream(
+                    self._iter_review_page_sources,
+                    product_url,
+                    is_disconnected=is_disconnected,
+            )) as page_sources:
+                async for review_html in page_sources:
+                    pending.append(loop.run_in_executor(self._parser_executor, parse_review_page, review_html))
+                    del review_html
+
+                    # 이미 끝난 파싱 결과는 바로 내보내고, 밀린 파싱이 많으면 하나를 기다림
+                    while pending and (pending[0].done() or len(pending) >= max_pending):
+                        page_reviews = take(await pending.popleft())
+                        if page_reviews:
+                            yield page_reviews
+                        if remaining <= 0:
+                            return
+
+            while pending and remaining > 0:
+                page_reviews = take(await pending.popleft())
+                if page_reviews:
+                    yield page_reviews
+        finally:
+            for future in pending:
+                future.cancel()
 
     def _build_driver(self, headless: bool) -> webdriver.Chrome:
         options = webdriver.ChromeOptions()
@@ -49,138 +132,69 @@ class NaverCrawlerAdapter(ReviewCrawlerPort):
 
         driver = webdriver.Chrome(
             options=options,
-            service=Service(ChromeDriverManager().install()),
+            service=Service(get_chromedriver_path()),
         )
         driver.implicitly_wait(3)
         return driver
 
-    def _analyze_naver_shopping_product_url_and_get_html_list(self, product_url: str) -> List[str]:
-        html_list: List[str] = []
-
-        def get_number_of_reviews_registered(html: str) -> int:
-            soup = BeautifulSoup(html, "html.parser")
-            return int(
-                soup
-                .find('div', {'class': 'J2bxvqM5w5'})
-                .find('span', {'class': 'sFI4W1erDx'}).get_text()
-                .replace(',', '')
-            )
-
+    def _create_driver(self) -> webdriver.Chrome:
         headless_preferred = True
         try:
-            driver = self._build_driver(headless=headless_preferred)
+            return self._build_driver(headless=headless_preferred)
         except WebDriverException:
-            driver = self._build_driver(headless=False)
-
-        wait = WebDriverWait(driver, 10)
-
-        try:
-            driver.get(product_url)
-            time.sleep(2)
-
-            review_all_selector = '#content > div > div.Q1bBXdV7RJ > div.K38C2T0Ypx > div.wKQQf4o3UG > div > a'
-
-            review_all_button = wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, review_all_selector))
-            )
-            driver.execute_script("arguments[0].click();", review_all_button)
-            time.sleep(1)
-
-            initial_html = driver.page_source
-            if initial_html:
-                print(f'상품 URL 기반 HTML 로드 완료\n{initial_html}')
-
-            total_review_count = min(get_number_of_reviews_registered(initial_html), 100)
-            total_review_pages = min(total_review_count // 20 + 1, 5)
-            print(f'상품 리뷰 전체 개수 : {total_review_count}, 상품 리뷰 페이지 수 : {total_review_pages}')
-
-            html_list.append(initial_html)
-
-            for i in range(3, total_review_pages + 2):
-                page_button = wait.until(
-                    EC.element_to_be_clickable(
-                        (
-                            By.CSS_SELECTOR,
-                            f'#REVIEW > div > div.JHZoCyHfg7 > div.HTT4L8U0CU > div > div > a:nth-child({i})',
-                        )
+            return self._build_driver(headless=False)
+
+    def _iter_review_page_sources(
+            self,
+            product_url: str,
+            cancel_event: threading.Event | None = None,
+    ) -> Iterator[str]:
+        page_count = 0
+        timer = StageTimer("collector-crawl")
+
+        with self._driver_pool.lease() as driver:
+            wait = WebDriverWait(driver, crawler_config.CRAWL_WAIT_TIMEOUT)
+
+            try:
+                raise_if_cancelled(cancel_event)
+                review_all_selector = '#content > div > div.Q1bBXdV7RJ > div.K38C2T0Ypx > div.wKQQf4o3UG > div > a'
+
+                with timer.stage("load"):
+                    driver.get(product_url)
+                    wait_after_load(driver, review_all_selector, legacy_sleep=2)
+
+                with timer.stage("open_reviews"):
+                    review_all_button = wait.until(
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, review_all_selector))
                     )
-                )
-                driver.execute_script("arguments[0].click();", page_button)
-                time.sleep(1)
-                html_list.append(driver.page_source)
+                    driver.execute_script("arguments[0].click();", review_all_button)
+                    wait_for_content(driver, REVIEW_ITEM_SELECTOR, legacy_sleep=1)
 
-            return html_list
+                initial_html = driver.page_source
+                total_review_count = parse_total_review_count(initial_html)
+                total_review_pages = count_review_pages(total_review_count, self._max_reviews)
+                logger.info(f'상품 리뷰 전체 개수 : {total_review_count}, 수집 페이지 수 : {total_review_pages}')
 
-        except selenium.common.NoSuchElementException as not_found_error:
-            raise HTTPException(status_code=500, detail=f"Element not found : {not_found_error}")
+                page_count += 1
+                yield initial_html
+                del initial_html
 
-        except selenium.common.exceptions.ElementNotInteractableException as interaction_error:
-            raise HTTPException(status_code=500, detail=f"Interaction failed: {interaction_error}")
+                for page in range(2, total_review_pages + 1):
+                    raise_if_cancelled(cancel_event)
+                    with timer.stage("paginate"):
+                        previous_signature = content_signature(driver, REVIEW_ITEM_SELECTOR)
+                        click_review_page(driver, page)
+                        wait_for_content_change(driver, REVIEW_ITEM_SELECTOR, previous_signature, legacy_sleep=1)
+                        page_source = driver.page_source
 
-        finally:
-            driver.quit()
+                    page_count += 1
+                    yield page_source
 
-    @staticmethod
-    def _extract_rating(review_item) -> float:
-        rating_tag = review_item.select_one("div.uyBAhJxDVs em.n6zq2yy0KA")
-        if not rating_tag:
-            return 0.0
-        try:
-            return float(rating_tag.get_text().strip())
-        except (TypeError, ValueError):
-            return 0.0
-
-    @staticmethod
-    def _extract_created_at(review_item) -> datetime | None:
-        date_tag = review_item.select_one("div.uyBAhJxDVs span.MX91DFZo2F")
-        if not date_tag:
-            return None
-        raw = date_tag.get_text().strip().rstrip(".")
-        try:
-            parsed = datetime.strptime(raw, "%y.%m.%d")
-            print(f"[collector-debug] parsed date: {parsed}")
-            return parsed
-        except ValueError:
-            print(f"[collector-debug] date parse failed for: {raw}")
-            return None
-
-    @staticmethod
-    def _extract_writer(review_item) -> str | None:
-        writer_tag = review_item.select_one("div.Db9Dtnf7gY strong.MX91DFZo2F")
-        if not writer_tag:
-            return None
-        writer = writer_tag.get_text().strip()
-        print(f"[collector-debug] writer raw: {writer}")
-        return writer or None
-
-    def _parse_reviews_from_html_list(self, review_html_list: List[str]) -> Dict[int, Mapping[str, Any]]:
-        if not review_html_list:
-            raise HTTPException(status_code=404, detail="Fail to load HTML from given URL")
+            except selenium.common.NoSuchElementException as not_found_error:
+                raise HTTPException(status_code=500, detail=f"Element not found : {not_found_error}")
 
-        reviews_dict: Dict[int, Mapping[str, Any]] = {}
-        review_count = 1
-
-        for review_html in review_html_list:
-            soup = BeautifulSoup(review_html, "html.parser")
-            review_items = soup.findAll('li', {'class': "PxsZltB5tV _nlog_click _nlog_impression_element"})
-
-            for review in range(len(review_items)):
-                review_content_raw = (
-                    review_items[review]
-                    .findAll('div', {'class': 'KqJ8Qqw082'})[0]
-                    .find('span', {'class': 'MX91DFZo2F'}).get_text())
-                review_content = re.sub(' +', ' ', re.sub('\n', ' ', review_content_raw))
-                rating = self._extract_rating(review_items[review])
-                created_at = self._extract_created_at(review_items[review])
-                writer = self._extract_writer(review_items[review])
-
-                reviews_dict[review_count] = {
-                    "content": review_content,
-                    "rating": rating,
-                    "created_at": created_at,
-                    "review_writer": writer,
-                }
-                review_count += 1
-
-        print(f'reviews: {reviews_dict}')
-        return reviews_dict
+            except selenium.common.exceptions.ElementNotInteractableException as interaction_error:
+                raise HTTPException(status_code=500, detail=f"Interaction failed: {interaction_error}")
+
+            finally:
+                logger.info(f"{timer.summary()} strategy={crawler_config.CRAWL_WAIT_STRATEGY} pages={page_count}")
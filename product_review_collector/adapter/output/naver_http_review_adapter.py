@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import math
+import re
+from collections import deque
+from datetime import datetime
+from typing import Any, AsyncIterator, Deque, Dict, List, Mapping, Optional, Tuple
+
+import httpx
+
+from config import crawler_config
+from config.crawl_executor import CrawlCancelledError, DisconnectProbe
+from product_review_collector.adapter.output.naver_review_html_parser import parse_review_page
+from product_review_collector.application.port.review_crawler_port import ReviewCrawlerPort
+
+logger = logging.getLogger(__name__)
+
+REVIEW_QUERY_PATH = "/i/v1/contents/reviews/query-pages"
+_ORIGIN_PRODUCT_NO_RE = re.compile(r'"originProductNo"\s*:\s*"?(\d+)')
+_MERCHANT_NO_RE = re.compile(r'"checkoutMerchantNo"\s*:\s*"?(\d+)')
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class NaverReviewFetchError(Exception):
+    pass
+
+
+class NaverHttpReviewAdapter(ReviewCrawlerPort):
+    """
+    브라우저 없이 SmartStore 리뷰 API 를 비동기 HTTP 로 호출하는 collector 어댑터
+    - 상품 페이지 HTML 에서 originProductNo / checkoutMerchantNo 추출
+    - 첫 페이지로 전체 페이지 수 확인 후 나머지 페이지는 동시 요청
+    - 응답이 JSON 이면 contents 를, HTML 이면 리뷰 목록 파서를 사용
+    """
+
+    def __init__(
+            self,
+            client: httpx.AsyncClient | None = None,
+            *,
+            api_base: str | None = None,
+            concurrency: int | None = None,
+            page_size: int | None = None,
+            max_reviews: int | None = None,
+    ):
+        self._client = client or httpx.AsyncClient(
+            timeout=crawler_config.NAVER_REVIEW_HTTP_TIMEOUT,
+            follow_redirects=True,
+            headers={
+                "User-Agent": (
+                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+                ),
+                "Accept-Language": "ko-KR,ko;q=0.9",
+            },
+        )
+        self._api_base = (api_base or crawler_config.NAVER_REVIEW_API_BASE).rstrip("/")
+        self._concurrency = max(1, concurrency or crawler_config.NAVER_REVIEW_HTTP_CONCURRENCY)
+        self._page_size = page_size or crawler_config.NAVER_REVIEW_PAGE_SIZE
+        self._max_reviews = max_reviews or crawler_config.REVIEW_CRAWL_MAX_REVIEWS
+
+    async def fetch_reviews(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> Dict[int, Mapping[str, Any]]:
+        reviews_dict: Dict[int, Mapping[str, Any]] = {}
+        async for page_reviews in self.stream_reviews(product_url, is_disconnected=is_disconnected):
+            for review in page_reviews:
+                reviews_dict[len(reviews_dict) + 1] = review
+
+        if not reviews_dict:
+            raise NaverReviewFetchError(f"no reviews returned for {product_url}")
+        return reviews_dict
+
+    async def stream_reviews(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        merchant_no, origin_product_no = await self._resolve_product_keys(product_url)
+
+        first_page, total_pages = await self._fetch_page(merchant_no, origin_product_no, 1, is_disconnected)
+        page_count = min(total_pages, max(1, math.ceil(self._max_reviews / self._page_size)))
+
+        remaining = self._max_reviews
+        page_reviews = first_page[:remaining]
+        remaining -= len(page_reviews)
+        if page_reviews:
+            yield page_reviews
+
+        # 최대 concurrency 개 페이지만 미리 요청해 두고, 페이지 순서대로 하나씩 yield
+        pending: Deque[asyncio.Task] = deque()
+        next_page = 2
+        try:
+            while remaining > 0 and (pending or next_page <= page_count):
+                while next_page <= page_count and len(pending) < self._concurrency:
+                    pending.append(asyncio.create_task(
+                        self._fetch_page(merchant_no, origin_product_no, next_page, is_disconnected)
+                    ))
+                    next_page += 1
+
+                reviews, _ = await pending.popleft()
+                page_reviews = reviews[:remaining]
+                remaining -= len(page_reviews)
+                if page_reviews:
+                    yield page_reviews
+        finally:
+            for task in pending:
+                task.cancel()
+            # 취소된 요청의 예외를 회수하고 연결을 정리한 뒤 종료
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _resolve_product_keys(self, product_url: str) -> Tuple[str, str]:
+        response = await self._client.get(product_url)
+        if response.status_code != 200:
+            raise NaverReviewFetchError(f"product page returned {response.status_code}")
+
+        merchant_match = _MERCHANT_NO_RE.search(response.text)
+        product_match = _ORIGIN_PRODUCT_NO_RE.search(response.text)
+        if not merchant_match or not product_match:
+            raise NaverReviewFetchError("failed to find checkoutMerchantNo/originProductNo in product page")
+        return merchant_match.group(1), product_match.group(1)
+
+    async def _fetch_page(
+            self,
+            merchant_no: str,
+            origin_product_no: str,
+            page: int,
+            is_disconnected: DisconnectProbe | None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        if is_disconnected is not None and await is_disconnected():
+            raise CrawlCancelledError("client disconnected")
+
+        response = await self._client.post(
+            f"{self._api_base}{REVIEW_QUERY_PATH}",
+            json={
+                "checkoutMerchantNo": merchant_no,
+                "originProductNo": origin_product_no,
+                "page": page,
+                "pageSize": self._page_size,
+                "reviewSearchSortType": "REVIEW_RANKING",
+            },
+        )
+        if response.status_code != 200:
+            raise NaverReviewFetchError(f"review page {page} returned {response.status_code}")
+
+        content_type = response.headers.get("content-type", "")
+        if "json" in content_type:
+            return self._parse_json_page(response.json())
+
+        # HTML 응답은 Selenium 경로와 동일한 리뷰 목록 파서로 처리 (페이지 수는 알 수 없으므로 1)
+        return parse_review_page(response.text), 1
+
+    @staticmethod
+    def _parse_json_page(payload: Mapping[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
+        contents = payload.get("contents") or []
+        total_pages = int(payload.get("totalPages") or 1)
+
+        reviews: List[Dict[str, Any]] = []
+        for item in contents:
+            content = _WHITESPACE_RE.sub(" ", str(item.get("reviewContent") or "")).strip()
+            if not content:
+                continue
+            reviews.append({
+                "content": content,
+                "rating": float(item.get("reviewScore") or 0.0),
+                "created_at": _parse_created_at(item.get("createDate")),
+                "review_writer": item.get("writerMemberId") or None,
+            })
+        return reviews, total_pages
+
+
+def _parse_created_at(value: Optional[str]) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return None
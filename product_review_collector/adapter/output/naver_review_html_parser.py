@@ -0,0 +1,239 @@
+import logging
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+from config import crawler_config
+
+logger = logging.getLogger(__name__)
+
+REVIEW_ITEM_CLASS = "PxsZltB5tV _nlog_click _nlog_impression_element"
+
+_NEWLINE_RE = re.compile("\n")
+_MULTI_SPACE_RE = re.compile(" +")
+
+
+def _normalize_content(raw: str) -> str:
+    return _MULTI_SPACE_RE.sub(" ", _NEWLINE_RE.sub(" ", raw))
+
+
+def _to_rating(raw: Optional[str]) -> float:
+    if not raw:
+        return 0.0
+    try:
+        return float(raw.strip())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _to_created_at(raw: Optional[str]) -> datetime | None:
+    if not raw:
+        return None
+    try:
+        return datetime.strptime(raw.strip().rstrip("."), "%y.%m.%d")
+    except ValueError:
+        return None
+
+
+def _to_count(raw: Optional[str]) -> int:
+    try:
+        return int((raw or "").replace(",", "").strip())
+    except ValueError:
+        return 0
+
+
+def _build_review(
+        content_raw: str,
+        rating_raw: Optional[str],
+        date_raw: Optional[str],
+        writer_raw: Optional[str],
+) -> Dict[str, Any]:
+    return {
+        "content": _normalize_content(content_raw),
+        "rating": _to_rating(rating_raw),
+        "created_at": _to_created_at(date_raw),
+        "review_writer": (writer_raw or "").strip() or None,
+    }
+
+
+# --- selectolax: C 기반 파서, CSS 셀렉터로 필요한 노드만 바로 조회 ---
+@lru_cache(maxsize=1)
+def _selectolax_parser_class():
+    # selectolax 1.0 부터 Modest 백엔드(selectolax.parser)가 제거되어 lexbor 백엔드를 우선 사용
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+        return LexborHTMLParser
+    except ImportError:
+        from selectolax.parser import HTMLParser
+        return HTMLParser
+
+
+def _parse_with_selectolax(review_html: str) -> List[Dict[str, Any]]:
+    HTMLParser = _selectolax_parser_class()
+
+    def text_of(node, selector: str) -> Optional[str]:
+        found = node.css_first(selector)
+        return found.text() if found is not None else None
+
+    reviews: List[Dict[str, Any]] = []
+    for item in HTMLParser(review_html).css("li.PxsZltB5tV._nlog_click._nlog_impression_element"):
+        content_raw = text_of(item, "div.KqJ8Qqw082 span.MX91DFZo2F")
+        if content_raw is None:
+            continue
+        reviews.append(_build_review(
+            content_raw,
+            text_of(item, "div.uyBAhJxDVs em.n6zq2yy0KA"),
+            text_of(item, "div.uyBAhJxDVs span.MX91DFZo2F"),
+            text_of(item, "div.Db9Dtnf7gY strong.MX91DFZo2F"),
+        ))
+    return reviews
+
+
+def _count_with_selectolax(review_html: str) -> int:
+    node = _selectolax_parser_class()(review_html).css_first("div.J2bxvqM5w5 span.sFI4W1erDx")
+    return _to_count(node.text() if node is not None else None)
+
+
+# --- lxml: libxml2 파서 + 미리 컴파일한 XPath ---
+def _class_xpath(tag: str, class_name: str) -> str:
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+@lru_cache(maxsize=1)
+def _lxml_xpaths() -> Dict[str, Any]:
+    from lxml import etree
+
+    return {
+        "items": etree.XPath(f"//{_class_xpath('li', 'PxsZltB5tV')}[contains(@class, '_nlog_impression_element')]"),
+        "content": etree.XPath(f".//{_class_xpath('div', 'KqJ8Qqw082')}//{_class_xpath('span', 'MX91DFZo2F')}"),
+        "rating": etree.XPath(f".//{_class_xpath('div', 'uyBAhJxDVs')}//{_class_xpath('em', 'n6zq2yy0KA')}"),
+        "date": etree.XPath(f".//{_class_xpath('div', 'uyBAhJxDVs')}//{_class_xpath('span', 'MX91DFZo2F')}"),
+        "writer": etree.XPath(f".//{_class_xpath('div', 'Db9Dtnf7gY')}//{_class_xpath('strong', 'MX91DFZo2F')}"),
+        "count": etree.XPath(f"//{_class_xpath('div', 'J2bxvqM5w5')}//{_class_xpath('span', 'sFI4W1erDx')}"),
+    }
+
+
+def _parse_with_lxml(review_html: str) -> List[Dict[str, Any]]:
+    import lxml.html
+
+    xpaths = _lxml_xpaths()
+
+    def text_of(item, key: str) -> Optional[str]:
+        found = xpaths[key](item)
+        return found[0].text_content() if found else None
+
+    reviews: List[Dict[str, Any]] = []
+    for item in xpaths["items"](lxml.html.fromstring(review_html)):
+        content_raw = text_of(item, "content")
+        if content_raw is None:
+            continue
+        reviews.append(_build_review(
+            content_raw,
+            text_of(item, "rating"),
+            text_of(item, "date"),
+            text_of(item, "writer"),
+        ))
+    return reviews
+
+
+def _count_with_lxml(review_html: str) -> int:
+    import lxml.html
+
+    found = _lxml_xpaths()["count"](lxml.html.fromstring(review_html))
+    return _to_count(found[0].text_content() if found else None)
+
+
+# --- BeautifulSoup(html.parser): 기존 구현, 추가 의존성이 없을 때의 폴백 ---
+def _parse_with_bs4(review_html: str) -> List[Dict[str, Any]]:
+    from bs4 import BeautifulSoup
+
+    def text_of(item, selector: str) -> Optional[str]:
+        found = item.select_one(selector)
+        return found.get_text() if found else None
+
+    soup = BeautifulSoup(review_html, "html.parser")
+    reviews: List[Dict[str, Any]] = []
+    for item in soup.find_all('li', {'class': REVIEW_ITEM_CLASS}):
+        content_raw = text_of(item, "div.KqJ8Qqw082 span.MX91DFZo2F")
+        if content_raw is None:
+            continue
+        reviews.append(_build_review(
+            content_raw,
+            text_of(item, "div.uyBAhJxDVs em.n6zq2yy0KA"),
+            text_of(item, "div.uyBAhJxDVs span.MX91DFZo2F"),
+            text_of(item, "div.Db9Dtnf7gY strong.MX91DFZo2F"),
+        ))
+    return reviews
+
+
+def _count_with_bs4(review_html: str) -> int:
+    from bs4 import BeautifulSoup
+
+    node = BeautifulSoup(review_html, "html.parser").select_one("div.J2bxvqM5w5 span.sFI4W1erDx")
+    return _to_count(node.get_text() if node else None)
+
+
+_BACKENDS: Dict[str, tuple[Callable[[str], List[Dict[str, Any]]], Callable[[str], int]]] = {
+    "selectolax": (_parse_with_selectolax, _count_with_selectolax),
+    "lxml": (_parse_with_lxml, _count_with_lxml),
+    "bs4": (_parse_with_bs4, _count_with_bs4),
+}
+
+
+@lru_cache(maxsize=None)
+def resolve_backend(preferred: str | None = None) -> str:
+    """설정된 백엔드를 확인하고, auto 면 설치된 가장 빠른 파서를 선택한다."""
+    preferred = (preferred or crawler_config.REVIEW_HTML_PARSER).lower()
+    if preferred in _BACKENDS and preferred != "auto":
+        return preferred
+
+    try:
+        _selectolax_parser_class()
+        return "selectolax"
+    except ImportError:
+        pass
+    try:
+        __import__("lxml.html")
+        return "lxml"
+    except ImportError:
+        pass
+    return "bs4"
+
+
+def parse_review_page(review_html: str, backend: str | None = None) -> List[Dict[str, Any]]:
+    """SmartStore 리뷰 페이지 HTML 한 장에서 리뷰 목록(content/rating/created_at/review_writer)을 추출한다."""
+    parse, _ = _BACKENDS[resolve_backend(backend)]
+    return parse(review_html)
+
+
+def parse_total_review_count(review_html: str, backend: str | None = None) -> int:
+    """리뷰 영역의 전체 리뷰 수. 찾지 못하면 0."""
+    _, count = _BACKENDS[resolve_backend(backend)]
+    total = count(review_html)
+    if total == 0:
+        logger.warning("전체 리뷰 수를 찾지 못해 첫 페이지만 수집")
+    return total
+
+
+_parser_executor_instance: Executor | None = None
+
+
+def get_parser_executor() -> Executor:
+    """리뷰 페이지 파싱 전용 워커 풀 (Singleton). 크롤링 스레드와 별도로 동작한다."""
+    global _parser_executor_instance
+    if _parser_executor_instance is None:
+        workers = max(1, crawler_config.REVIEW_PARSER_WORKERS)
+        if crawler_config.REVIEW_PARSER_POOL_KIND == "process":
+            _parser_executor_instance = ProcessPoolExecutor(max_workers=workers)
+        else:
+            _parser_executor_instance = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="review-parser")
+    return _parser_executor_instance
+
+
+def shutdown_parser_executor() -> None:
+    global _parser_executor_instance
+    if _parser_executor_instance is not None:
+        _parser_executor_instance.shutdown(wait=False, cancel_futures=True)
+        _parser_executor_instance = None
@@ -0,0 +1,28 @@
+import math
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+REVIEWS_PER_PAGE = 20
+_PAGINATION_LINK_XPATH = "//div[contains(@class, 'HTT4L8U0CU')]//a"
+
+
+def count_review_pages(total_review_count: int, max_reviews: int, per_page: int = REVIEWS_PER_PAGE) -> int:
+    """수집 예산(max_reviews) 안에서 열어야 할 리뷰 페이지 수."""
+    budget = min(total_review_count, max(0, max_reviews))
+    return max(1, math.ceil(budget / per_page))
+
+
+def click_review_page(driver: WebDriver, page: int) -> None:
+    """
+    리뷰 페이지 번호 링크 클릭
+    - 현재 페이지 블록(1~10)에 번호가 없으면 '다음' 버튼으로 다음 블록의 첫 페이지로 이동
+    """
+    links = driver.find_elements(By.XPATH, f"{_PAGINATION_LINK_XPATH}[normalize-space(text())='{page}']")
+    if not links:
+        links = driver.find_elements(By.XPATH, f"{_PAGINATION_LINK_XPATH}[contains(normalize-space(.), '다음')]")
+    if not links:
+        raise NoSuchElementException(f"review page link not found: {page}")
+
+    driver.execute_script("arguments[0].click();", links[0])
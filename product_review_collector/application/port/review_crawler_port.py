@@ -1,9 +1,18 @@
-from typing import Protocol, runtime_checkable
+from typing import Any, AsyncIterator, List, Mapping, Protocol, runtime_checkable
+
+from config.crawl_executor import DisconnectProbe
 
 
 @runtime_checkable
 class ReviewCrawlerPort(Protocol):
     """포트: 상품 리뷰를 수집하는 외부 크롤러 인터페이스."""
 
-    async def fetch_reviews(self, product_url: str) -> dict:
-        """주어진 상품 URL에서 리뷰 데이터를 비동기적으로 수집한다."""
+    async def fetch_reviews(self, product_url: str, is_disconnected: DisconnectProbe | None = None) -> dict:
+        """주어진 상품 URL에서 리뷰 데이터를 비동기적으로 수집한다. 클라이언트 연결이 끊기면 중단한다."""
+
+    def stream_reviews(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        """리뷰를 페이지 단위로 수집되는 즉시 yield 한다. 전체 페이지를 메모리에 모아두지 않는다."""
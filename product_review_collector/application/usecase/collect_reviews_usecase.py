@@ -1,81 +1,33 @@
 from datetime import datetime
-from typing import List, Mapping, Optional
+from typing import AsyncIterator, List, Mapping, Optional
 
+from config.crawl_executor import DisconnectProbe
 from product_review_collector.application.port.review_crawler_port import ReviewCrawlerPort
 from product_review_collector.domain.product_review import ProductReview
+from product_review_collector.infrastructure.cache.crawl_result_cache import CrawlResultCache
 
 
 class CollectReviewsUseCase:
     """리뷰 수집 유스케이스: 입력 검증 후 크롤러 포트를 호출하고 결과를 도메인 모델로 정규화한다."""
 
-    def __init__(self, crawler: ReviewCrawlerPort):
+    def __init__(self, crawler: ReviewCrawlerPort, crawl_cache: CrawlResultCache | None = None):
         self._crawler = crawler
+        self._crawl_cache = crawl_cache
 
-    async def collect(self, product_url: str) -> List[ProductReview]:
+    async def invalidate_cache(self, product_url: str) -> bool:
+        """상품 URL 의 크롤링 캐시 삭제. 캐시가 비활성화되어 있으면 ValueError."""
         if not product_url or not product_url.strip():
             raise ValueError("product_url is required")
+        if self._crawl_cache is None:
+            raise ValueError("crawl cache is disabled")
+        return await self._crawl_cache.invalidate(product_url.strip())
 
-        raw = await self._crawler.fetch_reviews(product_url.strip())
-
-        if isinstance(raw, Mapping):
-            items = raw.items()
-        elif isinstance(raw, list):
-            # 리스트로 전달되는 경우 순서를 유지하며 인덱스를 키로 사용
-            items = enumerate(raw, start=1)
-        else:
-            raise ValueError("unexpected crawler result type")
-
-        def _parse_date(value: object) -> Optional[datetime]:
-            if isinstance(value, datetime):
-                return value
-            if isinstance(value, str):
-                candidate = value.strip().rstrip(".")
-                for fmt in ("%Y-%m-%d", "%y-%m-%d", "%y.%m.%d", "%y.%m.%d"):
-                    try:
-                        return datetime.strptime(candidate, fmt)
-                    except ValueError:
-                        continue
-            return None
-
-        reviews: List[ProductReview] = []
-        for key, value in items:
-            try:
-                review_id = int(key)
-            except (TypeError, ValueError):
-                # 키를 숫자로 변환할 수 없는 경우 건너뜀
-                continue
-
-            content: Optional[str] = None
-            grade: Optional[float] = None
-            created_at: Optional[datetime] = None
-            review_writer: Optional[str] = None
-
-            if isinstance(value, Mapping):
-                content = str(value.get("content") or "").strip()
-                grade_raw = value.get("rating") if "rating" in value else value.get("grade")
-                if grade_raw not in (None, ""):
-                    try:
-                        grade = float(grade_raw)
-                    except (TypeError, ValueError):
-                        grade = None
-                review_writer = str(value.get("review_writer") or "").strip() or None
-                created_at = _parse_date(value.get("created_at"))
-            else:
-                content = str(value or "").strip()
-
-            if not content:
-                continue
-
-            reviews.append(
-                ProductReview(
-                    id=review_id,
-                    content=content,
-                    grade=grade,
-                    review_writer=review_writer,
-                    created_at=created_at,
-                    source_url=product_url.strip(),
-                )
-            )
+    async def collect(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> List[ProductReview]:
+        reviews = [review async for review in self.stream(product_url, is_disconnected=is_disconnected)]
 
         if not reviews:
             raise ValueError("no reviews collected")
@@ -83,3 +35,73 @@ class CollectReviewsUseCase:
         # ID 기준 정렬로 일관된 응답 제공
         reviews.sort(key=lambda review: review.id)
         return reviews
+
+    async def stream(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> AsyncIterator[ProductReview]:
+        """크롤러가 페이지를 넘겨주는 즉시 리뷰를 도메인 모델로 변환해 하나씩 yield 한다."""
+        if not product_url or not product_url.strip():
+            raise ValueError("product_url is required")
+
+        source_url = product_url.strip()
+        review_id = 0
+
+        async for page_reviews in self._crawler.stream_reviews(source_url, is_disconnected=is_disconnected):
+            if isinstance(page_reviews, Mapping):
+                items = page_reviews.values()
+            elif isinstance(page_reviews, list):
+                items = page_reviews
+            else:
+                raise ValueError("unexpected crawler result type")
+
+            for value in items:
+                review_id += 1
+                review = self._to_review(review_id, value, source_url)
+                if review is not None:
+                    yield review
+
+    @staticmethod
+    def _parse_date(value: object) -> Optional[datetime]:
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, str):
+            candidate = value.strip().rstrip(".")
+            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%y-%m-%d", "%y.%m.%d", "%y.%m.%d"):
+                try:
+                    return datetime.strptime(candidate, fmt)
+                except ValueError:
+                    continue
+        return None
+
+    def _to_review(self, review_id: int, value: object, source_url: str) -> Optional[ProductReview]:
+        content: Optional[str] = None
+        grade: Optional[float] = None
+        created_at: Optional[datetime] = None
+        review_writer: Optional[str] = None
+
+        if isinstance(value, Mapping):
+            content = str(value.get("content") or "").strip()
+            grade_raw = value.get("rating") if "rating" in value else value.get("grade")
+            if grade_raw not in (None, ""):
+                try:
+                    grade = float(grade_raw)
+                except (TypeError, ValueError):
+                    grade = None
+            review_writer = str(value.get("review_writer") or "").strip() or None
+            created_at = self._parse_date(value.get("created_at"))
+        else:
+            content = str(value or "").strip()
+
+        if not content:
+            return None
+
+        return ProductReview(
+            id=review_id,
+            content=content,
+            grade=grade,
+            review_writer=review_writer,
+            created_at=created_at,
+            source_url=source_url,
+        )
@@ -2,19 +2,62 @@ import os
 
 from fastapi import FastAPI
 
+from config import crawler_config
+from config.lifespan import LifespanHooks
+
 
 def _is_enabled(env_var: str) -> bool:
     return os.getenv(env_var, "false").lower() in {"1", "true", "yes", "on"}
 
 
-def setup_product_review_collector(app: FastAPI) -> None:
+def _build_review_crawler():
+    """REVIEW_CRAWLER_BACKEND 에 따라 리뷰 크롤러 선택. http 는 Selenium 폴백과 함께 구성."""
+    from product_review_collector.adapter.output.naver_crawler_adapter import NaverCrawlerAdapter  # noqa: WPS433
+
+    selenium_crawler = NaverCrawlerAdapter()
+    if crawler_config.REVIEW_CRAWLER_BACKEND != "http":
+        return selenium_crawler, []
+
+    from product_review_collector.adapter.output.fallback_review_crawler import (  # noqa: WPS433
+        FallbackReviewCrawler,
+    )
+    from product_review_collector.adapter.output.naver_http_review_adapter import (  # noqa: WPS433
+        NaverHttpReviewAdapter,
+    )
+
+    http_crawler = NaverHttpReviewAdapter()
+    return FallbackReviewCrawler(primary=http_crawler, fallback=selenium_crawler), [http_crawler.aclose]
+
+
+def setup_product_review_collector(app: FastAPI, lifespan: LifespanHooks) -> None:
     """Wire product review collector routers into the FastAPI app."""
     if not _is_enabled("ENABLE_PRODUCT_REVIEW_COLLECTOR"):
         return
 
     from product_review_collector.adapter.input.web.product_review_collector_router import (  # noqa: WPS433,E501
+        get_collect_reviews_usecase,
         router as product_review_collector_router,
     )
+    from product_review_collector.application.usecase.collect_reviews_usecase import (  # noqa: WPS433
+        CollectReviewsUseCase,
+    )
+
+    from product_review_collector.adapter.output.cached_review_crawler import (  # noqa: WPS433
+        CachedReviewCrawler,
+    )
+    from product_review_collector.infrastructure.cache.crawl_result_cache import (  # noqa: WPS433
+        get_crawl_result_cache,
+    )
+
+    crawler, shutdown_hooks = _build_review_crawler()
+    crawl_cache = get_crawl_result_cache("collector")
+    if crawl_cache is not None:
+        crawler = CachedReviewCrawler(crawler, crawl_cache)
+    collect_usecase = CollectReviewsUseCase(crawler, crawl_cache=crawl_cache)
+
+    app.dependency_overrides[get_collect_reviews_usecase] = lambda: collect_usecase
+    for shutdown_hook in shutdown_hooks:
+        lifespan.on_shutdown(shutdown_hook)
 
     app.include_router(
         product_review_collector_router,
@@ -0,0 +1,18 @@
+from urllib.parse import urlparse
+
+_SMARTSTORE_HOSTS = {"smartstore.naver.com", "m.smartstore.naver.com"}
+
+
+def normalize_product_url(product_url: str) -> str:
+    """
+    같은 상품을 같은 키로 묶기 위한 URL 정규화
+    - scheme/host 소문자, 모바일 SmartStore 도메인은 PC 도메인으로 통일
+    - 추적용 쿼리(NaPm 등)와 fragment, 끝 슬래시 제거
+    """
+    parsed = urlparse((product_url or "").strip())
+    host = parsed.netloc.lower()
+    if host in _SMARTSTORE_HOSTS:
+        host = "smartstore.naver.com"
+
+    path = parsed.path.rstrip("/") or "/"
+    return f"https://{host}{path}"
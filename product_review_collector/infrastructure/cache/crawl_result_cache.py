@@ -0,0 +1,126 @@
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from config import crawler_config
+from config.cache.cache_backend import CacheBackend, get_cache_backend
+from config.crawl_executor import DisconnectProbe
+from product_review_collector.domain.product_url import normalize_product_url
+
+logger = logging.getLogger(__name__)
+
+# 캐시 미스 / 갱신 시 실제 크롤링을 수행하는 함수 (연결 종료 확인 함수를 전달받음)
+CrawlFunc = Callable[[Optional[DisconnectProbe]], Awaitable[Any]]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"not JSON serializable: {type(value).__name__}")
+
+
+class CrawlResultCache:
+    """
+    정규화된 상품 URL 별 크롤링 결과 캐시
+    - ttl 이내: 캐시 결과를 그대로 반환
+    - ttl ~ ttl + stale 구간: 캐시 결과를 반환하고 백그라운드에서 다시 크롤링 (stale-while-revalidate)
+    - 그 이후: 만료되어 새로 크롤링
+    """
+
+    def __init__(
+            self,
+            backend: CacheBackend,
+            *,
+            namespace: str,
+            ttl_seconds: int,
+            stale_seconds: int,
+    ):
+        self._backend = backend
+        self._namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._refreshing: Set[str] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+    def key(self, product_url: str) -> str:
+        return f"crawl:{self._namespace}:{normalize_product_url(product_url)}"
+
+    async def lookup(self, product_url: str) -> Optional[Tuple[Any, bool]]:
+        """(data, is_stale) 또는 None."""
+        raw = await self._backend.get(self.key(product_url))
+        if raw is None:
+            return None
+
+        try:
+            entry = json.loads(raw)
+        except ValueError:
+            return None
+
+        age = time.time() - float(entry.get("stored_at", 0))
+        return entry.get("data"), age > self.ttl_seconds
+
+    async def store(self, product_url: str, data: Any) -> None:
+        payload = json.dumps({"stored_at": time.time(), "data": data}, ensure_ascii=False, default=_json_default)
+        await self._backend.set(self.key(product_url), payload, self.ttl_seconds + self.stale_seconds)
+
+    async def invalidate(self, product_url: str) -> bool:
+        return await self._backend.delete(self.key(product_url))
+
+    async def get_or_crawl(
+            self,
+            product_url: str,
+            crawl: CrawlFunc,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> Any:
+        cached = await self.lookup(product_url)
+        if cached is not None:
+            data, is_stale = cached
+            if is_stale:
+                self.refresh_in_background(product_url, crawl)
+            return data
+
+        data = await crawl(is_disconnected)
+        await self.store(product_url, data)
+        return data
+
+    def refresh_in_background(self, product_url: str, crawl: CrawlFunc) -> None:
+        key = self.key(product_url)
+        if key in self._refreshing:
+            return
+
+        self._refreshing.add(key)
+
+        async def refresh() -> None:
+            try:
+                # 요청한 클라이언트와 무관하게 끝까지 갱신하므로 연결 종료 확인 없이 크롤링
+                await self.store(product_url, await crawl(None))
+            except Exception as exc:
+                logger.warning(f"크롤링 캐시 갱신 실패 ({key}): {exc}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+
+_cache_instances: Dict[str, CrawlResultCache] = {}
+
+
+def get_crawl_result_cache(namespace: str) -> Optional[CrawlResultCache]:
+    """CRAWL_CACHE_BACKEND 설정에 따른 네임스페이스별 캐시 (Singleton). 비활성화면 None."""
+    backend = get_cache_backend(crawler_config.CRAWL_CACHE_BACKEND)
+    if backend is None:
+        return None
+
+    if namespace not in _cache_instances:
+        _cache_instances[namespace] = CrawlResultCache(
+            backend,
+            namespace=namespace,
+            ttl_seconds=crawler_config.CRAWL_CACHE_TTL_SECONDS,
+            stale_seconds=crawler_config.CRAWL_CACHE_STALE_SECONDS,
+        )
+    return _cache_instances[namespace]
@@ -1,4 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from config.cache.single_flight import SingleFlightTimeoutError
+from config.crawl_executor import CrawlCancelledError, CrawlTimeoutError
 
 from product_review_crawling_agents.adapter.input.web.request.collect_product_reviews_request import \
     CollectProductReviewsRequest
@@ -11,7 +14,26 @@ usecase = ProductReviewAgentsUseCase.get_instance()
 
 
 @product_review_crawling_agents_router.post("/naver")
-async def crawling_reviews(request: CollectProductReviewsRequest):
+async def crawling_reviews(request: CollectProductReviewsRequest, http_request: Request):
     url = request.product_url
-    reviews = await usecase.crawling_naver_review_agents(url)
+    try:
+        reviews = await usecase.crawling_naver_review_agents(url, is_disconnected=http_request.is_disconnected)
+    except (CrawlTimeoutError, SingleFlightTimeoutError) as exc:
+        raise HTTPException(status_code=504, detail=str(exc))
+    except CrawlCancelledError as exc:
+        raise HTTPException(status_code=499, detail=str(exc))
     return reviews
+
+
+@product_review_crawling_agents_router.delete("/naver/cache")
+async def invalidate_reviews_cache(product_url: str = Query(..., description="캐시를 삭제할 상품 URL")):
+    try:
+        invalidated = await usecase.invalidate_naver_review_cache(product_url)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"product_url": product_url, "invalidated": invalidated}
+
+
+@product_review_crawling_agents_router.get("/naver/metrics/coalescing")
+async def coalescing_metrics():
+    return usecase.coalescing_stats()
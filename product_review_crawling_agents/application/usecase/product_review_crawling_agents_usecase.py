@@ -1,6 +1,15 @@
+from typing import Dict, List
+
+from config.cache.single_flight import get_single_flight
+from config.crawl_executor import DisconnectProbe, get_crawl_executor
+from product_review_collector.domain.product_url import normalize_product_url
+from product_review_collector.infrastructure.cache.crawl_result_cache import get_crawl_result_cache
 from product_review_crawling_agents.infrastructure.external.naver_product_crawling_agent import \
     get_naver_shopping_product_reviews
 
+# 크롤링 결과(리뷰 본문 + 별점 목록) 캐시 네임스페이스
+CRAWL_CACHE_NAMESPACE = "agents-reviews"
+
 
 class ProductReviewAgentsUseCase:
     __instance = None
@@ -18,5 +27,57 @@ class ProductReviewAgentsUseCase:
         return cls.__instance
 
     # TODO: 목적별로 UseCase 분리
-    async def crawling_naver_review_agents(self, product_url: str):
-        return get_naver_shopping_product_reviews(product_url)
+    async def crawling_naver_review_agents(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> Dict[int, str]:
+        """/naver 응답 형식: {번호: 리뷰 본문}."""
+        reviews = await self._crawl_coalesced(product_url, is_disconnected)
+        return {index: review["content"] for index, review in enumerate(reviews, start=1)}
+
+    async def crawling_naver_review_items(
+            self,
+            product_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> List[dict]:
+        """리뷰 요약 파이프라인용: [{"text": 본문, "rating": 별점}] (별점은 리뷰 선택 단계에서 사용)."""
+        reviews = await self._crawl_coalesced(product_url, is_disconnected)
+        return [{"text": review["content"], "rating": review.get("rating")} for review in reviews]
+
+    async def _crawl_coalesced(self, product_url: str, is_disconnected: DisconnectProbe | None) -> List[dict]:
+        # 같은 상품을 동시에 요청하면 크롤링은 한 번만 하고 결과를 함께 받음
+        return await get_single_flight("agents-crawl").do(
+            normalize_product_url(product_url),
+            lambda probe: self._crawl_or_cached(product_url, probe),
+            is_disconnected,
+        )
+
+    async def _crawl_or_cached(self, product_url: str, is_disconnected: DisconnectProbe | None):
+        # 캐시가 설정되어 있으면 같은 상품은 다시 크롤링하지 않음 (오래된 캐시는 백그라운드 갱신)
+        crawl_cache = get_crawl_result_cache(CRAWL_CACHE_NAMESPACE)
+        if crawl_cache is None:
+            return await self._crawl(product_url, is_disconnected)
+
+        return await crawl_cache.get_or_crawl(
+            product_url,
+            lambda probe: self._crawl(product_url, probe),
+            is_disconnected,
+        )
+
+    async def invalidate_naver_review_cache(self, product_url: str) -> bool:
+        crawl_cache = get_crawl_result_cache(CRAWL_CACHE_NAMESPACE)
+        if crawl_cache is None:
+            raise ValueError("crawl cache is disabled")
+        return await crawl_cache.invalidate(product_url)
+
+    def coalescing_stats(self) -> dict:
+        return get_single_flight("agents-crawl").stats()
+
+    async def _crawl(self, product_url: str, is_disconnected: DisconnectProbe | None):
+        # 블로킹 Selenium 크롤링은 이벤트 루프가 아닌 크롤링 전용 스레드 풀에서 실행
+        return await get_crawl_executor().run(
+            get_naver_shopping_product_reviews,
+            product_url,
+            is_disconnected=is_disconnected,
+        )
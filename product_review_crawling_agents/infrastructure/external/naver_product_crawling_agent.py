@@ -1,30 +1,33 @@
-import re
-import time
+import logging
+import threading
 import json
 
 import selenium.common
 from fastapi import HTTPException
-from typing import List
+from typing import Iterator, List
 
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 
+from config import crawler_config
+from config.crawl_executor import raise_if_cancelled
+from config.stage_timer import StageTimer
+from config.webdriver.waits import content_signature, wait_after_load, wait_for_content, wait_for_content_change
+from config.webdriver.webdriver_pool import get_chromedriver_path, get_webdriver_pool
+from product_review_collector.adapter.output.naver_review_html_parser import (
+    get_parser_executor,
+    parse_review_page,
+    parse_total_review_count,
+)
+from product_review_collector.adapter.output.naver_review_pagination import click_review_page, count_review_pages
 
-# TODO: Need to Refactor
-def analyze_naver_shopping_product_url_and_get_html_list(product_url: str) -> List[str]:
+logger = logging.getLogger(__name__)
 
-    def get_number_of_reviews_registered(html: str) -> int:
-        soup = BeautifulSoup(html, "html.parser")
-        return int(soup
-                   .find('div', {'class': 'J2bxvqM5w5'})
-                   .find('span', {'class': 'sFI4W1erDx'}).get_text()
-                   .replace(',', ''))
+REVIEW_ITEM_SELECTOR = "li.PxsZltB5tV"
 
-    html_list = []
 
+def _create_driver() -> webdriver.Chrome:
     # selenium 옵션 설정
     options = webdriver.ChromeOptions()
     # options.add_argument('headless')   # headless 로 실행시 동작 불가
@@ -35,51 +38,83 @@ def analyze_naver_shopping_product_url_and_get_html_list(product_url: str) -> Li
     options.add_argument("--no-sandbox")
 
     driver = webdriver.Chrome(options=options,
-                              service=Service(ChromeDriverManager().install()))
+                              service=Service(get_chromedriver_path()))
     driver.implicitly_wait(3)
+    return driver
 
-    try:
-        driver.get(product_url)
-        time.sleep(2)
 
-        # 전체 보기 클릭
-        review_all_selector = '#content > div > div.Q1bBXdV7RJ > div.K38C2T0Ypx > div.wKQQf4o3UG > div > a'
-        # TODO: 클릭 일부 안 되는 것은 어떻게 할 것인가?
-        # brand 대부분) #content > div > div.Q1bBXdV7RJ > div.K38C2T0Ypx > div.wKQQf4o3UG > div > a
-        # applestore) #content > div > div.ZgCvvTbvsN > div.K38C2T0Ypx > div.wKQQf4o3UG > div > a
+# TODO: Need to Refactor
+def iter_naver_shopping_product_review_html(
+        product_url: str,
+        cancel_event: threading.Event | None = None,
+        max_reviews: int | None = None,
+) -> Iterator[str]:
+    """리뷰 페이지 HTML 을 한 장씩 yield (수집 예산 max_reviews 기준으로 페이지 수 결정)."""
+    review_budget = max_reviews or crawler_config.REVIEW_CRAWL_MAX_REVIEWS
+    page_count = 0
+    timer = StageTimer("agents-crawl")
+
+    # 드라이버는 풀에서 대여하고, 반납 시 세션 초기화/재활용은 풀이 담당
+    with get_webdriver_pool("product-review-crawling-agents", _create_driver).lease() as driver:
+        try:
+            raise_if_cancelled(cancel_event)
+
+            # 전체 보기 클릭
+            review_all_selector = '#content > div > div.Q1bBXdV7RJ > div.K38C2T0Ypx > div.wKQQf4o3UG > div > a'
+            # TODO: 클릭 일부 안 되는 것은 어떻게 할 것인가?
+            # brand 대부분) #content > div > div.Q1bBXdV7RJ > div.K38C2T0Ypx > div.wKQQf4o3UG > div > a
+            # applestore) #content > div > div.ZgCvvTbvsN > div.K38C2T0Ypx > div.wKQQf4o3UG > div > a
+
+            with timer.stage("load"):
+                driver.get(product_url)
+                wait_after_load(driver, review_all_selector, legacy_sleep=2)
+
+            with timer.stage("open_reviews"):
+                driver.find_element(By.CSS_SELECTOR, review_all_selector).click()
+                wait_for_content(driver, REVIEW_ITEM_SELECTOR, legacy_sleep=1)
+
+            initial_html = driver.page_source
+
+            # 전체 리뷰수 & 수집 예산 기준 페이지 수 확인
+            total_review_count = parse_total_review_count(initial_html)
+            total_review_pages = count_review_pages(total_review_count, review_budget)
+            logger.info(f'상품 리뷰 전체 개수 : {total_review_count}, 수집 페이지 수 : {total_review_pages}')
+
+            page_count += 1
+            yield initial_html
+            del initial_html
 
-        driver.find_element(By.CSS_SELECTOR, review_all_selector).click()
-        time.sleep(1)
+            for page in range(2, total_review_pages + 1):
+                raise_if_cancelled(cancel_event)
+                with timer.stage("paginate"):
+                    previous_signature = content_signature(driver, REVIEW_ITEM_SELECTOR)
+                    click_review_page(driver, page)
+                    wait_for_content_change(driver, REVIEW_ITEM_SELECTOR, previous_signature, legacy_sleep=1)
+                    page_source = driver.page_source
 
-        initial_html = driver.page_source
-        if initial_html:
-            print(f'상품 URL 기반 HTML 로드 완료\n{initial_html}')
+                page_count += 1
+                yield page_source
 
-        # 전체 리뷰수 & 페이지 확인
-        total_review_count = min(get_number_of_reviews_registered(initial_html), 100)  # 100개 제한
-        total_review_pages = min(total_review_count // 20 + 1, 5)  # 100개 제한
-        print(f'상품 리뷰 전체 개수 : {total_review_count}, 상품 리뷰 페이지 수 : {total_review_pages}')
+        except selenium.common.NoSuchElementException as not_found_error:
+            raise HTTPException(status_code=500, detail=f"Element not found : {not_found_error}")
 
-        html_list.append(initial_html)
+        except selenium.common.exceptions.ElementNotInteractableException as interaction_error:
+            raise HTTPException(status_code=500, detail=f"Interaction failed: {interaction_error}")
 
-        for i in range(3, total_review_pages + 2):
-            driver.find_element(
-                By.CSS_SELECTOR,
-                f'#REVIEW > div > div.JHZoCyHfg7 > div.HTT4L8U0CU > div > div > a:nth-child({i})'
-            ).click()
-            time.sleep(1)
-            html_list.append(driver.page_source)
+        finally:
+            logger.info(f"{timer.summary()} strategy={crawler_config.CRAWL_WAIT_STRATEGY} pages={page_count}")
 
-        return html_list
 
-    except selenium.common.NoSuchElementException as not_found_error:
-        raise HTTPException(status_code=500, detail=f"Element not found : {not_found_error}")
+def analyze_naver_shopping_product_url_and_get_html_list(
+        product_url: str,
+        cancel_event: threading.Event | None = None,
+) -> List[str]:
+    return list(iter_naver_shopping_product_review_html(product_url, cancel_event))
 
-    except selenium.common.exceptions.ElementNotInteractableException as interaction_error:
-        raise HTTPException(status_code=500, detail=f"Interaction failed: {interaction_error}")
 
-    finally:
-        driver.quit()
+def parse_review_html(review_html: str) -> List[str]:
+    return [review["content"] for review in parse_review_page(review_html)]
+
 
 def parse_reviews_from_html_list(review_html_list: List[str]) -> dict:
 
@@ -87,26 +122,41 @@ def parse_reviews_from_html_list(review_html_list: List[str]) -> dict:
         raise HTTPException(status_code=404, detail="Fail to load HTML from given URL")
 
     reviews_dict = {}
-    review_count = 1
-
     for review_html in review_html_list:
-        soup = BeautifulSoup(review_html, "html.parser")
-        review_items = soup.findAll('li', {'class': "PxsZltB5tV _nlog_click _nlog_impression_element"})
+        for review_content in parse_review_html(review_html):
+            reviews_dict[len(reviews_dict) + 1] = review_content
 
-        for review in range(len(review_items)):
-            review_content_raw = (
-                review_items[review]
-                .findAll('div', {'class': 'KqJ8Qqw082'})[0]
-                .find('span', {'class': 'MX91DFZo2F'}).get_text())
-            review_content = re.sub(' +', ' ', re.sub('\n', ' ', review_content_raw))
+    return reviews_dict
 
-            reviews_dict[review_count] = review_content
-            review_count += 1
 
-    print(f'reviews: {reviews_dict}')
-    return reviews_dict
+def parse_review_items(review_html: str) -> List[dict]:
+    # 요약 단계에서 별점 분포를 유지할 수 있도록 본문과 별점을 함께 넘김
+    return [{"content": review["content"], "rating": review["rating"]} for review in parse_review_page(review_html)]
+
+
+def get_naver_shopping_product_reviews(
+        product_url: str,
+        cancel_event: threading.Event | None = None,
+        max_reviews: int | None = None,
+) -> List[dict]:
+    # 페이지 HTML 은 받는 즉시 파싱 워커 풀에 넘기고 다음 페이지로 이동 (파싱과 브라우저 이동을 겹침)
+    review_budget = max_reviews or crawler_config.REVIEW_CRAWL_MAX_REVIEWS
+    parser_executor = get_parser_executor()
+    parse_futures = []
+
+    try:
+        for review_html in iter_naver_shopping_product_review_html(product_url, cancel_event, review_budget):
+            parse_futures.append(parser_executor.submit(parse_review_items, review_html))
+    except BaseException:
+        for future in parse_futures:
+            future.cancel()
+        raise
+
+    if not parse_futures:
+        raise HTTPException(status_code=404, detail="Fail to load HTML from given URL")
+
+    reviews: List[dict] = []
+    for future in parse_futures:
+        reviews.extend(future.result()[:review_budget - len(reviews)])
 
-def get_naver_shopping_product_reviews(product_url: str) -> dict:
-    naver_shopping_product_review_html_list = analyze_naver_shopping_product_url_and_get_html_list(product_url)
-    reviews_dictionary = parse_reviews_from_html_list(naver_shopping_product_review_html_list)
-    return reviews_dictionary
+    return reviews
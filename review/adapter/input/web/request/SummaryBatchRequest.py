@@ -0,0 +1,9 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from review.adapter.input.web.request.SummaryRequest import SummaryRequest
+
+
+class SummaryBatchRequest(BaseModel):
+    products: List[SummaryRequest] = Field(..., description="배치로 요약할 상품 목록")
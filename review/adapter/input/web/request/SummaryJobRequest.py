@@ -0,0 +1,9 @@
+from typing import Optional
+
+from pydantic import AnyHttpUrl, Field
+
+from review.adapter.input.web.request.SummaryRequest import SummaryRequest
+
+
+class SummaryJobRequest(SummaryRequest):
+    webhook_url: Optional[AnyHttpUrl] = Field(None, description="작업 완료/실패 시 상태를 POST 받을 https URL")
@@ -0,0 +1,23 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from review.adapter.input.web.response.SummaryResponse import ProductSummary
+
+
+class SummaryBatchItemResponse(BaseModel):
+    info_url: str
+    status: str
+    product_summary: Optional[ProductSummary] = None
+    error: Optional[str] = None
+
+
+class SummaryBatchResponse(BaseModel):
+    batch_id: str
+    status: str
+    stage: Optional[str] = None
+    provider_batch_id: Optional[str] = None
+    items: List[SummaryBatchItemResponse]
+    error: Optional[str] = None
+    created_at: float
+    updated_at: float
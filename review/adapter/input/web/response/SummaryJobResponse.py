@@ -0,0 +1,15 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from review.adapter.input.web.response.SummaryResponse import SummaryResponse
+
+
+class SummaryJobResponse(BaseModel):
+    job_id: str
+    status: str
+    stage: Optional[str] = None
+    result: Optional[SummaryResponse] = None
+    error: Optional[str] = None
+    created_at: float
+    updated_at: float
@@ -1,79 +1,273 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Callable, Dict
 
-from product_review_crawling_agents.application.usecase.product_review_crawling_agents_usecase import (
-    ProductReviewAgentsUseCase,
-)
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+
+from config import review_config
+from config.cache.single_flight import SingleFlight, SingleFlightTimeoutError
+from config.crawl_executor import CrawlCancelledError, CrawlTimeoutError
+from config.stage_timer import format_server_timing
+
+from product_review_collector.domain.product_url import normalize_product_url
+from review.adapter.input.web.request.SummaryBatchRequest import SummaryBatchRequest
+from review.adapter.input.web.request.SummaryJobRequest import SummaryJobRequest
 from review.adapter.input.web.request.SummaryRequest import SummaryRequest
+from review.adapter.input.web.response.SummaryBatchResponse import SummaryBatchItemResponse, SummaryBatchResponse
+from review.adapter.input.web.response.SummaryJobResponse import SummaryJobResponse
 from review.adapter.input.web.response.SummaryResponse import ProductSummary, SummaryResponse
-from review.application.usecase.pdf_usecase import PdfUseCase
-from review.application.usecase.preprocess_usecase import PreprocessUseCase
-from review.application.usecase.summarize_usecase import SummarizeUseCase
-from review.domain.pdf_document import PdfDocument
+from review.application.usecase.review_summary_pipeline_usecase import ReviewSummaryPipelineUseCase
+from review.application.usecase.summary_batch_usecase import SummaryBatchUseCase
+from review.application.usecase.summary_job_usecase import SummaryJobUseCase
+from review.domain.summary_batch import SummaryBatch
+from review.domain.summary_job import SummaryJob
+
+logger = logging.getLogger(__name__)
 
 review_router = APIRouter()
 
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+async def _sse_with_keepalive(
+    events: AsyncIterator[Dict[str, Any]],
+    event_name: Callable[[Dict[str, Any]], str],
+) -> AsyncIterator[str]:
+    """이벤트를 SSE 형식으로 전달. 다음 이벤트가 늦으면 keep-alive 주석 전송 (이벤트 대기는 취소하지 않음)."""
+    next_event = asyncio.ensure_future(events.__anext__())
+    try:
+        while True:
+            done, _ = await asyncio.wait({next_event}, timeout=review_config.REVIEW_JOB_SSE_KEEPALIVE_SECONDS)
+            if not done:
+                # 프록시가 유휴 연결을 끊지 않도록 주석 라인 전송
+                yield ": keep-alive\n\n"
+                continue
+            try:
+                event = next_event.result()
+            except StopAsyncIteration:
+                return
+            yield f"event: {event_name(event)}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+            next_event = asyncio.ensure_future(events.__anext__())
+    finally:
+        next_event.cancel()
+        await asyncio.gather(next_event, return_exceptions=True)
+        await events.aclose()
+
+
+def _to_product_summary(name: str, price: str, summary_result: dict) -> ProductSummary:
+    return ProductSummary(
+        name=name,
+        price=price,
+        summary=summary_result["summary"],
+        positive_features=summary_result["positive_features"],
+        negative_features=summary_result["negative_features"],
+        keywords=summary_result["keywords"],
+    )
+
 
-def get_review_crawling_usecase() -> ProductReviewAgentsUseCase:
+def _to_summary_response(name: str, price: str, result: dict) -> SummaryResponse:
+    return SummaryResponse(
+        product_summary=_to_product_summary(name, price, result["summary"]),
+        pdf_url=result["pdf_url"],
+    )
+
+
+def get_summary_pipeline_usecase() -> ReviewSummaryPipelineUseCase:
     # Provided via dependency override in review.bootstrap.setup_module
-    raise RuntimeError("ProductReviewAgentsUseCase dependency is not wired")
+    raise RuntimeError("ReviewSummaryPipelineUseCase dependency is not wired")
 
 
-def get_preprocess_usecase() -> PreprocessUseCase:
+def get_summary_job_usecase() -> SummaryJobUseCase:
     # Provided via dependency override in review.bootstrap.setup_module
-    raise RuntimeError("PreprocessUseCase dependency is not wired")
+    raise RuntimeError("SummaryJobUseCase dependency is not wired")
 
 
-def get_summarize_usecase() -> SummarizeUseCase:
+def get_summary_batch_usecase() -> SummaryBatchUseCase:
     # Provided via dependency override in review.bootstrap.setup_module
-    raise RuntimeError("SummarizeUseCase dependency is not wired")
+    raise RuntimeError("SummaryBatchUseCase dependency is not wired")
 
 
-def get_pdf_usecase() -> PdfUseCase:
+def get_summary_single_flight() -> SingleFlight:
     # Provided via dependency override in review.bootstrap.setup_module
-    raise RuntimeError("PdfUseCase dependency is not wired")
+    raise RuntimeError("SingleFlight dependency is not wired")
 
 
 @review_router.post("/summary", response_model=SummaryResponse)
 async def analyze_product(
     data: SummaryRequest,
-    crawler: ProductReviewAgentsUseCase = Depends(get_review_crawling_usecase),
-    preprocess_usecase: PreprocessUseCase = Depends(get_preprocess_usecase),
-    summarize_usecase: SummarizeUseCase = Depends(get_summarize_usecase),
-    pdf_usecase: PdfUseCase = Depends(get_pdf_usecase),
+    request: Request,
+    response: Response,
+    pipeline: ReviewSummaryPipelineUseCase = Depends(get_summary_pipeline_usecase),
+    single_flight: SingleFlight = Depends(get_summary_single_flight),
 ):
-    # 1. 크롤링
-    raw_reviews = await crawler.crawling_naver_review_agents(data.info_url)
+    started_at = time.perf_counter()
 
-    # 2. 전처리
-    preprocessed_data = preprocess_usecase.execute(raw_reviews)
-    preprocessed_text = " ".join(item["text"] for item in preprocessed_data["clean_reviews"])
+    # 같은 상품의 동시 요청은 크롤링~요약을 한 번만 수행하고 결과를 공유
+    flight_key = f"{normalize_product_url(data.info_url)}|{data.name}|{data.price}"
+    try:
+        result = await single_flight.do(
+            flight_key,
+            lambda probe: pipeline.run(data.name, data.price, data.info_url, is_disconnected=probe),
+            request.is_disconnected,
+        )
+    except (CrawlTimeoutError, SingleFlightTimeoutError) as exc:
+        raise HTTPException(status_code=504, detail=str(exc))
+    except CrawlCancelledError as exc:
+        raise HTTPException(status_code=499, detail=str(exc))
 
-    # 3. 요약
-    summary_result = summarize_usecase.summarize_review(data.name, preprocessed_text)
+    # 합쳐진 요청은 실제로 실행한 요청의 단계별 시간을 그대로 전달
+    response.headers["Server-Timing"] = format_server_timing(
+        {**result.get("timings", {}), "total": time.perf_counter() - started_at}
+    )
+    # 리뷰 선택 단계에서 줄인 프롬프트 토큰 수
+    response.headers["X-Review-Tokens-Saved"] = str(result.get("selection", {}).get("tokens_saved", 0))
 
-    # 4. PDF 생성 + S3 업로드
-    pdf_document = PdfDocument(
-        name=data.name,
-        price=data.price,
-        summary=summary_result["summary"],
-        positive_features=summary_result["positive_features"],
-        negative_features=summary_result["negative_features"],
-        keywords=summary_result["keywords"],
+    return _to_summary_response(data.name, data.price, result)
+
+
+@review_router.post("/summary/stream")
+async def stream_product_summary(
+    data: SummaryRequest,
+    request: Request,
+    pipeline: ReviewSummaryPipelineUseCase = Depends(get_summary_pipeline_usecase),
+):
+    """
+    /summary 의 SSE 버전: progress(crawl/preprocess/summarize) → token(요약 JSON 조각) → result(최종 JSON)
+    실패하면 error 이벤트(status, detail)로 종료
+    """
+
+    async def events():
+        try:
+            async for event in pipeline.stream(data.name, data.price, data.info_url, is_disconnected=request.is_disconnected):
+                if event["event"] == "result":
+                    # 최종 이벤트는 /summary 응답의 product_summary 와 같은 형태
+                    summary_result = event.pop("summary")
+                    event["product_summary"] = {"name": data.name, "price": data.price, **summary_result}
+                yield event
+        except CrawlCancelledError:
+            return
+        except CrawlTimeoutError as exc:
+            yield {"event": "error", "status": 504, "detail": str(exc)}
+        except Exception as exc:
+            logger.error(f"요약 스트리밍 중 오류: {type(exc).__name__} - {exc}")
+            yield {"event": "error", "status": 500, "detail": "summary stream failed"}
+
+    return StreamingResponse(
+        _sse_with_keepalive(events(), lambda event: event["event"]),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
     )
 
-    pdf_result = pdf_usecase.execute(pdf_document)
 
-    return SummaryResponse(
-        product_summary=ProductSummary(
-            name=data.name,
-            price=data.price,
-            summary=summary_result["summary"],
-            positive_features=summary_result["positive_features"],
-            negative_features=summary_result["negative_features"],
-            keywords=summary_result["keywords"],
-        ),
-        pdf_url=pdf_result["url"],
+@review_router.get("/metrics/coalescing")
+async def coalescing_metrics(single_flight: SingleFlight = Depends(get_summary_single_flight)):
+    return single_flight.stats()
+
+
+@review_router.get("/metrics/summary-cache")
+async def summary_cache_metrics(pipeline: ReviewSummaryPipelineUseCase = Depends(get_summary_pipeline_usecase)):
+    return pipeline.summarize_usecase.cache_stats()
+
+
+def _to_job_response(job: SummaryJob) -> SummaryJobResponse:
+    return SummaryJobResponse(
+        job_id=job.job_id,
+        status=job.status,
+        stage=job.stage,
+        result=_to_summary_response(job.name, job.price, job.result) if job.result else None,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
     )
 
 
+@review_router.post("/jobs", response_model=SummaryJobResponse, status_code=202)
+async def submit_summary_job(
+    data: SummaryJobRequest,
+    job_usecase: SummaryJobUseCase = Depends(get_summary_job_usecase),
+):
+    webhook_url = str(data.webhook_url) if data.webhook_url else None
+    try:
+        job = await job_usecase.submit(data.name, data.price, data.info_url, webhook_url=webhook_url)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    return _to_job_response(job)
+
+
+@review_router.get("/jobs/{job_id}", response_model=SummaryJobResponse)
+async def get_summary_job(
+    job_id: str,
+    job_usecase: SummaryJobUseCase = Depends(get_summary_job_usecase),
+):
+    job = await job_usecase.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    return _to_job_response(job)
+
 
+@review_router.get("/jobs/{job_id}/events")
+async def stream_summary_job_events(
+    job_id: str,
+    job_usecase: SummaryJobUseCase = Depends(get_summary_job_usecase),
+):
+    if await job_usecase.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="job not found")
+
+    return StreamingResponse(
+        _sse_with_keepalive(job_usecase.events(job_id), lambda event: event["status"]),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+def _to_batch_response(batch: SummaryBatch) -> SummaryBatchResponse:
+    return SummaryBatchResponse(
+        batch_id=batch.batch_id,
+        status=batch.status,
+        stage=batch.stage,
+        provider_batch_id=batch.provider_batch_id,
+        items=[
+            SummaryBatchItemResponse(
+                info_url=item.info_url,
+                status=item.status,
+                product_summary=_to_product_summary(item.name, item.price, item.summary) if item.summary else None,
+                error=item.error,
+            )
+            for item in batch.items
+        ],
+        error=batch.error,
+        created_at=batch.created_at,
+        updated_at=batch.updated_at,
+    )
+
+
+@review_router.post("/batches", response_model=SummaryBatchResponse, status_code=202)
+async def submit_summary_batch(
+    data: SummaryBatchRequest,
+    batch_usecase: SummaryBatchUseCase = Depends(get_summary_batch_usecase),
+):
+    # 결과 요약은 요약 캐시에도 기록되므로 이후 /summary 요청은 LLM 호출 없이 응답
+    if not data.products:
+        raise HTTPException(status_code=422, detail="products must not be empty")
+    if len(data.products) > review_config.REVIEW_BATCH_MAX_PRODUCTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"too many products (max {review_config.REVIEW_BATCH_MAX_PRODUCTS})",
+        )
+
+    batch = batch_usecase.submit([(product.name, product.price, product.info_url) for product in data.products])
+    return _to_batch_response(batch)
+
+
+@review_router.get("/batches/{batch_id}", response_model=SummaryBatchResponse)
+async def get_summary_batch(
+    batch_id: str,
+    batch_usecase: SummaryBatchUseCase = Depends(get_summary_batch_usecase),
+):
+    batch = batch_usecase.get(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="batch not found")
+    return _to_batch_response(batch)
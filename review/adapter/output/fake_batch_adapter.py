@@ -0,0 +1,29 @@
+import json
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from review.application.port.batch_llm_port import BATCH_COMPLETED, BatchLLMPort, BatchPrompt
+from review.infrastructure.client.fake_streaming_client import FAKE_SUMMARY
+
+
+def _default_response(prompt: str) -> str:
+    return json.dumps(FAKE_SUMMARY, ensure_ascii=False)
+
+
+class FakeBatchAdapter(BatchLLMPort):
+    """로컬 테스트용 배치 백엔드: 제출 즉시 respond(prompt) 로 결과를 만들어 완료 상태로 둔다."""
+
+    def __init__(self, respond: Callable[[str], Optional[str]] = _default_response):
+        self._respond = respond
+        self._batches: Dict[str, Dict[str, Optional[str]]] = {}
+
+    async def submit(self, prompts: List[BatchPrompt]) -> str:
+        batch_id = f"fake-batch-{uuid.uuid4().hex}"
+        self._batches[batch_id] = {item.custom_id: self._respond(item.prompt) for item in prompts}
+        return batch_id
+
+    async def status(self, batch_id: str) -> str:
+        return BATCH_COMPLETED
+
+    async def results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        return dict(self._batches.get(batch_id, {}))
@@ -0,0 +1,69 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from review.application.port.job_broker_port import JobBrokerPort
+from review.domain.summary_job import SummaryJob
+
+
+class InMemoryJobBroker(JobBrokerPort):
+    """프로세스 로컬 브로커. 테스트 및 단일 워커 환경용 (재시작 시 작업 유실)."""
+
+    def __init__(self):
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._processing: Set[str] = set()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    async def enqueue(self, job: SummaryJob) -> None:
+        await self.save(job)
+        await self._queue.put(job.job_id)
+
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        try:
+            job_id = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._processing.add(job_id)
+        return job_id
+
+    async def ack(self, job_id: str) -> None:
+        self._processing.discard(job_id)
+
+    async def requeue(self, job_id: str) -> None:
+        if job_id in self._processing:
+            self._processing.discard(job_id)
+            await self._queue.put(job_id)
+
+    async def keepalive(self) -> int:
+        # 다른 워커가 없으므로 되돌릴 작업도 없음
+        return 0
+
+    async def save(self, job: SummaryJob) -> None:
+        self._jobs[job.job_id] = job.to_dict()
+
+    async def load(self, job_id: str) -> Optional[SummaryJob]:
+        data = self._jobs.get(job_id)
+        return SummaryJob.from_dict(dict(data)) if data is not None else None
+
+    async def publish(self, job_id: str, event: Dict[str, Any]) -> None:
+        for subscriber in self._subscribers.get(job_id, ()):
+            subscriber.put_nowait(event)
+
+    @asynccontextmanager
+    async def subscribe(self, job_id: str) -> AsyncIterator[AsyncIterator[Dict[str, Any]]]:
+        subscriber: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, set()).add(subscriber)
+
+        async def events() -> AsyncIterator[Dict[str, Any]]:
+            while True:
+                yield await subscriber.get()
+
+        try:
+            yield events()
+        finally:
+            subscribers = self._subscribers.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[job_id]
@@ -1,24 +1,62 @@
+import asyncio
 import logging
 import time
+from typing import AsyncIterator, Optional, Sequence
 from review.application.port.llm_port import LLMPort
+from review.infrastructure.token_counter import count_tokens
+from config.openai.rate_limit import AsyncTokenBucket, CircuitBreaker, CircuitOpenError, backoff_delay
 from openai import APIError
 
 logger = logging.getLogger(__name__)
 
+EMPTY_SUMMARY_JSON = '{"summary": "", "positive_features": "", "negative_features": "", "keywords": []}'
+
+
+def _is_retryable(error: APIError) -> bool:
+    # 상태 코드가 없으면 연결 오류/타임아웃
+    status_code = getattr(error, "status_code", None)
+    return status_code is None or status_code == 429 or status_code >= 500
+
+
+def _retry_after(error: APIError) -> str | None:
+    response = getattr(error, "response", None)
+    return response.headers.get("retry-after") if response is not None else None
+
 
 class LLMAdapter(LLMPort):
 
-    def __init__(self, client, max_retries: int = 2):
+    def __init__(
+            self,
+            client,
+            max_retries: int = 2,
+            *,
+            request_bucket: AsyncTokenBucket | None = None,
+            token_bucket: AsyncTokenBucket | None = None,
+            circuit_breaker: CircuitBreaker | None = None,
+            backoff_base: float = 1.0,
+            backoff_max: float = 30.0,
+    ):
         """
         max_retries: LLM 호출 실패 시 최대 재시도 횟수
+        request_bucket / token_bucket: 분당 요청 수 / 토큰 수 제한 (summarize_async 에만 적용)
+        circuit_breaker: 연속 실패 시 일정 시간 호출 차단
         """
         self.client = client
         self.max_retries = max_retries
+        self.request_bucket = request_bucket
+        self.token_bucket = token_bucket
+        self.circuit_breaker = circuit_breaker
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
 
-    def summarize(self, prompt: str) -> str:
+    @property
+    def model_name(self) -> str:
+        return getattr(self.client, "model", LLMPort.model_name)
+
+    def summarize(self, prompt: str, fields: Optional[Sequence[str]] = None) -> str:
         for attempt in range(self.max_retries + 1):
             try:
-                result = self.client.call_openai(prompt)
+                result = self.client.call_openai(prompt, fields)
                 logger.debug(f"LLM 호출 성공 (attempt {attempt})")
                 return result
             except APIError as e:
@@ -29,7 +67,129 @@ class LLMAdapter(LLMPort):
                 else:
                     logger.error(f"LLM 호출 최종 실패: {str(e)}")
                     # 안전하게 빈 JSON 문자열 반환
-                    return '{"summary": "", "positive_features": "", "negative_features": "", "keywords": []}'
+                    return EMPTY_SUMMARY_JSON
+            except Exception as e:
+                logger.error(f"예상치 못한 오류 발생: {type(e).__name__} - {str(e)}")
+                return EMPTY_SUMMARY_JSON
+
+    async def summarize_async(self, prompt: str, fields: Optional[Sequence[str]] = None) -> str:
+        # 예상 토큰 = 프롬프트 + 최대 출력 토큰 (TPM 버킷 차감용)
+        estimated_tokens = count_tokens(prompt, self.model_name) + getattr(self.client, "max_tokens", 0)
+
+        for attempt in range(self.max_retries + 1):
+            if not await self._acquire(estimated_tokens):
+                return EMPTY_SUMMARY_JSON
+
+            try:
+                result = await self.client.call_openai_async(prompt, fields)
+            except asyncio.CancelledError:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.release_trial()
+                raise
+            except APIError as e:
+                if not _is_retryable(e):
+                    # 요청 자체의 문제(4xx)는 재시도/서킷 집계 대상이 아님
+                    if self.circuit_breaker is not None:
+                        self.circuit_breaker.release_trial()
+                    logger.error(f"LLM 호출 실패 (재시도 불가): {str(e)}")
+                    return EMPTY_SUMMARY_JSON
+
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                if attempt < self.max_retries:
+                    wait_time = backoff_delay(
+                        attempt,
+                        base=self.backoff_base,
+                        cap=self.backoff_max,
+                        retry_after=_retry_after(e),
+                    )
+                    logger.warning(f"LLM 호출 실패, {wait_time:.1f}초 후 재시도 {attempt + 1}/{self.max_retries}: {str(e)}")
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error(f"LLM 호출 최종 실패: {str(e)}")
+                    return EMPTY_SUMMARY_JSON
             except Exception as e:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.release_trial()
                 logger.error(f"예상치 못한 오류 발생: {type(e).__name__} - {str(e)}")
-                return '{"summary": "", "positive_features": "", "negative_features": "", "keywords": []}'
\ No newline at end of file
+                return EMPTY_SUMMARY_JSON
+            else:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+                logger.debug(f"LLM 호출 성공 (attempt {attempt})")
+                return result
+
+        return EMPTY_SUMMARY_JSON
+
+    async def stream_async(self, prompt: str) -> AsyncIterator[str]:
+        """
+        스트리밍 요약: 호출 제한/서킷 브레이커는 summarize_async 와 동일
+        첫 조각을 받기 전 실패만 재시도하고, 도중에 끊기면 받은 데이터까지만 전달 (잘린 JSON 은 use case 에서 보정)
+        """
+        estimated_tokens = count_tokens(prompt, self.model_name) + getattr(self.client, "max_tokens", 0)
+
+        for attempt in range(self.max_retries + 1):
+            if not await self._acquire(estimated_tokens):
+                yield EMPTY_SUMMARY_JSON
+                return
+
+            emitted = settled = False
+            try:
+                async for delta in self.client.stream_openai_async(prompt):
+                    emitted = True
+                    yield delta
+            except APIError as e:
+                settled = True
+                if not _is_retryable(e):
+                    # 요청 자체의 문제(4xx)는 재시도/서킷 집계 대상이 아님
+                    if self.circuit_breaker is not None:
+                        self.circuit_breaker.release_trial()
+                elif self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+
+                if emitted or not _is_retryable(e) or attempt >= self.max_retries:
+                    logger.error(f"LLM 스트리밍 중단: {str(e)}")
+                    if not emitted:
+                        yield EMPTY_SUMMARY_JSON
+                    return
+
+                wait_time = backoff_delay(
+                    attempt,
+                    base=self.backoff_base,
+                    cap=self.backoff_max,
+                    retry_after=_retry_after(e),
+                )
+                logger.warning(f"LLM 스트리밍 실패, {wait_time:.1f}초 후 재시도 {attempt + 1}/{self.max_retries}: {str(e)}")
+                await asyncio.sleep(wait_time)
+            except Exception as e:
+                settled = True
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.release_trial()
+                logger.error(f"예상치 못한 오류 발생: {type(e).__name__} - {str(e)}")
+                if not emitted:
+                    yield EMPTY_SUMMARY_JSON
+                return
+            else:
+                settled = True
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+                return
+            finally:
+                # 소비자가 스트림을 닫거나 취소된 경우
+                if not settled and self.circuit_breaker is not None:
+                    self.circuit_breaker.release_trial()
+
+    async def _acquire(self, estimated_tokens: int) -> bool:
+        """서킷 브레이커 확인 + 분당 요청/토큰 버킷 차감. 서킷이 열려 있으면 False."""
+        if self.circuit_breaker is not None:
+            try:
+                self.circuit_breaker.before_call()
+            except CircuitOpenError:
+                logger.error("LLM 서킷 브레이커 열림, 호출 생략")
+                return False
+
+        if self.request_bucket is not None:
+            await self.request_bucket.acquire(1)
+        if self.token_bucket is not None:
+            await self.token_bucket.acquire(estimated_tokens)
+        return True
@@ -0,0 +1,80 @@
+import json
+import logging
+from typing import Dict, List, Optional
+
+from review.application.port.batch_llm_port import (
+    BATCH_COMPLETED,
+    BATCH_FAILED,
+    BATCH_IN_PROGRESS,
+    BatchLLMPort,
+    BatchPrompt,
+)
+from review.infrastructure.client.openai_client import summary_response_format
+
+logger = logging.getLogger(__name__)
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+_FAILED_STATUSES = {"failed", "expired", "cancelled", "cancelling"}
+
+
+class OpenAIBatchAdapter(BatchLLMPort):
+    """OpenAI Batch API: 프롬프트를 JSONL 파일로 올리고 24시간 완료 창으로 배치 실행 (동기 호출보다 저렴)."""
+
+    def __init__(self, async_openai_client, *, model: str, max_tokens: int):
+        self.client = async_openai_client
+        self.model = model
+        self.max_tokens = max_tokens
+
+    async def submit(self, prompts: List[BatchPrompt]) -> str:
+        lines = [
+            json.dumps({
+                "custom_id": item.custom_id,
+                "method": "POST",
+                "url": CHAT_COMPLETIONS_ENDPOINT,
+                "body": {
+                    "model": self.model,
+                    "messages": [{"role": "user", "content": item.prompt}],
+                    "max_tokens": self.max_tokens,
+                    "temperature": 0,
+                    "response_format": summary_response_format(),
+                },
+            }, ensure_ascii=False)
+            for item in prompts
+        ]
+        input_file = await self.client.files.create(
+            file=("review-summary-batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=CHAT_COMPLETIONS_ENDPOINT,
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def status(self, batch_id: str) -> str:
+        batch = await self.client.batches.retrieve(batch_id)
+        if batch.status == "completed":
+            return BATCH_COMPLETED
+        if batch.status in _FAILED_STATUSES:
+            return BATCH_FAILED
+        return BATCH_IN_PROGRESS
+
+    async def results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        batch = await self.client.batches.retrieve(batch_id)
+        if not batch.output_file_id:
+            return {}
+
+        content = await self.client.files.content(batch.output_file_id)
+        results: Dict[str, Optional[str]] = {}
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                logger.warning(f"배치 요청 실패 ({record.get('custom_id')}): {record.get('error')}")
+                results[record["custom_id"]] = None
+                continue
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return results
@@ -0,0 +1,114 @@
+import json
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from review.application.port.job_broker_port import JobBrokerPort
+from review.domain.summary_job import SummaryJob
+
+QUEUE_KEY = "review:jobs:queue"
+WORKERS_KEY = "review:jobs:workers"
+
+# 처리 중 목록에 있을 때만 큐 앞쪽으로 되돌림 (이미 ack 되었거나 다른 워커가 회수한 작업은 중복으로 넣지 않음)
+_REQUEUE_SCRIPT = """
+if redis.call("lrem", KEYS[1], 1, ARGV[1]) == 1 then
+    return redis.call("lpush", KEYS[2], ARGV[1])
+end
+return 0
+"""
+
+
+class RedisJobBroker(JobBrokerPort):
+    """
+    config.redis_config 의 Redis 를 사용하는 브로커 (워커 간 공유)
+    - 큐: list (RPUSH / BLMOVE). 꺼낸 작업은 워커별 처리 중 list 로 옮겨두고 ack 시 제거
+    - 워커마다 heartbeat_ttl 짜리 생존 키를 keepalive 로 갱신. 생존 키가 만료된(죽은) 워커의
+      처리 중 list 는 다른 워커가 큐 앞쪽으로 되돌려 작업이 유실되지 않음
+    - 상태: review:jobs:{id} 에 JSON, ttl 후 만료
+    - 진행 이벤트: review:jobs:{id}:events 채널 pub/sub
+    """
+
+    def __init__(self, redis_client, *, ttl_seconds: int, heartbeat_ttl_seconds: int, worker_id: Optional[str] = None):
+        self._redis = redis_client
+        self._ttl_seconds = ttl_seconds
+        self._heartbeat_ttl_seconds = max(1, heartbeat_ttl_seconds)
+        self.worker_id = worker_id or uuid.uuid4().hex
+
+    @staticmethod
+    def _job_key(job_id: str) -> str:
+        return f"review:jobs:{job_id}"
+
+    @staticmethod
+    def _channel(job_id: str) -> str:
+        return f"review:jobs:{job_id}:events"
+
+    @staticmethod
+    def _processing_key(worker_id: str) -> str:
+        return f"review:jobs:processing:{worker_id}"
+
+    @staticmethod
+    def _heartbeat_key(worker_id: str) -> str:
+        return f"review:jobs:workers:{worker_id}"
+
+    async def enqueue(self, job: SummaryJob) -> None:
+        await self.save(job)
+        await self._redis.rpush(QUEUE_KEY, job.job_id)
+
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        return await self._redis.blmove(
+            QUEUE_KEY,
+            self._processing_key(self.worker_id),
+            max(1, int(timeout)),
+            src="LEFT",
+            dest="RIGHT",
+        )
+
+    async def ack(self, job_id: str) -> None:
+        await self._redis.lrem(self._processing_key(self.worker_id), 1, job_id)
+
+    async def requeue(self, job_id: str) -> None:
+        await self._redis.eval(_REQUEUE_SCRIPT, 2, self._processing_key(self.worker_id), QUEUE_KEY, job_id)
+
+    async def keepalive(self) -> int:
+        await self._redis.set(self._heartbeat_key(self.worker_id), "1", ex=self._heartbeat_ttl_seconds)
+        await self._redis.sadd(WORKERS_KEY, self.worker_id)
+
+        recovered = 0
+        for worker_id in await self._redis.smembers(WORKERS_KEY):
+            if worker_id == self.worker_id or await self._redis.exists(self._heartbeat_key(worker_id)):
+                continue
+            # LMOVE 는 항목 단위로 원자적이라 여러 워커가 동시에 회수해도 작업이 중복되지 않음
+            while await self._redis.lmove(self._processing_key(worker_id), QUEUE_KEY, src="RIGHT", dest="LEFT"):
+                recovered += 1
+            await self._redis.srem(WORKERS_KEY, worker_id)
+        return recovered
+
+    async def save(self, job: SummaryJob) -> None:
+        await self._redis.set(
+            self._job_key(job.job_id),
+            json.dumps(job.to_dict(), ensure_ascii=False),
+            ex=self._ttl_seconds,
+        )
+
+    async def load(self, job_id: str) -> Optional[SummaryJob]:
+        raw = await self._redis.get(self._job_key(job_id))
+        return SummaryJob.from_dict(json.loads(raw)) if raw is not None else None
+
+    async def publish(self, job_id: str, event: Dict[str, Any]) -> None:
+        await self._redis.publish(self._channel(job_id), json.dumps(event, ensure_ascii=False))
+
+    @asynccontextmanager
+    async def subscribe(self, job_id: str) -> AsyncIterator[AsyncIterator[Dict[str, Any]]]:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self._channel(job_id))
+
+        async def events() -> AsyncIterator[Dict[str, Any]]:
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    yield json.loads(message["data"])
+
+        try:
+            yield events()
+        finally:
+            await pubsub.unsubscribe(self._channel(job_id))
+            await pubsub.aclose()
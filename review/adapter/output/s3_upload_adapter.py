@@ -30,6 +30,7 @@ class S3UploaderAdapter(StoragePort):
             ContentType="application/pdf"
         )
 
-        static_url = f"https://{self.bucket}.s3.{AWS_REGION}.amazonaws.com/{filename}"
+        return self.url_for(filename)
 
-        return static_url
\ No newline at end of file
+    def url_for(self, filename: str) -> str:
+        return f"https://{self.bucket}.s3.{AWS_REGION}.amazonaws.com/{filename}"
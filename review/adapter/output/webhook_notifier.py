@@ -0,0 +1,93 @@
+import asyncio
+import ipaddress
+import logging
+import socket
+from typing import Any, Dict, FrozenSet, Iterable
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookUrlError(ValueError):
+    pass
+
+
+class WebhookNotifier:
+    """
+    작업 완료/실패 시 클라이언트가 등록한 URL 로 작업 상태를 POST (실패 시 지수 백오프 재시도)
+    - https 만 허용
+    - allowed_hosts 가 있으면 그 호스트로만 전송, 없으면 호스트가 사설/루프백/링크로컬 등
+      공인 주소가 아닌 곳으로 해석되면 거부 (SSRF 방지, 등록 시와 전송 직전에 각각 확인)
+    - 리다이렉트는 따라가지 않음
+    """
+
+    def __init__(
+            self,
+            client: httpx.AsyncClient | None = None,
+            *,
+            timeout: float,
+            max_retries: int,
+            allowed_hosts: Iterable[str] = (),
+    ):
+        self._client = client or httpx.AsyncClient(timeout=timeout, follow_redirects=False)
+        self._max_retries = max_retries
+        self._allowed_hosts: FrozenSet[str] = frozenset(host.strip().lower() for host in allowed_hosts if host.strip())
+
+    async def validate(self, url: str) -> None:
+        """전송 가능한 웹훅 URL 인지 확인. 아니면 WebhookUrlError."""
+        parsed = urlsplit(url)
+        if parsed.scheme != "https":
+            raise WebhookUrlError("webhook_url must use https")
+        host = (parsed.hostname or "").lower()
+        if not host:
+            raise WebhookUrlError("webhook_url has no host")
+
+        if self._allowed_hosts:
+            if host not in self._allowed_hosts:
+                raise WebhookUrlError(f"webhook host is not allowed: {host}")
+            return
+
+        try:
+            port = parsed.port or 443
+            infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except (OSError, ValueError) as exc:
+            raise WebhookUrlError(f"webhook host cannot be resolved: {host}") from exc
+
+        for info in infos:
+            address = ipaddress.ip_address(info[4][0].split("%", 1)[0])
+            if not _is_public(address):
+                raise WebhookUrlError(f"webhook host resolves to a non-public address: {host}")
+
+    async def notify(self, url: str, payload: Dict[str, Any]) -> bool:
+        try:
+            await self.validate(url)
+        except WebhookUrlError as exc:
+            logger.warning(f"웹훅 전송 거부 ({url}): {exc}")
+            return False
+
+        for attempt in range(self._max_retries + 1):
+            try:
+                response = await self._client.post(url, json=payload)
+                if response.status_code < 500:
+                    if response.status_code >= 400:
+                        logger.warning(f"웹훅 거부됨 ({url}): {response.status_code}")
+                    return response.is_success
+                logger.warning(f"웹훅 응답 오류 ({url}): {response.status_code}")
+            except httpx.HTTPError as exc:
+                logger.warning(f"웹훅 전송 실패 ({url}): {exc}")
+
+            if attempt < self._max_retries:
+                await asyncio.sleep(2 ** attempt)
+        return False
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def _is_public(address: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+    if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped is not None:
+        address = address.ipv4_mapped
+    # is_global 은 사설/루프백/링크로컬/예약/공유(100.64/10) 대역을 모두 제외
+    return address.is_global and not address.is_multicast
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+BATCH_IN_PROGRESS = "in_progress"
+BATCH_COMPLETED = "completed"
+BATCH_FAILED = "failed"
+
+
+@dataclass
+class BatchPrompt:
+    custom_id: str
+    prompt: str
+
+
+class BatchLLMPort(ABC):
+    """여러 프롬프트를 한 번에 제출하고 나중에 결과를 받는 LLM 배치 API."""
+
+    @abstractmethod
+    async def submit(self, prompts: List[BatchPrompt]) -> str:
+        """배치 제출 후 provider 배치 id 반환."""
+
+    @abstractmethod
+    async def status(self, batch_id: str) -> str:
+        """BATCH_IN_PROGRESS | BATCH_COMPLETED | BATCH_FAILED"""
+
+    @abstractmethod
+    async def results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        """custom_id → LLM 응답 문자열 (실패한 요청은 None)."""
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Any, AsyncContextManager, AsyncIterator, Dict, Optional
+
+from review.domain.summary_job import SummaryJob
+
+
+class JobBrokerPort(ABC):
+    """요약 작업 큐 + 상태 저장소 + 진행 이벤트 채널."""
+
+    @abstractmethod
+    async def enqueue(self, job: SummaryJob) -> None:
+        """작업 상태를 저장하고 큐에 넣음."""
+
+    @abstractmethod
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        """다음 작업 id. timeout 동안 없으면 None. 꺼낸 작업은 ack/requeue 전까지 처리 중 목록에 남는다."""
+
+    @abstractmethod
+    async def ack(self, job_id: str) -> None:
+        """처리가 끝난 작업을 처리 중 목록에서 제거."""
+
+    @abstractmethod
+    async def requeue(self, job_id: str) -> None:
+        """처리 중이던 작업을 큐 앞쪽으로 되돌림 (워커 종료 시)."""
+
+    @abstractmethod
+    async def keepalive(self) -> int:
+        """이 워커의 생존 표시를 갱신하고, 생존 표시가 만료된 워커의 처리 중 작업을 큐로 되돌림. 되돌린 작업 수."""
+
+    @abstractmethod
+    async def save(self, job: SummaryJob) -> None:
+        pass
+
+    @abstractmethod
+    async def load(self, job_id: str) -> Optional[SummaryJob]:
+        pass
+
+    @abstractmethod
+    async def publish(self, job_id: str, event: Dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    def subscribe(self, job_id: str) -> AsyncContextManager[AsyncIterator[Dict[str, Any]]]:
+        """구독이 활성화된 뒤 진입하는 컨텍스트. job_id 의 진행 이벤트 스트림을 돌려준다."""
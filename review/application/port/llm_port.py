@@ -1,7 +1,20 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional, Sequence
 
 
 class LLMPort(ABC):
+    # 요약 캐시 키에 포함되는 모델명
+    model_name: str = "unknown"
+
+    # fields: 응답 JSON 에 요구할 요약 필드 (None 이면 전체 요약 스키마)
+    @abstractmethod
+    def summarize(self, prompt: str, fields: Optional[Sequence[str]] = None) -> str:
+        pass
+
     @abstractmethod
-    def summarize(self, prompt: str) -> str:
-        pass
\ No newline at end of file
+    async def summarize_async(self, prompt: str, fields: Optional[Sequence[str]] = None) -> str:
+        pass
+
+    async def stream_async(self, prompt: str) -> AsyncIterator[str]:
+        # 스트리밍을 지원하지 않는 구현은 전체 응답을 한 번에 전달
+        yield await self.summarize_async(prompt)
@@ -10,4 +10,8 @@ class PdfPort:
 class StoragePort:
     # 파일명과 PDF 바이트 데이터를 받아 업로드 후 접근 가능한 URL 반환
     def upload(self, filename: str, file_bytes: bytes) -> str:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    # 업로드 전에 파일명으로 접근 URL 을 미리 계산 (업로드 완료를 기다리지 않고 응답하기 위함)
+    def url_for(self, filename: str) -> str:
+        raise NotImplementedError
@@ -1,18 +1,49 @@
 # PDF 생성과 S3 업로드 과정을 순차적으로 실행하
+import asyncio
+import logging
 from datetime import datetime
+from typing import Set
+
+logger = logging.getLogger(__name__)
+
 
 class PdfUseCase:
     def __init__(self, pdf_port, storage_port):
         self.pdf_port = pdf_port
         self.storage_port = storage_port
+        self._background_tasks: Set[asyncio.Task] = set()
 
     # PDF 생성 후 S3 업로드하고 접근 가능한 URL 반환
     def execute(self, summary_vo):
         pdf_bytes = self.pdf_port.generate(summary_vo)
-        filename = f"review-summary-{datetime.utcnow().timestamp()}.pdf"
+        filename = self.new_filename()
         s3_url = self.storage_port.upload(filename, pdf_bytes)
 
         return {
             "filename": filename,
             "url": s3_url
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def new_filename() -> str:
+        return f"review-summary-{datetime.utcnow().timestamp()}.pdf"
+
+    # 파일명/URL 을 먼저 정하고, PDF 생성 + 업로드는 백그라운드(스레드 풀)에서 진행
+    def publish_in_background(self, summary_vo) -> dict:
+        filename = self.new_filename()
+        task = asyncio.create_task(self._generate_and_upload(summary_vo, filename))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+        return {
+            "filename": filename,
+            "url": self.storage_port.url_for(filename)
+        }
+
+    async def _generate_and_upload(self, summary_vo, filename: str) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            pdf_bytes = await loop.run_in_executor(None, self.pdf_port.generate, summary_vo)
+            await loop.run_in_executor(None, self.storage_port.upload, filename, pdf_bytes)
+        except Exception as exc:
+            logger.error(f"PDF 생성/업로드 실패 ({filename}): {type(exc).__name__} - {exc}")
@@ -1,20 +1,69 @@
+import hashlib
 import json
 import re
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from dataclasses import asdict, dataclass
 from html import unescape
-from typing import Dict, Iterable, List, Sequence
+from itertools import chain
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from review.infrastructure.near_duplicate import NearDuplicateIndex
 
 EMOJI_PATTERN = re.compile(r"[\U00010000-\U0010FFFF]", flags=re.UNICODE)
 HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
 WHITESPACE_PATTERN = re.compile(r"\s+")
 REPETITION_PATTERN = re.compile(r"(.)\1{1,}")
+DISALLOWED_CHAR_PATTERN = re.compile(r"[^0-9A-Za-z가-힣 ,.!?~]+")
+PUNCTUATION_REPETITION_PATTERN = re.compile(r"([.!?~])\1{1,}")
+STRETCHED_ENDING_PATTERN = re.compile(r"(요|여|야|유)(오+)")
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+COMMA_SPLIT_PATTERN = re.compile(r",\s*")
+
+
+@dataclass
+class PreprocessStats:
+    """stream/astream 진행 중 갱신되는 통계 (execute 의 stats 와 같은 항목)."""
+
+    input_count: int = 0
+    dropped_count: int = 0
+    deduplicated_count: int = 0
+    near_duplicate_count: int = 0
+    kept_count: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class _RecentTexts:
+    """최근 max_entries 개 텍스트의 digest 만 기억하는 완전 일치 중복 확인용 집합 (LRU)."""
+
+    def __init__(self, max_entries: Optional[int]):
+        self.max_entries = max_entries
+        self._digests: "OrderedDict[bytes, None]" = OrderedDict()
+
+    def add(self, text: str) -> bool:
+        """처음 보는 텍스트면 기억하고 True, 이미 있으면 False."""
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        if digest in self._digests:
+            self._digests.move_to_end(digest)
+            return False
+
+        self._digests[digest] = None
+        if self.max_entries is not None and len(self._digests) > self.max_entries:
+            self._digests.popitem(last=False)
+        return True
 
 class PreprocessUseCase:
     """
     리뷰 텍스트를 정제하고 요약기에 바로 전달할 수 있는 JSON 페이로드를 생성
     - HTML 태그 제거
     - 이모지/특수문자 정리
-    - 의미 없는 짧은 문장 필터링 및 중복 제거
+    - 의미 없는 짧은 문장 필터링 및 중복 제거 (완전 일치 + MinHash/LSH 근사 중복)
     - 문장 단위 분할로 긴 문장 품질 관리
+    정규식은 모두 한 번만 컴파일하고, 리뷰가 parallel_threshold 개 이상이면
+    process_pool 에 parallel_chunk_size 개씩 나눠 정제 (중복 제거는 순서 유지를 위해 호출 프로세스에서)
     """
 
     def __init__(
@@ -24,7 +73,15 @@ class PreprocessUseCase:
             min_word_count: int = 2,
             max_sentence_length: int = 180,
             noise_tokens: Sequence[str] | None = None,
+            process_pool: Executor | None = None,
+            parallel_threshold: int = 5000,
+            parallel_chunk_size: int = 2000,
+            near_duplicate_threshold: float = 0.8,
+            minhash_permutations: int = 64,
+            shingle_size: int = 3,
+            max_dedup_entries: Optional[int] = 50000,
     ):
+        """near_duplicate_threshold: 문자 shingle Jaccard 유사도가 이 값 이상이면 근사 중복으로 제거 (0 이면 사용 안 함)"""
         self.min_text_length = min_text_length
         self.min_word_count = min_word_count
         self.max_sentence_length = max_sentence_length
@@ -36,29 +93,41 @@ class PreprocessUseCase:
             "굿",
             "좋아요",
         )
+        self.process_pool = process_pool
+        self.parallel_threshold = parallel_threshold
+        self.parallel_chunk_size = max(1, parallel_chunk_size)
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.minhash_permutations = minhash_permutations
+        self.shingle_size = shingle_size
+        self.max_dedup_entries = max_dedup_entries
+        self._noise_pattern = self._compile_noise_pattern()
+
+    def __getstate__(self) -> Dict:
+        # 워커 프로세스로 보낼 때 풀 자체는 제외
+        state = self.__dict__.copy()
+        state["process_pool"] = None
+        return state
 
     def execute(self, raw_reviews: Dict | List[str] | List[Dict[str, str]]) -> Dict:
         texts = list(self._normalize_reviews(raw_reviews))
+        ratings = self._normalize_ratings(raw_reviews)
 
         cleaned_items: List[Dict[str, str]] = []
         dropped_count = 0
 
-        for idx, text in enumerate(texts, start=1):
-            normalized = self._clean_text(text)
-            if not self._passes_filters(normalized):
-                dropped_count += 1
-                continue
-
-            sentences = self._split_sentences(normalized)
-            if not sentences:
+        for idx, sentences in enumerate(self._clean_reviews(texts), start=1):
+            if sentences is None:
                 dropped_count += 1
                 continue
 
             cleaned_text = " ".join(sentences)
-            cleaned_items.append({"id": idx, "text": cleaned_text, "sentences": sentences})
+            cleaned_items.append(self._to_item(idx, cleaned_text, sentences, ratings[idx - 1] if ratings else None))
+
+        exact_deduped_items = self._deduplicate(cleaned_items)
+        deduplicated_count = len(cleaned_items) - len(exact_deduped_items)
 
-        deduped_items = self._deduplicate(cleaned_items)
-        deduplicated_count = len(cleaned_items) - len(deduped_items)
+        deduped_items = self._remove_near_duplicates(exact_deduped_items)
+        near_duplicate_count = len(exact_deduped_items) - len(deduped_items)
 
         payload = json.dumps([
             {"text": item["text"]} for item in deduped_items
@@ -68,13 +137,114 @@ class PreprocessUseCase:
             "clean_reviews": deduped_items,
             "stats": {
                 "input_count": len(texts),
-                "dropped_count": dropped_count + deduplicated_count,
+                "dropped_count": dropped_count + deduplicated_count + near_duplicate_count,
                 "deduplicated_count": deduplicated_count,
+                "near_duplicate_count": near_duplicate_count,
                 "kept_count": len(deduped_items),
             },
             "json_payload": payload,
         }
 
+    def stream(self, reviews: Iterable[Any], stats: PreprocessStats | None = None) -> Iterator[Dict]:
+        """
+        리뷰를 하나씩 정제해 yield (입력/중간 결과/JSON 페이로드를 모아 두지 않음)
+        - reviews: 리뷰 문자열/dict 또는 크롤러 페이지(list) 를 내는 iterable, 또는 execute 처럼 {번호: 리뷰} dict
+        - stats 를 넘기면 진행하면서 갱신
+        - 중복 확인 상태는 max_dedup_entries 개까지만 유지해 메모리가 일정 (그보다 오래된 리뷰와의 중복은 놓칠 수 있음)
+        """
+        if isinstance(reviews, Mapping):
+            # {번호: 리뷰} (Naver agent 결과) 는 키가 아닌 값이 리뷰
+            reviews = reviews.values()
+
+        stats = stats if stats is not None else PreprocessStats()
+        recent_texts, near_duplicates = self._new_dedup_state()
+        for element in reviews:
+            for text, rating in self._element_reviews(element):
+                item = self._process_streamed(text, rating, stats, recent_texts, near_duplicates)
+                if item is not None:
+                    yield item
+
+    async def astream(
+            self,
+            reviews: AsyncIterable[Any] | Iterable[Any],
+            stats: PreprocessStats | None = None,
+    ) -> AsyncIterator[Dict]:
+        """stream 의 async 버전. 크롤러가 페이지를 넘겨주는 대로 정제 (예: CollectReviewsUseCase 스트림)."""
+        if not isinstance(reviews, AsyncIterable):
+            for item in self.stream(reviews, stats):
+                yield item
+            return
+
+        stats = stats if stats is not None else PreprocessStats()
+        recent_texts, near_duplicates = self._new_dedup_state()
+        async for element in reviews:
+            for text, rating in self._element_reviews(element):
+                item = self._process_streamed(text, rating, stats, recent_texts, near_duplicates)
+                if item is not None:
+                    yield item
+
+    def _new_dedup_state(self) -> tuple[_RecentTexts, Optional[NearDuplicateIndex]]:
+        near_duplicates = None
+        if self.near_duplicate_threshold > 0:
+            near_duplicates = NearDuplicateIndex(
+                threshold=self.near_duplicate_threshold,
+                num_perm=self.minhash_permutations,
+                shingle_size=self.shingle_size,
+                max_entries=self.max_dedup_entries,
+            )
+        return _RecentTexts(self.max_dedup_entries), near_duplicates
+
+    def _process_streamed(
+            self,
+            text: str,
+            rating: Any,
+            stats: PreprocessStats,
+            recent_texts: _RecentTexts,
+            near_duplicates: Optional[NearDuplicateIndex],
+    ) -> Optional[Dict]:
+        stats.input_count += 1
+        sentences = self._clean_review(text)
+        if sentences is None:
+            stats.dropped_count += 1
+            return None
+
+        cleaned_text = " ".join(sentences)
+        if not recent_texts.add(cleaned_text):
+            stats.dropped_count += 1
+            stats.deduplicated_count += 1
+            return None
+        if near_duplicates is not None and not near_duplicates.add_if_unique(cleaned_text):
+            stats.dropped_count += 1
+            stats.near_duplicate_count += 1
+            return None
+
+        stats.kept_count += 1
+        return self._to_item(stats.input_count, cleaned_text, sentences, rating)
+
+    @staticmethod
+    def _element_reviews(element: Any) -> Iterable[tuple[str, Any]]:
+        # 크롤러 페이지(list) 는 펼치고, dict 리뷰는 text(없으면 content) 와 rating 사용
+        items = element if isinstance(element, (list, tuple)) else (element,)
+        for item in items:
+            if isinstance(item, Mapping):
+                yield str(item.get("text", item.get("content", ""))), item.get("rating")
+            else:
+                yield str(item), None
+
+    @staticmethod
+    def _to_item(idx: int, text: str, sentences: List[str], rating: Any = None) -> Dict:
+        # 별점이 있으면 함께 전달 (리뷰 선택 단계에서 별점 분포 유지에 사용)
+        item = {"id": idx, "text": text, "sentences": sentences}
+        if rating not in (None, ""):
+            item["rating"] = rating
+        return item
+
+    @staticmethod
+    def _normalize_ratings(raw_reviews: Dict | List[str] | List[Dict[str, str]]) -> List[Any]:
+        if isinstance(raw_reviews, list) and raw_reviews and isinstance(raw_reviews[0], dict):
+            return [item.get("rating") for item in raw_reviews]
+        return []
+
     def _normalize_reviews(self, raw_reviews: Dict | List[str] | List[Dict[str, str]]) -> Iterable[str]:
         if isinstance(raw_reviews, dict):
             return [str(value) for value in raw_reviews.values()]
@@ -90,11 +260,31 @@ class PreprocessUseCase:
 
         raise ValueError("리뷰 입력 형식이 올바르지 않습니다. dict 또는 list 형태여야 합니다.")
 
+    def _clean_reviews(self, texts: List[str]) -> List[Optional[List[str]]]:
+        """리뷰별 문장 목록 (필터에 걸리면 None). 대량이면 프로세스 풀로 분산."""
+        if self.process_pool is None or len(texts) < self.parallel_threshold:
+            return self._clean_batch(texts)
+
+        chunks = [
+            texts[start:start + self.parallel_chunk_size]
+            for start in range(0, len(texts), self.parallel_chunk_size)
+        ]
+        return list(chain.from_iterable(self.process_pool.map(self._clean_batch, chunks)))
+
+    def _clean_batch(self, texts: Sequence[str]) -> List[Optional[List[str]]]:
+        return [self._clean_review(text) for text in texts]
+
+    def _clean_review(self, text: str) -> Optional[List[str]]:
+        normalized = self._clean_text(text)
+        if not self._passes_filters(normalized):
+            return None
+        return self._split_sentences(normalized) or None
+
     def _clean_text(self, text: str) -> str:
         text = unescape(str(text))
         text = HTML_TAG_PATTERN.sub(" ", text)
         text = EMOJI_PATTERN.sub(" ", text)
-        text = re.sub(r"[^0-9A-Za-z가-힣 ,.!?~]+", " ", text)
+        text = DISALLOWED_CHAR_PATTERN.sub(" ", text)
         text = WHITESPACE_PATTERN.sub(" ", text).strip()
         text = self._normalize_repetitions(text)
         return text
@@ -108,31 +298,29 @@ class PreprocessUseCase:
             return False
 
         collapsed = text.replace(" ", "")
-        if any(pattern.match(collapsed) for pattern in self._noise_patterns()):
+        if self._noise_pattern.match(collapsed):
             return False
 
         unique_chars = set(collapsed)
         return len(unique_chars) > 1
 
-    def _noise_patterns(self) -> List[re.Pattern[str]]:
-        base_patterns = [
-            re.compile(r"^[ㅋㅎㅜㅠ]+$"),
-            re.compile(r"^[.!?~]+$"),
-        ]
-        base_patterns.extend(re.compile(rf"^{re.escape(token)}+$", re.IGNORECASE) for token in self.noise_tokens)
-        return base_patterns
+    def _compile_noise_pattern(self) -> re.Pattern[str]:
+        # 노이즈 패턴을 하나의 정규식으로 합쳐 리뷰당 한 번만 검사
+        alternatives = [r"[ㅋㅎㅜㅠ]+", r"[.!?~]+"]
+        alternatives.extend(rf"{re.escape(token)}+" for token in self.noise_tokens)
+        return re.compile(rf"^(?:{'|'.join(alternatives)})$", re.IGNORECASE)
 
     def _normalize_repetitions(self, text: str) -> str:
-        text = re.sub(r"([.!?~])\1{1,}", r"\1", text)
+        text = PUNCTUATION_REPETITION_PATTERN.sub(r"\1", text)
         text = REPETITION_PATTERN.sub(r"\1", text)
-        text = re.sub(r"(요|여|야|유)(오+)", r"\1", text)
+        text = STRETCHED_ENDING_PATTERN.sub(r"\1", text)
         return text
 
     def _split_sentences(self, text: str) -> List[str]:
         if not text:
             return []
 
-        raw_sentences = re.split(r"(?<=[.!?])\s+|\n+", text)
+        raw_sentences = SENTENCE_SPLIT_PATTERN.split(text)
         sentences: List[str] = []
 
         for sentence in raw_sentences:
@@ -149,7 +337,7 @@ class PreprocessUseCase:
         return [s for s in sentences if len(s) >= self.min_text_length]
 
     def _split_long_sentence(self, sentence: str) -> List[str]:
-        segments = [segment.strip() for segment in re.split(r",\s*", sentence) if segment.strip()]
+        segments = [segment.strip() for segment in COMMA_SPLIT_PATTERN.split(sentence) if segment.strip()]
         if not segments:
             return self._chunk_sentence(sentence)
 
@@ -179,4 +367,16 @@ class PreprocessUseCase:
                 continue
             seen.add(text)
             unique_items.append(item)
-        return unique_items
\ No newline at end of file
+        return unique_items
+
+    def _remove_near_duplicates(self, items: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        # 글자 몇 개만 다른 복붙/템플릿 리뷰는 먼저 나온 것만 유지
+        if self.near_duplicate_threshold <= 0:
+            return items
+
+        index = NearDuplicateIndex(
+            threshold=self.near_duplicate_threshold,
+            num_perm=self.minhash_permutations,
+            shingle_size=self.shingle_size,
+        )
+        return [item for item in items if index.add_if_unique(item["text"])]
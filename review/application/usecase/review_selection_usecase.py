@@ -0,0 +1,169 @@
+import logging
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+from review.infrastructure.token_counter import count_tokens
+
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r"[0-9A-Za-z가-힣]+")
+
+# 별점이 없을 때 긍정/부정 판단용 어휘 (어간 일부로 부분 일치)
+POSITIVE_LEXICON = ("좋", "만족", "추천", "최고", "빠르", "빨라", "예쁘", "예뻐", "편하", "편해", "튼튼", "저렴", "재구매", "맘에", "마음에", "훌륭")
+NEGATIVE_LEXICON = ("별로", "불만", "실망", "아쉽", "아쉬", "느리", "느려", "불편", "환불", "반품", "교환", "최악", "고장", "냄새", "불량", "비싸", "작아", "커서")
+
+POSITIVE, NEGATIVE, NEUTRAL = "positive", "negative", "neutral"
+
+
+class ReviewSelectionUseCase:
+    """
+    요약 프롬프트에 넣을 리뷰 선택 (PreprocessUseCase 와 SummarizeUseCase 사이)
+    - 점수: TF-IDF 중심(centroid) 유사도(자주 언급되는 주제를 담은 정보량 있는 리뷰) x 길이 점수
+    - 그룹: 별점(1~5)별, 별점이 없으면 어휘 기반 긍정/부정/중립
+    - 토큰 예산을 그룹 크기 비율로 나눠 그룹마다 점수 순으로 채워 긍정/부정 비율과 별점 분포 유지
+    - 남은 예산은 목표 비율 대비 가장 덜 뽑힌 그룹부터 점수 순으로 채움
+    전체가 예산 이하이면 그대로 통과
+    """
+
+    def __init__(self, *, token_budget: int, model: str = "gpt-4.1", min_words: int = 3, target_words: int = 20):
+        self.token_budget = token_budget
+        self.model = model
+        self.min_words = min_words
+        self.target_words = target_words
+
+    def select(self, clean_reviews: List[Dict]) -> Dict:
+        """
+        clean_reviews: PreprocessUseCase 결과 항목 ({"id", "text", ...}, 선택적으로 "rating")
+        반환: {"selected_reviews": 원래 순서를 유지한 선택 항목, "stats": {... "tokens_saved" ...}}
+        """
+        token_counts = [count_tokens(item["text"], self.model) for item in clean_reviews]
+        input_tokens = sum(token_counts)
+
+        if self.token_budget <= 0 or input_tokens <= self.token_budget:
+            selected_indexes = list(range(len(clean_reviews)))
+        else:
+            selected_indexes = self._select_indexes(clean_reviews, token_counts)
+
+        selected_tokens = sum(token_counts[index] for index in selected_indexes)
+        groups = Counter(self._group(clean_reviews[index]) for index in selected_indexes)
+        stats = {
+            "input_count": len(clean_reviews),
+            "selected_count": len(selected_indexes),
+            "input_tokens": input_tokens,
+            "selected_tokens": selected_tokens,
+            "tokens_saved": input_tokens - selected_tokens,
+            "selected_groups": dict(groups),
+        }
+        if stats["tokens_saved"]:
+            logger.info(
+                f"리뷰 선택: {stats['input_count']}개 → {stats['selected_count']}개, "
+                f"토큰 {input_tokens} → {selected_tokens} ({stats['tokens_saved']} 절감)"
+            )
+        return {"selected_reviews": [clean_reviews[index] for index in selected_indexes], "stats": stats}
+
+    def _select_indexes(self, clean_reviews: List[Dict], token_counts: List[int]) -> List[int]:
+        scores = self._scores([item["text"] for item in clean_reviews])
+
+        groups: Dict[str, List[int]] = defaultdict(list)
+        for index, item in enumerate(clean_reviews):
+            groups[self._group(item)].append(index)
+
+        selected: set = set()
+        remaining = self.token_budget
+
+        # 1) 그룹별 예산 (리뷰 수 비율)
+        for members in groups.values():
+            group_budget = self.token_budget * len(members) / len(clean_reviews)
+            for index in sorted(members, key=lambda member: scores[member], reverse=True):
+                if token_counts[index] > min(group_budget, remaining):
+                    continue
+                selected.add(index)
+                group_budget -= token_counts[index]
+                remaining -= token_counts[index]
+
+        # 2) 남은 예산은 목표 비율 대비 가장 덜 뽑힌 그룹부터 한 개씩 (그룹 안에서는 점수 순)
+        candidates = {
+            group: [index for index in sorted(members, key=lambda member: scores[member], reverse=True)
+                    if index not in selected]
+            for group, members in groups.items()
+        }
+        picked = Counter(self._group(clean_reviews[index]) for index in selected)
+        while True:
+            fitting = {
+                group: next((index for index in indexes if token_counts[index] <= remaining), None)
+                for group, indexes in candidates.items()
+            }
+            fitting = {group: index for group, index in fitting.items() if index is not None}
+            if not fitting:
+                break
+            group = min(fitting, key=lambda name: (picked[name] + 1) / len(groups[name]))
+            index = fitting[group]
+            candidates[group].remove(index)
+            selected.add(index)
+            picked[group] += 1
+            remaining -= token_counts[index]
+
+        return sorted(selected)
+
+    def _scores(self, texts: List[str]) -> List[float]:
+        # 한국어는 조사가 붙어 어절이 달라지므로 어절 내 글자 bigram 을 단어 단위로 사용
+        documents = [self._terms(text) for text in texts]
+        document_frequency = Counter(term for terms in documents for term in set(terms))
+        total = len(documents)
+        idf = {term: math.log((total + 1) / (count + 1)) + 1 for term, count in document_frequency.items()}
+
+        vectors: List[Dict[str, float]] = []
+        centroid: Dict[str, float] = defaultdict(float)
+        for terms in documents:
+            vector = {term: count * idf[term] for term, count in Counter(terms).items()}
+            norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+            vector = {term: weight / norm for term, weight in vector.items()}
+            vectors.append(vector)
+            for term, weight in vector.items():
+                centroid[term] += weight / total
+
+        centroid_norm = math.sqrt(sum(weight * weight for weight in centroid.values())) or 1.0
+        scores = []
+        for text, vector in zip(texts, vectors):
+            salience = sum(weight * centroid.get(term, 0.0) for term, weight in vector.items()) / centroid_norm
+            words = len(text.split())
+            length_score = 0.0 if words < self.min_words else min(1.0, words / self.target_words)
+            scores.append(salience * (0.5 + 0.5 * length_score))
+        return scores
+
+    @staticmethod
+    def _terms(text: str) -> List[str]:
+        terms = []
+        for word in WORD_PATTERN.findall(text.lower()):
+            if len(word) <= 2:
+                terms.append(word)
+            else:
+                terms.extend(word[start:start + 2] for start in range(len(word) - 1))
+        return terms
+
+    @staticmethod
+    def _group(item: Dict) -> str:
+        rating = _to_rating(item.get("rating"))
+        if rating is not None:
+            return f"rating_{round(rating)}"
+        return polarity(item["text"])
+
+
+def polarity(text: str) -> str:
+    """별점이 없을 때 어휘 기반 극성 판단."""
+    positive = sum(text.count(word) for word in POSITIVE_LEXICON)
+    negative = sum(text.count(word) for word in NEGATIVE_LEXICON)
+    if positive > negative:
+        return POSITIVE
+    if negative > positive:
+        return NEGATIVE
+    return NEUTRAL
+
+
+def _to_rating(value) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
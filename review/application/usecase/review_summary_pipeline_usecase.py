@@ -0,0 +1,152 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from config.crawl_executor import DisconnectProbe
+from config.stage_timer import StageTimer
+from review.application.usecase.pdf_usecase import PdfUseCase
+from review.application.usecase.preprocess_usecase import PreprocessUseCase
+from review.application.usecase.review_selection_usecase import ReviewSelectionUseCase
+from review.application.usecase.summarize_usecase import SummarizeUseCase
+from review.domain.pdf_document import PdfDocument
+
+# 단계가 시작될 때마다 단계 이름으로 호출 (작업 진행 상황 전달용)
+StageCallback = Callable[[str], Awaitable[None]]
+
+
+class ReviewSummaryPipelineUseCase:
+    """
+    크롤링 → 전처리 → 리뷰 선택(토큰 예산) → 요약 → PDF(백그라운드) 파이프라인
+    /review/summary 와 작업 큐 워커가 함께 사용
+    """
+
+    def __init__(
+            self,
+            crawler,
+            preprocess_usecase: PreprocessUseCase,
+            summarize_usecase: SummarizeUseCase,
+            pdf_usecase: PdfUseCase,
+            selection_usecase: ReviewSelectionUseCase | None = None,
+    ):
+        self.crawler = crawler
+        self.preprocess_usecase = preprocess_usecase
+        self.summarize_usecase = summarize_usecase
+        self.pdf_usecase = pdf_usecase
+        self.selection_usecase = selection_usecase
+
+    async def collect_reviews(self, info_url: str, is_disconnected: DisconnectProbe | None = None) -> List[str]:
+        """크롤링 + 전처리만 수행해 요약에 넣을 리뷰 텍스트 목록 반환 (배치 요약용)."""
+        raw_reviews = await self.crawler.crawling_naver_review_items(info_url, is_disconnected=is_disconnected)
+        preprocessed_data = await asyncio.to_thread(self.preprocess_usecase.execute, raw_reviews)
+        clean_texts, _ = await asyncio.to_thread(self._select, preprocessed_data["clean_reviews"])
+        return clean_texts
+
+    async def run(
+            self,
+            name: str,
+            price: str,
+            info_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+            on_stage: Optional[StageCallback] = None,
+    ) -> dict:
+        timer = StageTimer("review-summary")
+
+        async def enter(stage: str) -> None:
+            if on_stage is not None:
+                await on_stage(stage)
+
+        # 1. 크롤링
+        await enter("crawl")
+        with timer.stage("crawl"):
+            raw_reviews = await self.crawler.crawling_naver_review_items(
+                info_url,
+                is_disconnected=is_disconnected,
+            )
+
+        # 2. 전처리 (CPU 작업은 스레드 풀에서)
+        await enter("preprocess")
+        with timer.stage("preprocess"):
+            preprocessed_data = await asyncio.to_thread(self.preprocess_usecase.execute, raw_reviews)
+
+        # 3. 요약에 넣을 리뷰 선택 (토큰 예산, 토큰화/TF-IDF 도 스레드 풀에서)
+        with timer.stage("select"):
+            clean_texts, selection_stats = await asyncio.to_thread(self._select, preprocessed_data["clean_reviews"])
+
+        # 4. 요약 (AsyncOpenAI, 리뷰가 많으면 map-reduce)
+        await enter("summarize")
+        with timer.stage("summarize"):
+            summary_result = await self.summarize_usecase.summarize_reviews_async(name, clean_texts)
+
+        # 5. PDF 생성 + S3 업로드: URL 만 먼저 정하고 나머지는 백그라운드에서 진행
+        await enter("pdf")
+        pdf_url = self._publish_pdf(name, price, summary_result)
+        return {
+            "summary": summary_result,
+            "pdf_url": pdf_url,
+            "timings": timer.durations,
+            "selection": selection_stats,
+        }
+
+    async def stream(
+            self,
+            name: str,
+            price: str,
+            info_url: str,
+            is_disconnected: DisconnectProbe | None = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        run 의 스트리밍 버전 (SSE 용 이벤트 dict)
+        - {"event": "progress", "stage": ...}: 단계 시작 (crawl → preprocess → summarize)
+        - {"event": "token", "text": ...}: LLM 이 생성하는 요약 JSON 조각
+        - {"event": "result", ...}: 마지막 이벤트, 파싱/검증된 요약 + pdf_url + 단계별 시간
+        """
+        timer = StageTimer("review-summary-stream")
+
+        yield {"event": "progress", "stage": "crawl"}
+        with timer.stage("crawl"):
+            raw_reviews = await self.crawler.crawling_naver_review_items(info_url, is_disconnected=is_disconnected)
+
+        yield {"event": "progress", "stage": "preprocess", "raw_count": len(raw_reviews)}
+        with timer.stage("preprocess"):
+            preprocessed_data = await asyncio.to_thread(self.preprocess_usecase.execute, raw_reviews)
+        with timer.stage("select"):
+            clean_texts, selection_stats = await asyncio.to_thread(self._select, preprocessed_data["clean_reviews"])
+
+        yield {
+            "event": "progress",
+            "stage": "summarize",
+            "review_count": len(clean_texts),
+            "tokens_saved": selection_stats["tokens_saved"],
+        }
+        summary_event: Dict[str, Any] = {}
+        with timer.stage("summarize"):
+            async for event in self.summarize_usecase.stream_reviews_async(name, clean_texts):
+                if event["event"] == "token":
+                    yield event
+                else:
+                    summary_event = event
+
+        summary_result = summary_event["summary"]
+        yield {
+            "event": "result",
+            "summary": summary_result,
+            "cached": summary_event["cached"],
+            "pdf_url": self._publish_pdf(name, price, summary_result),
+            "timings": timer.durations,
+        }
+
+    def _select(self, clean_reviews: List[Dict[str, Any]]) -> Tuple[List[str], Dict[str, Any]]:
+        if self.selection_usecase is None:
+            return [item["text"] for item in clean_reviews], {"tokens_saved": 0}
+        selection = self.selection_usecase.select(clean_reviews)
+        return [item["text"] for item in selection["selected_reviews"]], selection["stats"]
+
+    def _publish_pdf(self, name: str, price: str, summary_result: dict) -> str:
+        pdf_document = PdfDocument(
+            name=name,
+            price=price,
+            summary=summary_result["summary"],
+            positive_features=summary_result["positive_features"],
+            negative_features=summary_result["negative_features"],
+            keywords=summary_result["keywords"],
+        )
+        return self.pdf_usecase.publish_in_background(pdf_document)["url"]
@@ -1,22 +1,309 @@
+import asyncio
 import logging
 import json
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
+from review.application.port.batch_llm_port import BatchLLMPort, BatchPrompt
 from review.application.port.llm_port import LLMPort
-from review.review_summarize_prompt import ReviewPrompts
+from review.infrastructure.cache.summary_cache import SummaryCache
+from review.infrastructure.summary_parser import parse_summary
+from review.infrastructure.token_counter import count_tokens
+from review.review_summarize_prompt import PROMPT_VERSION, ReviewPrompts
 
 logger = logging.getLogger(__name__)
 
+EMPTY_SUMMARY = {"summary": "", "positive_features": "", "negative_features": "", "keywords": []}
+
+
+@dataclass
+class SummaryBatchSubmission:
+    """submit_batch 결과. keys 는 입력 상품 순서대로의 요약 캐시 키 (= 배치 custom_id)."""
+
+    batch_id: Optional[str]
+    keys: List[str]
+    cached: Dict[str, dict] = field(default_factory=dict)
+    # 한 프롬프트에 담기지 않아 map-reduce 로 따로 요약해야 하는 상품 인덱스
+    oversized: List[int] = field(default_factory=list)
+    # 제출한 custom_id → (상품명, 요약 입력 텍스트). 깨진 필드 재요청에 사용
+    sources: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+
+
 class SummarizeUseCase:
-    def __init__(self, llm_port: LLMPort):
+    def __init__(
+            self,
+            llm_port: LLMPort,
+            summary_cache: SummaryCache | None = None,
+            *,
+            chunk_tokens: int = 6000,
+            map_concurrency: int = 4,
+            batch_port: BatchLLMPort | None = None,
+            repair_attempts: int = 1,
+    ):
         self.llm_port = llm_port
+        self.summary_cache = summary_cache
+        self.chunk_tokens = chunk_tokens
+        self.map_concurrency = max(1, map_concurrency)
+        self.batch_port = batch_port
+        self.repair_attempts = max(0, repair_attempts)
+
+    async def summarize_review_async(self, product_name: str, preprocessed_reviews: str) -> dict:
+        async def summarize() -> dict:
+            prompt = ReviewPrompts.summary(product_name, preprocessed_reviews)
+            return await self._parse_or_repair(
+                await self.llm_port.summarize_async(prompt), product_name, preprocessed_reviews
+            )
+
+        return await self._cached(product_name, preprocessed_reviews, summarize)
+
+    async def summarize_reviews_async(self, product_name: str, reviews: List[str]) -> dict:
+        """
+        리뷰 목록 요약
+        - 전체가 chunk_tokens 이하면 한 번의 프롬프트로 요약
+        - 넘으면 토큰 예산에 맞게 묶음으로 나눠 병렬 부분 요약(map) 후 병합(reduce)
+        """
+        joined = " ".join(reviews)
+        if count_tokens(joined, self.llm_port.model_name) <= self.chunk_tokens:
+            return await self.summarize_review_async(product_name, joined)
+
+        async def map_reduce() -> dict:
+            semaphore = asyncio.Semaphore(self.map_concurrency)
+            chunks = self._chunk_reviews(reviews)
+            logger.info(f"리뷰 map-reduce 요약: {len(reviews)}개 리뷰 → {len(chunks)}개 묶음")
+
+            partials = await asyncio.gather(*(
+                self._call_llm(
+                    semaphore,
+                    ReviewPrompts.chunk_summary(product_name, chunk, part, len(chunks)),
+                    product_name,
+                    chunk,
+                )
+                for part, chunk in enumerate(chunks, start=1)
+            ))
+            return await self._reduce(semaphore, product_name, [partial for partial in partials if partial.get("summary")])
+
+        return await self._cached(product_name, joined, map_reduce)
+
+    async def stream_reviews_async(self, product_name: str, reviews: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        스트리밍 요약: {"event": "token", "text": ...} 를 생성되는 대로 보내고 마지막에 {"event": "summary", "summary": dict}
+        - 캐시에 있으면 토큰 없이 바로 summary
+        - 한 프롬프트에 담기지 않으면 map-reduce 결과를 summary 로만 전달
+        """
+        joined = " ".join(reviews)
+        cache_key = self._cache_key(product_name, joined)
+        if self.summary_cache is not None:
+            cached = await self.summary_cache.get(cache_key)
+            if cached is not None:
+                yield {"event": "summary", "summary": cached, "cached": True}
+                return
+
+        if count_tokens(joined, self.llm_port.model_name) > self.chunk_tokens:
+            yield {"event": "summary", "summary": await self.summarize_reviews_async(product_name, reviews), "cached": False}
+            return
+
+        chunks: List[str] = []
+        async for delta in self.llm_port.stream_async(ReviewPrompts.summary(product_name, joined)):
+            chunks.append(delta)
+            yield {"event": "token", "text": delta}
+
+        # 스트림이 중간에 끊겨 잘린 JSON 도 보정 후 깨진 필드만 재요청
+        summary_data = await self._parse_or_repair("".join(chunks), product_name, joined)
+        if self.summary_cache is not None and summary_data.get("summary"):
+            await self.summary_cache.set(cache_key, summary_data)
+        yield {"event": "summary", "summary": summary_data, "cached": False}
+
+    async def submit_batch(self, products: Sequence[Tuple[str, List[str]]]) -> SummaryBatchSubmission:
+        """
+        배치 모드: (상품명, 전처리 리뷰 목록) 들의 요약 프롬프트를 provider 배치 API 에 한 번에 제출
+        - 이미 캐시된 상품은 제출하지 않고 cached 로 반환
+        - custom_id 로 요약 캐시 키를 쓰므로 결과를 그대로 캐시에 기록하고, 같은 입력은 한 번만 제출
+        """
+        if self.batch_port is None:
+            raise RuntimeError("batch_port is not configured")
+
+        submission = SummaryBatchSubmission(batch_id=None, keys=[])
+        prompts: Dict[str, BatchPrompt] = {}
+        for index, (product_name, reviews) in enumerate(products):
+            joined = " ".join(reviews)
+            cache_key = self._cache_key(product_name, joined)
+            submission.keys.append(cache_key)
+
+            if cache_key in prompts or cache_key in submission.cached:
+                continue
+            if self.summary_cache is not None:
+                cached = await self.summary_cache.get(cache_key)
+                if cached is not None:
+                    submission.cached[cache_key] = cached
+                    continue
+            if count_tokens(joined, self.llm_port.model_name) > self.chunk_tokens:
+                submission.oversized.append(index)
+                continue
+            prompts[cache_key] = BatchPrompt(custom_id=cache_key, prompt=ReviewPrompts.summary(product_name, joined))
+            submission.sources[cache_key] = (product_name, joined)
+
+        if prompts:
+            submission.batch_id = await self.batch_port.submit(list(prompts.values()))
+            logger.info(f"요약 배치 제출: {submission.batch_id} ({len(prompts)}개 프롬프트, 캐시 {len(submission.cached)}개)")
+        return submission
 
-    def summarize_review(self, product_name: str, preprocessed_reviews: str) -> dict:
+    async def batch_status(self, batch_id: str) -> str:
+        return await self.batch_port.status(batch_id)
 
-        # 프롬프트 생성
-        prompt = ReviewPrompts.summary(product_name, preprocessed_reviews)
+    async def collect_batch(
+            self,
+            batch_id: str,
+            sources: Optional[Dict[str, Tuple[str, str]]] = None,
+    ) -> Dict[str, Optional[dict]]:
+        """
+        완료된 배치 결과를 캐시 키 → 요약으로 변환하고 요약 캐시에 기록. 실패한 요청은 None.
+        sources(submit_batch 의 sources) 가 있으면 깨진 필드는 온라인 호출로 다시 요청
+        """
+        summaries: Dict[str, Optional[dict]] = {}
+        for cache_key, llm_response_str in (await self.batch_port.results(batch_id)).items():
+            source = (sources or {}).get(cache_key)
+            if not llm_response_str:
+                summary_data = None
+            elif source is not None:
+                summary_data = await self._parse_or_repair(llm_response_str, *source)
+            else:
+                summary_data = self._complete(parse_summary(llm_response_str)[0])
 
-        # LLM 호출 (Adapter에서 재시도 + 실패 시 빈 JSON 문자열 반환)
-        llm_response_str = self.llm_port.summarize(prompt)  # LLM에서 받은 원본 문자열
-        summary_data = json.loads(llm_response_str)  # JSON → dict로 변환된 요약 데이터
+            if not summary_data or not summary_data.get("summary"):
+                summaries[cache_key] = None
+                continue
+            if self.summary_cache is not None:
+                await self.summary_cache.set(cache_key, summary_data)
+            summaries[cache_key] = summary_data
+        return summaries
 
+    def cache_stats(self) -> dict:
+        if self.summary_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.summary_cache.stats()}
+
+    async def _cached(self, product_name: str, preprocessed_reviews: str, summarize: Callable[[], Awaitable[dict]]) -> dict:
+        # 같은 모델/프롬프트/상품/리뷰 텍스트면 캐시된 요약 재사용 (LLM 재호출 없음)
+        if self.summary_cache is None:
+            return await summarize()
+
+        cache_key = self._cache_key(product_name, preprocessed_reviews)
+        cached = await self.summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        summary_data = await summarize()
+
+        # LLM 실패 시 Adapter 가 돌려주는 빈 요약은 저장하지 않음
+        if summary_data.get("summary"):
+            await self.summary_cache.set(cache_key, summary_data)
         return summary_data
+
+    def _cache_key(self, product_name: str, preprocessed_reviews: str) -> str:
+        return SummaryCache.key(self.llm_port.model_name, PROMPT_VERSION, product_name, preprocessed_reviews)
+
+    async def _call_llm(self, semaphore: asyncio.Semaphore, prompt: str, product_name: str, source_text: str) -> dict:
+        async with semaphore:
+            llm_response_str = await self.llm_port.summarize_async(prompt)
+            return await self._parse_or_repair(llm_response_str, product_name, source_text)
+
+    async def _parse_or_repair(self, llm_response_str: str, product_name: str, source_text: str) -> dict:
+        """
+        응답에서 JSON 을 추출/보정하고 ProductSummary 필드로 검증
+        전체 프롬프트를 다시 돌리지 않고 누락되었거나 형식이 틀린 필드만 다시 요청 (repair_attempts 회)
+        """
+        summary_data, broken = parse_summary(llm_response_str)
+        for _ in range(self.repair_attempts):
+            if not broken:
+                break
+            logger.info(f"요약 필드 재요청: {broken}")
+            repair_prompt = ReviewPrompts.repair_fields(product_name, source_text, summary_data, broken)
+            summary_data, broken = self._merge_repair(
+                summary_data, broken, await self.llm_port.summarize_async(repair_prompt, broken)
+            )
+
+        if broken:
+            logger.warning(f"요약 필드 복구 실패, 기본값 사용: {broken}")
+        return self._complete(summary_data)
+
+    @staticmethod
+    def _merge_repair(summary_data: dict, broken: List[str], repair_response_str: str) -> Tuple[dict, List[str]]:
+        repaired, _ = parse_summary(repair_response_str)
+        merged = {**summary_data, **{name: repaired[name] for name in broken if name in repaired}}
+        return merged, [name for name in broken if name not in repaired]
+
+    @staticmethod
+    def _complete(summary_data: dict) -> dict:
+        # 끝내 복구하지 못한 필드는 빈 값 (summary 가 비면 캐시하지 않음)
+        return {name: summary_data.get(name, default) for name, default in EMPTY_SUMMARY.items()}
+
+    async def _reduce(self, semaphore: asyncio.Semaphore, product_name: str, partials: List[dict]) -> dict:
+        if not partials:
+            return dict(EMPTY_SUMMARY)
+        if len(partials) == 1:
+            return partials[0]
+
+        # 부분 요약이 한 번에 합치기에도 크면 예산에 맞는 그룹별로 먼저 합친 뒤 다시 합침 (계층적 reduce)
+        groups = self._chunk_reviews([json.dumps(partial, ensure_ascii=False) for partial in partials], joiner="\n")
+        if len(groups) == 1:
+            return await self._call_llm(semaphore, ReviewPrompts.merge(product_name, groups[0]), product_name, groups[0])
+
+        merged = await asyncio.gather(*(
+            self._call_llm(semaphore, ReviewPrompts.merge(product_name, group), product_name, group) for group in groups
+        ))
+        merged = [partial for partial in merged if partial.get("summary")]
+        if len(merged) >= len(partials):
+            # 합쳐도 줄지 않으면(부분 요약 하나하나가 예산에 가까움) 더 나눠 봐야 같으므로,
+            # 각 부분 요약을 chunk_tokens / len(merged) 토큰으로 잘라 마지막으로 한 번에 합침
+            share = max(1, self.chunk_tokens // len(merged))
+            combined = "\n".join(
+                self._truncate(json.dumps(partial, ensure_ascii=False), share) for partial in merged
+            )
+            return await self._call_llm(semaphore, ReviewPrompts.merge(product_name, combined), product_name, combined)
+        return await self._reduce(semaphore, product_name, merged)
+
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        """max_tokens 토큰 이내인 가장 긴 앞부분 (글자마다 토큰 수가 달라 이진 탐색)."""
+        model = self.llm_port.model_name
+        if count_tokens(text, model) <= max_tokens:
+            return text
+
+        fits, too_long = 0, len(text)
+        while too_long - fits > 1:
+            middle = (fits + too_long) // 2
+            if count_tokens(text[:middle], model) <= max_tokens:
+                fits = middle
+            else:
+                too_long = middle
+        return text[:fits]
+
+    def _chunk_reviews(self, reviews: List[str], joiner: str = " ") -> List[str]:
+        """토큰 예산(chunk_tokens)을 넘지 않게 리뷰를 순서대로 묶음. 예산보다 긴 리뷰는 잘라서 나눔."""
+        model = self.llm_port.model_name
+        chunks: List[str] = []
+        current: List[str] = []
+        current_tokens = 0
+
+        for review in reviews:
+            tokens = count_tokens(review, model)
+            pieces = [review]
+            if tokens > self.chunk_tokens:
+                # 글자 수 비율로 나누면 예산을 넘는 조각이 생기므로 조각마다 예산에 맞춰 자름
+                pieces = []
+                rest = review
+                while rest:
+                    piece = self._truncate(rest, self.chunk_tokens) or rest[:1]
+                    pieces.append(piece)
+                    rest = rest[len(piece):]
+
+            for piece in pieces:
+                piece_tokens = count_tokens(piece, model) if len(pieces) > 1 else tokens
+                if current and current_tokens + piece_tokens > self.chunk_tokens:
+                    chunks.append(joiner.join(current))
+                    current, current_tokens = [], 0
+                current.append(piece)
+                current_tokens += piece_tokens
+
+        if current:
+            chunks.append(joiner.join(current))
+        return chunks
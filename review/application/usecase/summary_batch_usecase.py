@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from review.application.port.batch_llm_port import BATCH_COMPLETED, BATCH_IN_PROGRESS
+from review.application.usecase.review_summary_pipeline_usecase import ReviewSummaryPipelineUseCase
+from review.domain.summary_batch import SummaryBatch, SummaryBatchItem
+from review.domain.summary_job import JOB_FAILED, JOB_RUNNING, JOB_SUCCEEDED
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryBatchUseCase:
+    """
+    여러 상품 요약을 provider 배치 API 로 처리 (야간 일괄 요약처럼 지연을 허용하고 비용을 줄일 때)
+    - submit: 배치 id 를 바로 반환하고 나머지는 백그라운드 태스크에서 진행
+    - prepare: 상품별 크롤링 + 전처리 (prepare_concurrency 개씩)
+    - summarize: 캐시에 없는 상품만 배치로 제출, poll_interval 마다 완료 확인 후 결과를 요약 캐시에 기록
+    - 한 프롬프트에 담기지 않는 상품은 기존 map-reduce 요약으로 따로 처리
+    배치 상태는 프로세스 메모리에 보관하고, 끝난 배치는 ttl_seconds 가 지나면 정리한다.
+    """
+
+    def __init__(
+            self,
+            pipeline: ReviewSummaryPipelineUseCase,
+            *,
+            poll_interval: float,
+            prepare_concurrency: int,
+            ttl_seconds: int,
+    ):
+        self.pipeline = pipeline
+        self.summarize_usecase = pipeline.summarize_usecase
+        self.poll_interval = poll_interval
+        self.prepare_concurrency = max(1, prepare_concurrency)
+        self.ttl_seconds = ttl_seconds
+        self._batches: Dict[str, SummaryBatch] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def submit(self, products: List[Tuple[str, str, str]]) -> SummaryBatch:
+        """products: (name, price, info_url) 목록"""
+        self._evict_expired()
+        batch = SummaryBatch(items=[
+            SummaryBatchItem(name=name, price=price, info_url=info_url) for name, price, info_url in products
+        ])
+        self._batches[batch.batch_id] = batch
+
+        task = asyncio.create_task(self._process(batch), name=f"summary-batch-{batch.batch_id}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return batch
+
+    def get(self, batch_id: str) -> Optional[SummaryBatch]:
+        return self._batches.get(batch_id)
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _process(self, batch: SummaryBatch) -> None:
+        self._update(batch, status=JOB_RUNNING, stage="prepare")
+        try:
+            prepared = await self._prepare(batch)
+            self._update(batch, stage="summarize")
+            if prepared:
+                await self._summarize(batch, prepared)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.error(f"요약 배치 처리 중 오류 ({batch.batch_id}): {type(exc).__name__} - {exc}")
+            for item in batch.items:
+                if not item.summary and item.status != JOB_FAILED:
+                    self._fail(item, f"{type(exc).__name__}: {exc}")
+            self._update(batch, status=JOB_FAILED, error=f"{type(exc).__name__}: {exc}")
+            return
+
+        self._update(batch, status=JOB_SUCCEEDED, stage=None)
+
+    async def _prepare(self, batch: SummaryBatch) -> List[Tuple[SummaryBatchItem, List[str]]]:
+        semaphore = asyncio.Semaphore(self.prepare_concurrency)
+
+        async def collect(item: SummaryBatchItem) -> Optional[Tuple[SummaryBatchItem, List[str]]]:
+            async with semaphore:
+                try:
+                    reviews = await self.pipeline.collect_reviews(item.info_url)
+                except Exception as exc:
+                    self._fail(item, f"{type(exc).__name__}: {exc}")
+                    return None
+            item.status = JOB_RUNNING
+            return item, reviews
+
+        results = await asyncio.gather(*(collect(item) for item in batch.items))
+        return [result for result in results if result is not None]
+
+    async def _summarize(self, batch: SummaryBatch, prepared: List[Tuple[SummaryBatchItem, List[str]]]) -> None:
+        submission = await self.summarize_usecase.submit_batch([(item.name, reviews) for item, reviews in prepared])
+        self._update(batch, provider_batch_id=submission.batch_id)
+
+        # 큰 상품의 map-reduce 요약은 배치 대기와 함께 진행
+        oversized_indexes = set(submission.oversized)
+        oversized = asyncio.gather(*(
+            self._summarize_online(*prepared[index]) for index in submission.oversized
+        ))
+        try:
+            summaries = dict(submission.cached)
+            if submission.batch_id is not None:
+                summaries.update(await self._wait_batch(submission.batch_id, submission.sources))
+        except BaseException:
+            oversized.cancel()
+            await asyncio.gather(oversized, return_exceptions=True)
+            raise
+        await oversized
+
+        for index, (item, _) in enumerate(prepared):
+            if index in oversized_indexes:
+                continue
+            summary = summaries.get(submission.keys[index])
+            if summary:
+                item.status, item.summary = JOB_SUCCEEDED, summary
+            else:
+                self._fail(item, "batch request failed")
+
+    async def _wait_batch(
+            self,
+            provider_batch_id: str,
+            sources: Dict[str, Tuple[str, str]],
+    ) -> Dict[str, Optional[dict]]:
+        while True:
+            status = await self.summarize_usecase.batch_status(provider_batch_id)
+            if status == BATCH_COMPLETED:
+                return await self.summarize_usecase.collect_batch(provider_batch_id, sources)
+            if status != BATCH_IN_PROGRESS:
+                raise RuntimeError(f"provider batch {provider_batch_id} ended with status {status}")
+            await asyncio.sleep(self.poll_interval)
+
+    async def _summarize_online(self, item: SummaryBatchItem, reviews: List[str]) -> None:
+        try:
+            summary = await self.summarize_usecase.summarize_reviews_async(item.name, reviews)
+        except Exception as exc:
+            self._fail(item, f"{type(exc).__name__}: {exc}")
+            return
+        if summary.get("summary"):
+            item.status, item.summary = JOB_SUCCEEDED, summary
+        else:
+            self._fail(item, "summary is empty")
+
+    def _evict_expired(self) -> None:
+        expires_before = time.time() - self.ttl_seconds
+        for batch_id, batch in list(self._batches.items()):
+            if batch.is_finished and batch.updated_at < expires_before:
+                del self._batches[batch_id]
+
+    @staticmethod
+    def _fail(item: SummaryBatchItem, error: str) -> None:
+        item.status, item.error = JOB_FAILED, error
+
+    @staticmethod
+    def _update(batch: SummaryBatch, **changes) -> None:
+        for name, value in changes.items():
+            setattr(batch, name, value)
+        batch.updated_at = time.time()
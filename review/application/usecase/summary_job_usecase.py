@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from review.application.port.job_broker_port import JobBrokerPort
+from review.application.usecase.review_summary_pipeline_usecase import ReviewSummaryPipelineUseCase
+from review.domain.summary_job import (
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    TERMINAL_STATUSES,
+    SummaryJob,
+)
+
+logger = logging.getLogger(__name__)
+
+DEQUEUE_TIMEOUT_SECONDS = 1.0
+
+
+class SummaryJobUseCase:
+    """
+    리뷰 요약 작업 큐
+    - submit: 작업을 큐에 넣고 바로 job id 반환
+    - 워커 workers 개가 큐를 비우며 파이프라인 실행 (동시 실행 수 = workers)
+    - 단계 변경/완료 시 브로커로 이벤트 발행, 완료 후 webhook_url 이 있으면 알림
+    - 끝난 작업만 ack. 종료(stop) 시 처리 중이던 작업은 queued 로 되돌려 큐에 다시 넣고,
+      죽은 워커의 작업은 heartbeat_interval 마다 keepalive 에서 회수
+    """
+
+    def __init__(
+            self,
+            broker: JobBrokerPort,
+            pipeline: ReviewSummaryPipelineUseCase,
+            notifier=None,
+            *,
+            workers: int,
+            heartbeat_interval: float,
+    ):
+        self.broker = broker
+        self.pipeline = pipeline
+        self.notifier = notifier
+        self.workers = max(1, workers)
+        self.heartbeat_interval = heartbeat_interval
+        self._worker_tasks: List[asyncio.Task] = []
+
+    async def submit(self, name: str, price: str, info_url: str, webhook_url: Optional[str] = None) -> SummaryJob:
+        """허용되지 않는 webhook_url 이면 ValueError (전송 직전에도 notifier 가 다시 확인)."""
+        if webhook_url and self.notifier is not None:
+            await self.notifier.validate(webhook_url)
+        job = SummaryJob(name=name, price=price, info_url=info_url, webhook_url=webhook_url)
+        await self.broker.enqueue(job)
+        return job
+
+    async def get(self, job_id: str) -> Optional[SummaryJob]:
+        return await self.broker.load(job_id)
+
+    async def events(self, job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """현재 상태를 먼저 보내고, 작업이 끝날 때까지 진행 이벤트를 이어서 보냄. 없는 작업이면 ValueError."""
+        async with self.broker.subscribe(job_id) as events:
+            # 구독 후 상태를 읽어야 그 사이에 발행된 이벤트를 놓치지 않음
+            job = await self.broker.load(job_id)
+            if job is None:
+                raise ValueError(f"job not found: {job_id}")
+
+            yield self._event(job)
+            if job.is_finished:
+                return
+
+            async for event in events:
+                yield event
+                if event.get("status") in TERMINAL_STATUSES:
+                    return
+
+    def start(self) -> None:
+        if self._worker_tasks:
+            return
+        self._worker_tasks = [asyncio.create_task(self._keepalive(), name="summary-job-keepalive")]
+        self._worker_tasks += [
+            asyncio.create_task(self._work(), name=f"summary-job-worker-{index}")
+            for index in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    async def _keepalive(self) -> None:
+        while True:
+            try:
+                recovered = await self.broker.keepalive()
+                if recovered:
+                    logger.warning(f"중단된 워커의 요약 작업 {recovered}개를 큐로 되돌림")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error(f"작업 워커 keepalive 실패: {type(exc).__name__} - {exc}")
+            await asyncio.sleep(self.heartbeat_interval)
+
+    async def _work(self) -> None:
+        while True:
+            job_id = await self.broker.dequeue(DEQUEUE_TIMEOUT_SECONDS)
+            if job_id is None:
+                continue
+            try:
+                await self._process(job_id)
+            except asyncio.CancelledError:
+                # 종료 중: running 으로 남지 않도록 되돌린 뒤 취소를 이어서 전달
+                await asyncio.shield(self._requeue(job_id))
+                raise
+            except Exception as exc:
+                logger.error(f"요약 작업 처리 중 오류 ({job_id}): {type(exc).__name__} - {exc}")
+
+            try:
+                await self.broker.ack(job_id)
+            except Exception as exc:
+                logger.error(f"요약 작업 ack 실패 ({job_id}): {type(exc).__name__} - {exc}")
+
+    async def _requeue(self, job_id: str) -> None:
+        try:
+            job = await self.broker.load(job_id)
+            if job is not None and job.is_finished:
+                # 결과 저장 후 웹훅 전송 중에 종료된 경우: 다시 실행하지 않음
+                await self.broker.ack(job_id)
+                return
+            if job is not None:
+                job.status, job.stage = JOB_QUEUED, None
+                await self._update(job)
+            await self.broker.requeue(job_id)
+        except Exception as exc:
+            logger.error(f"요약 작업 되돌리기 실패 ({job_id}): {type(exc).__name__} - {exc}")
+
+    async def _process(self, job_id: str) -> None:
+        job = await self.broker.load(job_id)
+        if job is None or job.is_finished:
+            return
+
+        async def on_stage(stage: str) -> None:
+            job.stage = stage
+            await self._update(job)
+
+        job.status = JOB_RUNNING
+        await self._update(job)
+
+        try:
+            # 작업은 요청 연결과 무관하게 끝까지 실행
+            result = await self.pipeline.run(job.name, job.price, job.info_url, on_stage=on_stage)
+        except Exception as exc:
+            job.status = JOB_FAILED
+            job.error = f"{type(exc).__name__}: {exc}"
+        else:
+            job.status = JOB_SUCCEEDED
+            job.stage = None
+            job.result = {"summary": result["summary"], "pdf_url": result["pdf_url"]}
+        await self._update(job)
+
+        if job.webhook_url and self.notifier is not None:
+            await self.notifier.notify(job.webhook_url, job.to_dict())
+
+    async def _update(self, job: SummaryJob) -> None:
+        job.updated_at = time.time()
+        await self.broker.save(job)
+        await self.broker.publish(job.job_id, self._event(job))
+
+    @staticmethod
+    def _event(job: SummaryJob) -> Dict[str, Any]:
+        return {
+            "job_id": job.job_id,
+            "status": job.status,
+            "stage": job.stage,
+            "result": job.result,
+            "error": job.error,
+        }
@@ -1,37 +1,141 @@
+import math
+
 from fastapi import FastAPI
 
-from config.openai.config import openai_client
+from config import review_config
+from config.cache.single_flight import get_single_flight
+from config.lifespan import LifespanHooks
+from config.openai.config import async_openai_client, openai_client
+from config.openai.rate_limit import AsyncTokenBucket, CircuitBreaker
 from product_review_crawling_agents.application.usecase.product_review_crawling_agents_usecase import (
     ProductReviewAgentsUseCase,
 )
 from review.adapter.input.web.review_router import (
-    get_pdf_usecase,
-    get_preprocess_usecase,
-    get_review_crawling_usecase,
-    get_summarize_usecase,
+    get_summary_batch_usecase,
+    get_summary_job_usecase,
+    get_summary_pipeline_usecase,
+    get_summary_single_flight,
     review_router,
 )
+from review.adapter.output.fake_batch_adapter import FakeBatchAdapter
+from review.adapter.output.in_memory_job_broker import InMemoryJobBroker
 from review.adapter.output.llm_adapter import LLMAdapter
+from review.adapter.output.openai_batch_adapter import OpenAIBatchAdapter
 from review.adapter.output.pdf_adapter import PdfAdapter
 from review.adapter.output.s3_upload_adapter import S3UploaderAdapter
+from review.adapter.output.webhook_notifier import WebhookNotifier
+from review.application.port.batch_llm_port import BatchLLMPort
+from review.application.port.job_broker_port import JobBrokerPort
 from review.application.usecase.pdf_usecase import PdfUseCase
 from review.application.usecase.preprocess_usecase import PreprocessUseCase
+from review.application.usecase.review_selection_usecase import ReviewSelectionUseCase
+from review.application.usecase.review_summary_pipeline_usecase import ReviewSummaryPipelineUseCase
 from review.application.usecase.summarize_usecase import SummarizeUseCase
+from review.application.usecase.summary_batch_usecase import SummaryBatchUseCase
+from review.application.usecase.summary_job_usecase import SummaryJobUseCase
+from review.infrastructure.cache.summary_cache import build_summary_cache
+from review.infrastructure.client.fake_streaming_client import FakeStreamingClient
 from review.infrastructure.client.openai_client import OpenAIClient
+from review.infrastructure.preprocess_pool import get_preprocess_pool, shutdown_preprocess_pool
+
+
+def _build_job_broker() -> JobBrokerPort:
+    """REVIEW_JOB_BROKER 에 따라 작업 브로커 선택."""
+    if review_config.REVIEW_JOB_BROKER == "redis":
+        from config.redis_config import get_async_redis  # Redis 설정이 있을 때만 로딩
+        from review.adapter.output.redis_job_broker import RedisJobBroker  # noqa: WPS433
+
+        return RedisJobBroker(
+            get_async_redis(),
+            ttl_seconds=review_config.REVIEW_JOB_TTL_SECONDS,
+            heartbeat_ttl_seconds=math.ceil(review_config.REVIEW_JOB_HEARTBEAT_SECONDS * 3),
+        )
+    return InMemoryJobBroker()
 
 
-def setup_module(app: FastAPI) -> None:
+def _build_batch_port(client: OpenAIClient) -> BatchLLMPort:
+    """REVIEW_BATCH_BACKEND 에 따라 배치 요약 백엔드 선택."""
+    if review_config.REVIEW_BATCH_BACKEND == "fake":
+        return FakeBatchAdapter()
+    return OpenAIBatchAdapter(client.async_openai_client, model=client.model, max_tokens=client.max_tokens)
+
+
+def setup_module(app: FastAPI, lifespan: LifespanHooks) -> None:
     """Wire review module dependencies and routes."""
-    openai_client_adapter = OpenAIClient(openai_client)
+    openai_client_adapter = OpenAIClient(openai_client, async_openai_client)
+    llm_client = FakeStreamingClient() if review_config.REVIEW_LLM_CLIENT == "fake" else openai_client_adapter
 
     crawling_usecase = ProductReviewAgentsUseCase.get_instance()
-    preprocess_usecase = PreprocessUseCase()
-    summarize_usecase = SummarizeUseCase(LLMAdapter(openai_client_adapter))
+    preprocess_usecase = PreprocessUseCase(
+        process_pool=get_preprocess_pool(),
+        parallel_threshold=review_config.REVIEW_PREPROCESS_PARALLEL_THRESHOLD,
+        parallel_chunk_size=review_config.REVIEW_PREPROCESS_CHUNK_SIZE,
+        near_duplicate_threshold=review_config.REVIEW_NEAR_DUPLICATE_THRESHOLD,
+        minhash_permutations=review_config.REVIEW_NEAR_DUPLICATE_PERMUTATIONS,
+        max_dedup_entries=review_config.REVIEW_PREPROCESS_DEDUP_MAX_ENTRIES,
+    )
+    llm_adapter = LLMAdapter(
+        llm_client,
+        max_retries=review_config.LLM_MAX_RETRIES,
+        request_bucket=AsyncTokenBucket(review_config.LLM_REQUESTS_PER_MINUTE),
+        token_bucket=AsyncTokenBucket(review_config.LLM_TOKENS_PER_MINUTE),
+        circuit_breaker=CircuitBreaker(
+            failure_threshold=review_config.LLM_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=review_config.LLM_CIRCUIT_RESET_SECONDS,
+        ),
+        backoff_base=review_config.LLM_BACKOFF_BASE_SECONDS,
+        backoff_max=review_config.LLM_BACKOFF_MAX_SECONDS,
+    )
+    summarize_usecase = SummarizeUseCase(
+        llm_adapter,
+        build_summary_cache(),
+        chunk_tokens=review_config.REVIEW_SUMMARY_CHUNK_TOKENS,
+        map_concurrency=review_config.REVIEW_SUMMARY_MAP_CONCURRENCY,
+        batch_port=_build_batch_port(openai_client_adapter),
+        repair_attempts=review_config.REVIEW_SUMMARY_REPAIR_ATTEMPTS,
+    )
     pdf_usecase = PdfUseCase(PdfAdapter(), S3UploaderAdapter())
+    pipeline_usecase = ReviewSummaryPipelineUseCase(
+        crawling_usecase,
+        preprocess_usecase,
+        summarize_usecase,
+        pdf_usecase,
+        selection_usecase=ReviewSelectionUseCase(
+            token_budget=review_config.REVIEW_SELECTION_TOKEN_BUDGET,
+            model=openai_client_adapter.model,
+        ),
+    )
+    summary_single_flight = get_single_flight("review-summary")
+
+    webhook_notifier = WebhookNotifier(
+        timeout=review_config.REVIEW_JOB_WEBHOOK_TIMEOUT,
+        max_retries=review_config.REVIEW_JOB_WEBHOOK_MAX_RETRIES,
+        allowed_hosts=review_config.REVIEW_JOB_WEBHOOK_ALLOWED_HOSTS,
+    )
+    job_usecase = SummaryJobUseCase(
+        _build_job_broker(),
+        pipeline_usecase,
+        webhook_notifier,
+        workers=review_config.REVIEW_JOB_WORKERS,
+        heartbeat_interval=review_config.REVIEW_JOB_HEARTBEAT_SECONDS,
+    )
+    batch_usecase = SummaryBatchUseCase(
+        pipeline_usecase,
+        poll_interval=review_config.REVIEW_BATCH_POLL_SECONDS,
+        prepare_concurrency=review_config.REVIEW_BATCH_PREPARE_CONCURRENCY,
+        ttl_seconds=review_config.REVIEW_JOB_TTL_SECONDS,
+    )
+
+    app.dependency_overrides[get_summary_pipeline_usecase] = lambda: pipeline_usecase
+    app.dependency_overrides[get_summary_single_flight] = lambda: summary_single_flight
+    app.dependency_overrides[get_summary_job_usecase] = lambda: job_usecase
+    app.dependency_overrides[get_summary_batch_usecase] = lambda: batch_usecase
 
-    app.dependency_overrides[get_review_crawling_usecase] = lambda: crawling_usecase
-    app.dependency_overrides[get_preprocess_usecase] = lambda: preprocess_usecase
-    app.dependency_overrides[get_summarize_usecase] = lambda: summarize_usecase
-    app.dependency_overrides[get_pdf_usecase] = lambda: pdf_usecase
+    # 작업 워커는 이벤트 루프가 뜬 뒤 시작하고 종료 시 정리
+    lifespan.on_startup(job_usecase.start)
+    lifespan.on_shutdown(job_usecase.stop)
+    lifespan.on_shutdown(batch_usecase.stop)
+    lifespan.on_shutdown(webhook_notifier.aclose)
+    lifespan.on_shutdown(shutdown_preprocess_pool)
 
     app.include_router(review_router, prefix="/review")
@@ -0,0 +1,39 @@
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from review.domain.summary_job import JOB_QUEUED, TERMINAL_STATUSES
+
+
+@dataclass
+class SummaryBatchItem:
+    """배치 안의 상품 하나. status 는 SummaryJob 과 같은 JOB_* 상태를 사용한다."""
+
+    name: str
+    price: str
+    info_url: str
+    status: str = JOB_QUEUED
+    summary: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class SummaryBatch:
+    """여러 상품 요약을 provider 배치 API 한 번으로 처리하는 배치 작업 상태."""
+
+    items: List[SummaryBatchItem]
+    batch_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = JOB_QUEUED
+    stage: Optional[str] = None
+    provider_batch_id: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
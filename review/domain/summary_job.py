@@ -0,0 +1,38 @@
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+TERMINAL_STATUSES = frozenset({JOB_SUCCEEDED, JOB_FAILED})
+
+
+@dataclass
+class SummaryJob:
+    """리뷰 요약 작업 상태. 브로커에는 to_dict() 결과(JSON)로 저장된다."""
+
+    name: str
+    price: str
+    info_url: str
+    webhook_url: Optional[str] = None
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = JOB_QUEUED
+    stage: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SummaryJob":
+        return cls(**data)
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from config import review_config
+from config.cache.cache_backend import CacheBackend, InMemoryCacheBackend, TieredCacheBackend, get_cache_backend
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryCache:
+    """
+    LLM 요약 결과 캐시 (content-addressed)
+    - 키: 모델명 + 프롬프트 버전 + 상품명 + 전처리 텍스트의 sha256
+    - 입력이 하나라도 바뀌면 키가 달라지므로 별도 무효화 없이 TTL 로만 만료
+    """
+
+    def __init__(self, backend: CacheBackend, *, ttl_seconds: int):
+        self._backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._counters = {"hits": 0, "misses": 0, "stores": 0}
+
+    @staticmethod
+    def key(model: str, prompt_version: str, product_name: str, preprocessed_text: str) -> str:
+        digest = hashlib.sha256(
+            json.dumps([model, prompt_version, product_name, preprocessed_text], ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        return f"review:summary:{digest}"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self._backend.get(key)
+        if raw is not None:
+            try:
+                summary = json.loads(raw)
+            except ValueError:
+                logger.warning(f"요약 캐시 값 손상, 무시: {key}")
+            else:
+                self._counters["hits"] += 1
+                return summary
+
+        self._counters["misses"] += 1
+        return None
+
+    async def set(self, key: str, summary: Dict[str, Any]) -> None:
+        await self._backend.set(key, json.dumps(summary, ensure_ascii=False), self.ttl_seconds)
+        self._counters["stores"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._counters["hits"] + self._counters["misses"]
+        return {
+            **self._counters,
+            "hit_rate": round(self._counters["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+def build_summary_cache() -> Optional[SummaryCache]:
+    """REVIEW_SUMMARY_CACHE_BACKEND 설정에 따른 요약 캐시. 비활성화면 None."""
+    kind = review_config.REVIEW_SUMMARY_CACHE_BACKEND
+    if kind == "none":
+        return None
+
+    backend: CacheBackend = InMemoryCacheBackend(max_entries=review_config.REVIEW_SUMMARY_CACHE_MAX_ENTRIES)
+    if kind == "redis":
+        backend = TieredCacheBackend(
+            backend,
+            get_cache_backend("redis"),
+            local_ttl_seconds=review_config.REVIEW_SUMMARY_CACHE_LOCAL_TTL_SECONDS,
+        )
+    return SummaryCache(backend, ttl_seconds=review_config.REVIEW_SUMMARY_CACHE_TTL_SECONDS)
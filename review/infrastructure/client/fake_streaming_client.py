@@ -0,0 +1,42 @@
+import asyncio
+import json
+from typing import AsyncIterator, Optional, Sequence
+
+from review.infrastructure.client.openai_client import SUMMARY_MAX_TOKENS
+
+FAKE_SUMMARY = {
+    "summary": "테스트 요약입니다.",
+    "positive_features": "테스트 긍정 요소",
+    "negative_features": "없음",
+    "keywords": ["테스트"],
+}
+# 요약 캐시 키에 모델명이 들어가므로 실제 모델과 다른 이름을 써서 고정 응답이 실제 요약으로 캐시되지 않게 함
+FAKE_MODEL = "fake-streaming"
+
+
+class FakeStreamingClient:
+    """
+    OpenAIClient 대체용 (로컬 실행/테스트, REVIEW_LLM_CLIENT=fake)
+    고정 응답을 chunk_size 글자씩 delay 간격으로 스트리밍하고, fields 요청에는 해당 필드만 반환
+    """
+
+    def __init__(self, response: Optional[str] = None, *, chunk_size: int = 8, delay: float = 0.0):
+        self.response = response if response is not None else json.dumps(FAKE_SUMMARY, ensure_ascii=False)
+        self.chunk_size = max(1, chunk_size)
+        self.delay = delay
+        self.model = FAKE_MODEL
+        self.max_tokens = SUMMARY_MAX_TOKENS
+
+    def call_openai(self, prompt: str, fields: Optional[Sequence[str]] = None) -> str:
+        if not fields:
+            return self.response
+        return json.dumps({field: FAKE_SUMMARY[field] for field in fields}, ensure_ascii=False)
+
+    async def call_openai_async(self, prompt: str, fields: Optional[Sequence[str]] = None) -> str:
+        return self.call_openai(prompt, fields)
+
+    async def stream_openai_async(self, prompt: str) -> AsyncIterator[str]:
+        for start in range(0, len(self.response), self.chunk_size):
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            yield self.response[start:start + self.chunk_size]
@@ -1,13 +1,72 @@
+from typing import AsyncIterator, Optional, Sequence
+
 from openai import APIError, Timeout
+
+from review.infrastructure.summary_parser import SUMMARY_FIELDS
+
+SUMMARY_MODEL = "gpt-4.1"
+SUMMARY_MAX_TOKENS = 500
+
+
+def summary_response_format(fields: Optional[Sequence[str]] = None) -> dict:
+    """요약 JSON 스키마(structured output). fields 를 주면 해당 필드만 요구."""
+    fields = list(fields or SUMMARY_FIELDS)
+    properties = {
+        field: {"type": "array", "items": {"type": "string"}} if SUMMARY_FIELDS[field] is list else {"type": "string"}
+        for field in fields
+    }
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "product_summary",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": properties,
+                "required": fields,
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
 class OpenAIClient:
-    def __init__(self, openai_client):
+    def __init__(self, openai_client, async_openai_client=None):
         self.openai_client = openai_client  # config에서 만든 OpenAI client
+        self.async_openai_client = async_openai_client  # 이벤트 루프를 막지 않는 AsyncOpenAI client
+        self.model = SUMMARY_MODEL
+        self.max_tokens = SUMMARY_MAX_TOKENS
 
-    def call_openai(self, prompt: str) -> str:
+    def call_openai(self, prompt: str, fields: Optional[Sequence[str]] = None) -> str:
         response = self.openai_client.chat.completions.create(
-            model="gpt-4.1",
+            model=SUMMARY_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=SUMMARY_MAX_TOKENS,
+            temperature=0,
+            response_format=summary_response_format(fields),
+        )
+        return response.choices[0].message.content
+
+    async def call_openai_async(self, prompt: str, fields: Optional[Sequence[str]] = None) -> str:
+        response = await self.async_openai_client.chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=SUMMARY_MAX_TOKENS,
+            temperature=0,
+            response_format=summary_response_format(fields),
+        )
+        return response.choices[0].message.content
+
+    async def stream_openai_async(self, prompt: str) -> AsyncIterator[str]:
+        # 스트리밍 응답: 생성되는 대로 텍스트 조각(delta) 전달
+        stream = await self.async_openai_client.chat.completions.create(
+            model=SUMMARY_MODEL,
             messages=[{"role": "user", "content": prompt}],
-            max_tokens=500,
-            temperature=0
+            max_tokens=SUMMARY_MAX_TOKENS,
+            temperature=0,
+            response_format=summary_response_format(),
+            stream=True,
         )
-        return response.choices[0].message.content
\ No newline at end of file
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
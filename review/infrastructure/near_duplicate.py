@@ -0,0 +1,126 @@
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+_HASH_MASK = (1 << 64) - 1
+
+
+@lru_cache(maxsize=1 << 16)
+def _shingle_hash(shingle: str) -> int:
+    # 내장 hash() 는 프로세스마다 salt 가 달라 워커/재시작 간 서명이 달라지므로 고정 해시 사용
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def lsh_params(threshold: float, num_perm: int, min_recall: float = 0.95) -> Tuple[int, int]:
+    """
+    (bands, rows) 선택: 유사도가 정확히 threshold 인 쌍이 후보가 될 확률 1 - (1 - t^rows)^bands 가
+    min_recall 이상인 조합 중 rows 가 가장 큰 것 (후보는 실제 Jaccard 로 다시 확인하므로 재현율 우선)
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands < min_recall:
+            break
+        best = (bands, rows)
+    return best
+
+
+class NearDuplicateIndex:
+    """
+    MinHash + LSH 근사 중복 탐지
+    - 문자 shingle_size-gram 집합을 one-permutation MinHash(빈 bin 은 오른쪽 bin 값으로 채움)로 서명
+    - 서명을 bands 개 구간으로 나눠 버킷에 넣고, 같은 버킷에 걸린 후보만 실제 Jaccard 로 확인
+    리뷰 수에 거의 선형으로 동작 (모든 쌍 비교 없음)
+    max_entries 를 주면 가장 오래된 항목부터 색인에서 빼서 메모리를 일정하게 유지
+    """
+
+    def __init__(
+            self,
+            *,
+            threshold: float,
+            num_perm: int = 64,
+            shingle_size: int = 3,
+            max_entries: Optional[int] = None,
+    ):
+        self.threshold = threshold
+        self.shingle_size = max(1, shingle_size)
+        self.max_entries = max_entries
+        self.bands, self.rows = lsh_params(threshold, max(1, num_perm))
+        self.num_perm = self.bands * self.rows
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(self.bands)]
+        # 항목 id → (shingle 집합, 밴드 키), 추가 순서 유지
+        self._entries: "OrderedDict[int, Tuple[FrozenSet[str], List[Tuple[int, ...]]]]" = OrderedDict()
+        self._next_id = 0
+
+    def add_if_unique(self, text: str) -> bool:
+        """기존 텍스트와 Jaccard 유사도가 threshold 이상이면 False, 아니면 색인에 추가하고 True."""
+        shingles = self._shingle(text)
+        band_keys = self._band_keys(self._signature(shingles))
+
+        checked = set()
+        for band, key in enumerate(band_keys):
+            for candidate in self._buckets[band].get(key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                if self._jaccard(shingles, self._entries[candidate][0]) >= self.threshold:
+                    return False
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = (shingles, band_keys)
+        for band, key in enumerate(band_keys):
+            self._buckets[band].setdefault(key, []).append(entry_id)
+
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            self._evict_oldest()
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict_oldest(self) -> None:
+        entry_id, (_, band_keys) = self._entries.popitem(last=False)
+        for band, key in enumerate(band_keys):
+            bucket = self._buckets[band][key]
+            bucket.remove(entry_id)
+            if not bucket:
+                del self._buckets[band][key]
+
+    def _shingle(self, text: str) -> FrozenSet[str]:
+        text = " ".join(text.split())
+        if len(text) <= self.shingle_size:
+            return frozenset((text,))
+        return frozenset(text[start:start + self.shingle_size] for start in range(len(text) - self.shingle_size + 1))
+
+    def _signature(self, shingles: FrozenSet[str]) -> List[int]:
+        bins: List[Optional[int]] = [None] * self.num_perm
+        for shingle in shingles:
+            value = _shingle_hash(shingle)
+            slot, rank = value % self.num_perm, value // self.num_perm
+            if bins[slot] is None or rank < bins[slot]:
+                bins[slot] = rank
+
+        # 빈 bin 은 오른쪽(순환)으로 가장 가까운 bin 값 + 거리로 채움 (rotation densification)
+        if None in bins:
+            filled = list(bins)
+            for slot in range(self.num_perm):
+                if bins[slot] is not None:
+                    continue
+                for distance in range(1, self.num_perm):
+                    value = bins[(slot + distance) % self.num_perm]
+                    if value is not None:
+                        filled[slot] = value + distance * (_HASH_MASK // self.num_perm)
+                        break
+            bins = filled
+        return bins
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple[int, ...]]:
+        return [tuple(signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    @staticmethod
+    def _jaccard(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+        if not left and not right:
+            return 1.0
+        return len(left & right) / len(left | right)
@@ -0,0 +1,21 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from config import review_config
+
+_preprocess_pool_instance: ProcessPoolExecutor | None = None
+
+
+def get_preprocess_pool() -> Optional[ProcessPoolExecutor]:
+    """대량 리뷰 전처리용 프로세스 풀 (Singleton). REVIEW_PREPROCESS_WORKERS 가 0 이하면 None (단일 프로세스)."""
+    global _preprocess_pool_instance
+    if _preprocess_pool_instance is None and review_config.REVIEW_PREPROCESS_WORKERS > 0:
+        _preprocess_pool_instance = ProcessPoolExecutor(max_workers=review_config.REVIEW_PREPROCESS_WORKERS)
+    return _preprocess_pool_instance
+
+
+def shutdown_preprocess_pool() -> None:
+    global _preprocess_pool_instance
+    if _preprocess_pool_instance is not None:
+        _preprocess_pool_instance.shutdown(wait=False, cancel_futures=True)
+        _preprocess_pool_instance = None
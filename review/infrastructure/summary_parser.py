@@ -0,0 +1,114 @@
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# ProductSummary 중 LLM 이 채우는 필드와 타입 (name/price 는 요청값 사용)
+SUMMARY_FIELDS: Dict[str, type] = {
+    "summary": str,
+    "positive_features": str,
+    "negative_features": str,
+    "keywords": list,
+}
+
+_CODE_FENCE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL | re.IGNORECASE)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+# 객체 안에서 잘린 마지막 키(값 없음) 또는 끝의 쉼표
+_DANGLING_KEY = re.compile(r'(?:,\s*"[^"]*"\s*:?\s*|,\s*)$')
+_DANGLING_COMMA = re.compile(r",\s*$")
+_KEYWORD_SEPARATOR = re.compile(r"[,\n]")
+_DECODER = json.JSONDecoder()
+
+
+def extract_json_object(raw: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    LLM 응답 문자열에서 JSON 객체 추출
+    - 코드 펜스/앞 설명 문장 제거 후 첫 '{' 부터 객체 하나만 디코딩 (뒤에 붙은 설명은 무시)
+    - 실패하면 끝의 쉼표 제거 + max_tokens 로 잘린 문자열/괄호를 닫아 한 번 더 시도
+    """
+    if not raw:
+        return None
+
+    text = raw.strip()
+    fence = _CODE_FENCE.search(text)
+    if fence:
+        text = fence.group(1)
+
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    try:
+        value, _ = _DECODER.raw_decode(text, start)
+    except ValueError:
+        try:
+            value = json.loads(_repair(text[start:]))
+        except ValueError:
+            return None
+    return value if isinstance(value, dict) else None
+
+
+def validate_summary(data: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    SUMMARY_FIELDS 기준으로 검증/보정
+    반환: (유효한 필드만 담은 dict, 누락되었거나 타입을 맞출 수 없는 필드 목록)
+    """
+    summary: Dict[str, Any] = {}
+    broken: List[str] = []
+    for field, kind in SUMMARY_FIELDS.items():
+        value = _coerce((data or {}).get(field), kind)
+        if value is None:
+            broken.append(field)
+        else:
+            summary[field] = value
+    return summary, broken
+
+
+def parse_summary(raw: Optional[str]) -> Tuple[Dict[str, Any], List[str]]:
+    return validate_summary(extract_json_object(raw))
+
+
+def _coerce(value: Any, kind: type) -> Any:
+    if kind is str:
+        if isinstance(value, str):
+            return value.strip()
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        if isinstance(value, list) and all(isinstance(item, str) for item in value):
+            return " ".join(item.strip() for item in value)
+        return None
+
+    if isinstance(value, str):
+        value = _KEYWORD_SEPARATOR.split(value)
+    if not isinstance(value, list):
+        return None
+
+    # 문자열 키워드만 남기고 순서를 유지한 채 중복 제거
+    keywords = [str(item).strip() for item in value if isinstance(item, (str, int, float)) and str(item).strip()]
+    return list(dict.fromkeys(keywords))
+
+
+def _repair(text: str) -> str:
+    closers: List[str] = []
+    in_string = escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            closers.append("}" if char == "{" else "]")
+        elif char in "}]" and closers:
+            closers.pop()
+
+    if escaped:
+        text = text[:-1]
+    repaired = (text + ('"' if in_string else "")).rstrip()
+    dangling = _DANGLING_KEY if closers and closers[-1] == "}" else _DANGLING_COMMA
+    repaired = dangling.sub("", repaired)
+    repaired += "".join(reversed(closers))
+    return _TRAILING_COMMA.sub(r"\1", repaired)
@@ -0,0 +1,37 @@
+import logging
+import math
+import re
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    # tiktoken 이 설치되어 있을 때만 정확히 계산, 없으면 근사치 사용
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as exc:
+        # 인코딩 파일을 내려받지 못하는 환경(오프라인 등)에서는 근사치로 대체
+        logger.warning(f"tiktoken 인코딩 로딩 실패, 근사 토큰 수 사용: {type(exc).__name__} - {exc}")
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """model 기준 토큰 수. tiktoken 이 없으면 한글 1자 ≈ 1토큰, 그 외 4자 ≈ 1토큰으로 근사 (여유 있게 큰 값)."""
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+
+    hangul_count = len(_HANGUL_RE.findall(text))
+    return hangul_count + math.ceil((len(text) - hangul_count) / 4)
@@ -1,3 +1,18 @@
+import json
+from typing import Any, Dict, List
+
+# 프롬프트 문구를 바꾸면 올려서 이전 요약 캐시를 무효화
+PROMPT_VERSION = "summary-v3"
+
+# 필드 재요청(repair) 프롬프트에 넣는 필드별 요구 사항
+FIELD_REQUIREMENTS = {
+    "summary": '"summary": 리뷰 전체의 핵심 내용을 2~4문장으로 간결하게 요약한 문자열',
+    "positive_features": '"positive_features": 긍정적인 요소 1~2줄 요약 문자열',
+    "negative_features": '"negative_features": 반복된 불만 1~2줄 요약 문자열, 없으면 "없음"',
+    "keywords": '"keywords": 긍정 키워드 5~6개 문자열 배열, 부정 키워드 제외, 중복 제거',
+}
+
+
 class ReviewPrompts:
     @staticmethod
     def summary(product_name: str, preprocessed_reviews: str) -> str:
@@ -26,4 +41,81 @@ class ReviewPrompts:
         - 입력 리뷰 외 사실 추가 금지
         - 모든 값은 문자열 또는 배열, null/undefined 금지
         - 출력은 반드시 유효한 JSON
-        """
\ No newline at end of file
+        """
+
+    @staticmethod
+    def chunk_summary(product_name: str, preprocessed_reviews: str, part: int, total_parts: int) -> str:
+        return f"""
+        당신은 전자상거래 리뷰 분석 전문가입니다.
+        아래는 상품 '{product_name}' 리뷰 전체 중 {part}/{total_parts} 번째 묶음이며, 이 묶음의 리뷰 내용만 기반해 부분 요약 JSON을 생성해야 합니다.
+        부분 요약은 이후 다른 묶음의 요약과 합쳐지므로, 반복되는 의견과 빈도가 드러나도록 작성하세요.
+
+        입력 리뷰(전처리 완료):
+        {preprocessed_reviews}
+
+        반드시 JSON 스키마에 따라 출력, 추가 문장/설명 없이 순수 JSON 반환:
+        {{
+          "summary": "이 묶음의 핵심 내용 2~4문장",
+          "positive_features": "긍정 요소 요약",
+          "negative_features": "부정 요소 요약 또는 없음",
+          "keywords": ["키워드1", "키워드2", "키워드3", "키워드4", "키워드5"]
+        }}
+
+        제약:
+        - 입력 리뷰 외 사실 추가 금지
+        - 모든 값은 문자열 또는 배열, null/undefined 금지
+        - 출력은 반드시 유효한 JSON
+        """
+
+    @staticmethod
+    def merge(product_name: str, partial_summaries: str) -> str:
+        return f"""
+        당신은 전자상거래 리뷰 분석 전문가입니다.
+        아래는 상품 '{product_name}' 리뷰를 여러 묶음으로 나누어 각각 요약한 부분 요약 JSON 목록입니다.
+        부분 요약들만 기반해 리뷰 전체를 대표하는 하나의 JSON을 생성해야 합니다.
+
+        부분 요약 목록:
+        {partial_summaries}
+
+        요구 사항:
+        1) "summary": 여러 묶음에 공통된 핵심 내용을 2~4문장으로 간결하게 요약
+        2) "positive_features": 긍정적인 요소 1~2줄 요약
+        3) "negative_features": 여러 묶음에서 반복된 불만 1~2줄 요약, 없으면 "없음"
+        4) "keywords": 긍정 키워드 5~6개 추출, 부정 키워드 제외, 중복 제거
+
+        반드시 JSON 스키마에 따라 출력, 추가 문장/설명 없이 순수 JSON 반환:
+        {{
+          "summary": "요약문장...",
+          "positive_features": "긍정 요소 요약...",
+          "negative_features": "부정 요소 요약 또는 없음",
+          "keywords": ["키워드1", "키워드2", "키워드3", "키워드4", "키워드5"]
+        }}
+
+        제약:
+        - 부분 요약 외 사실 추가 금지
+        - 모든 값은 문자열 또는 배열, null/undefined 금지
+        - 출력은 반드시 유효한 JSON
+        """
+
+    @staticmethod
+    def repair_fields(product_name: str, source_text: str, partial_summary: Dict[str, Any], fields: List[str]) -> str:
+        requirements = "\n        ".join(FIELD_REQUIREMENTS[field] for field in fields)
+        return f"""
+        당신은 전자상거래 리뷰 분석 전문가입니다.
+        상품 '{product_name}'의 아래 입력으로 요약 JSON을 만들었으나 일부 필드가 누락되었거나 형식이 잘못되었습니다.
+        이미 만들어진 필드는 참고만 하고, 아래 필드만 다시 생성해 해당 필드만 담은 JSON으로 반환하세요.
+
+        입력:
+        {source_text}
+
+        이미 만들어진 필드:
+        {json.dumps(partial_summary, ensure_ascii=False)}
+
+        다시 생성할 필드:
+        {requirements}
+
+        제약:
+        - 입력 외 사실 추가 금지
+        - 모든 값은 문자열 또는 배열, null/undefined 금지
+        - 추가 문장/설명 없이 순수 JSON 반환
+        """
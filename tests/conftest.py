@@ -0,0 +1,24 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+# 테스트에서는 외부 서비스(OpenAI/Redis)를 쓰지 않도록 기본값 고정
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("REVIEW_LLM_CLIENT", "fake")
+
+
+@pytest.fixture
+def fixtures_dir() -> Path:
+    return FIXTURES_DIR
+
+
+def read_fixture(name: str) -> str:
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+
+from config.cache import cache_backend
+from config.cache.cache_backend import InMemoryCacheBackend
+from product_review_collector.infrastructure.cache import crawl_result_cache
+from product_review_collector.infrastructure.cache.crawl_result_cache import CrawlResultCache
+
+TTL_SECONDS = 60
+STALE_SECONDS = 30
+PRODUCT_URL = "https://smartstore.naver.com/store/products/1"
+
+
+class _Clock:
+    """CrawlResultCache(time.time) 와 InMemoryCacheBackend(time.monotonic) 가 함께 보는 시계."""
+
+    def __init__(self):
+        self.now = 1_000.0
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class _Crawler:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, is_disconnected=None):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return {"reviews": [f"crawl-{self.calls}"]}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(crawl_result_cache, "time", clock)
+    monkeypatch.setattr(cache_backend, "time", clock)
+    return clock
+
+
+def _cache(max_entries=None) -> CrawlResultCache:
+    return CrawlResultCache(
+        InMemoryCacheBackend(max_entries=max_entries),
+        namespace="test",
+        ttl_seconds=TTL_SECONDS,
+        stale_seconds=STALE_SECONDS,
+    )
+
+
+async def _settle(cache: CrawlResultCache) -> None:
+    if cache._refresh_tasks:
+        await asyncio.gather(*cache._refresh_tasks)
+
+
+def test_fresh_hit_returns_cached_result_without_crawling(clock):
+    async def run():
+        cache, crawl = _cache(), _Crawler()
+        first = await cache.get_or_crawl(PRODUCT_URL, crawl)
+        clock.now += TTL_SECONDS - 1
+        second = await cache.get_or_crawl(PRODUCT_URL, crawl)
+        return first, second, crawl.calls, cache._refresh_tasks
+
+    first, second, calls, refresh_tasks = asyncio.run(run())
+    assert first == second == {"reviews": ["crawl-1"]}
+    assert calls == 1 and not refresh_tasks
+
+
+def test_stale_hit_serves_old_result_and_refreshes_once_in_background(clock):
+    async def run():
+        cache, crawl = _cache(), _Crawler()
+        await cache.get_or_crawl(PRODUCT_URL, crawl)
+        clock.now += TTL_SECONDS + 1
+        stale = [await cache.get_or_crawl(PRODUCT_URL, crawl) for _ in range(3)]
+        await _settle(cache)
+        refreshed = await cache.get_or_crawl(PRODUCT_URL, crawl)
+        return stale, refreshed, crawl.calls
+
+    stale, refreshed, calls = asyncio.run(run())
+    assert stale == [{"reviews": ["crawl-1"]}] * 3
+    assert calls == 2  # 최초 1회 + 백그라운드 갱신 1회
+    assert refreshed == {"reviews": ["crawl-2"]}
+
+
+def test_result_past_stale_window_is_crawled_again(clock):
+    async def run():
+        cache, crawl = _cache(), _Crawler()
+        await cache.get_or_crawl(PRODUCT_URL, crawl)
+        clock.now += TTL_SECONDS + STALE_SECONDS + 1
+        expired_lookup = await cache.lookup(PRODUCT_URL)
+        result = await cache.get_or_crawl(PRODUCT_URL, crawl)
+        return expired_lookup, result, crawl.calls, cache._refresh_tasks
+
+    expired_lookup, result, calls, refresh_tasks = asyncio.run(run())
+    assert expired_lookup is None
+    assert result == {"reviews": ["crawl-2"]}
+    assert calls == 2 and not refresh_tasks
+
+
+def test_equivalent_product_urls_share_one_entry(clock):
+    async def run():
+        cache, crawl = _cache(), _Crawler()
+        await cache.get_or_crawl(PRODUCT_URL, crawl)
+        return await cache.get_or_crawl("https://M.smartstore.naver.com/store/products/1/?NaPm=ct%3Dabc#reviews", crawl), crawl.calls
+
+    result, calls = asyncio.run(run())
+    assert result == {"reviews": ["crawl-1"]} and calls == 1
+
+
+def test_invalidate_forces_next_request_to_crawl(clock):
+    async def run():
+        cache, crawl = _cache(), _Crawler()
+        await cache.get_or_crawl(PRODUCT_URL, crawl)
+        invalidated = await cache.invalidate(PRODUCT_URL)
+        invalidated_again = await cache.invalidate(PRODUCT_URL)
+        result = await cache.get_or_crawl(PRODUCT_URL, crawl)
+        return invalidated, invalidated_again, result
+
+    invalidated, invalidated_again, result = asyncio.run(run())
+    assert invalidated is True and invalidated_again is False
+    assert result == {"reviews": ["crawl-2"]}
+
+
+def test_least_recently_used_product_is_evicted_at_max_entries(clock):
+    urls = [f"https://smartstore.naver.com/store/products/{index}" for index in range(3)]
+
+    async def run():
+        cache, crawl = _cache(max_entries=2), _Crawler()
+        await cache.get_or_crawl(urls[0], crawl)
+        await cache.get_or_crawl(urls[1], crawl)
+        await cache.get_or_crawl(urls[0], crawl)  # urls[1] 이 가장 오래 사용하지 않은 항목이 됨
+        await cache.get_or_crawl(urls[2], crawl)
+        return [await cache.lookup(url) is not None for url in urls]
+
+    assert asyncio.run(run()) == [True, False, True]
+
+
+def test_memory_backend_is_bounded_by_crawl_cache_max_entries(monkeypatch):
+    monkeypatch.setattr(cache_backend.crawler_config, "CRAWL_CACHE_MAX_ENTRIES", 2)
+    monkeypatch.setattr(cache_backend, "_backend_instances", {})
+
+    backend = cache_backend.get_cache_backend("memory")
+
+    async def run():
+        for index in range(3):
+            await backend.set(f"key-{index}", "value", TTL_SECONDS)
+        return [await backend.get(f"key-{index}") for index in range(3)]
+
+    assert asyncio.run(run()) == [None, "value", "value"]
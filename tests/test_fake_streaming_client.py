@@ -0,0 +1,35 @@
+import asyncio
+import json
+
+from config.cache.cache_backend import InMemoryCacheBackend
+from review.adapter.output.llm_adapter import LLMAdapter
+from review.application.usecase.summarize_usecase import SummarizeUseCase
+from review.infrastructure.cache.summary_cache import SummaryCache
+from review.infrastructure.client.fake_streaming_client import FAKE_SUMMARY, FakeStreamingClient
+from review.infrastructure.client.openai_client import SUMMARY_MODEL
+
+REAL_SUMMARY = {
+    "summary": "배송이 빠르다는 평가가 많습니다.",
+    "positive_features": "빠른 배송",
+    "negative_features": "없음",
+    "keywords": ["배송"],
+}
+REVIEWS = ["배송이 정말 빨라요", "포장이 꼼꼼해요"]
+
+
+def test_fake_summaries_are_not_served_for_the_real_model():
+    cache = SummaryCache(InMemoryCacheBackend(), ttl_seconds=60)
+    # 실제 OpenAIClient 처럼 SUMMARY_MODEL 을 보고하는 클라이언트
+    real_client = FakeStreamingClient(json.dumps(REAL_SUMMARY, ensure_ascii=False))
+    real_client.model = SUMMARY_MODEL
+
+    async def run():
+        fake = await SummarizeUseCase(LLMAdapter(FakeStreamingClient()), cache).summarize_reviews_async("상품", REVIEWS)
+        real = await SummarizeUseCase(LLMAdapter(real_client), cache).summarize_reviews_async("상품", REVIEWS)
+        return fake, real
+
+    fake, real = asyncio.run(run())
+
+    assert LLMAdapter(FakeStreamingClient()).model_name != SUMMARY_MODEL
+    assert fake == FAKE_SUMMARY
+    assert real == REAL_SUMMARY
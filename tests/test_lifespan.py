@@ -0,0 +1,57 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI
+
+from config.lifespan import LifespanHooks
+
+
+def test_hooks_run_in_registration_order_and_shutdown_survives_failures():
+    calls = []
+    hooks = LifespanHooks()
+
+    async def aclose():
+        calls.append("aclose")
+
+    def broken():
+        raise RuntimeError("boom")
+
+    hooks.on_startup(lambda: calls.append("start"))
+    hooks.on_shutdown(aclose)
+    hooks.on_shutdown(broken)
+    hooks.on_shutdown(lambda: calls.append("pool"))
+
+    asyncio.run(hooks.startup())
+    asyncio.run(hooks.shutdown())
+
+    assert calls == ["start", "aclose", "pool"]
+
+
+def test_fastapi_lifespan_runs_hooks_around_serving():
+    testclient = pytest.importorskip("fastapi.testclient")
+
+    calls = []
+    hooks = LifespanHooks()
+    hooks.on_startup(lambda: calls.append("start"))
+    hooks.on_shutdown(lambda: calls.append("stop"))
+
+    @asynccontextmanager
+    async def lifespan(app):
+        await hooks.startup()
+        try:
+            yield
+        finally:
+            await hooks.shutdown()
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/ping")
+    def ping():
+        calls.append("request")
+        return {}
+
+    with testclient.TestClient(app) as client:
+        client.get("/ping")
+
+    assert calls == ["start", "request", "stop"]
@@ -0,0 +1,151 @@
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from config.crawl_executor import CrawlCancelledError
+from product_review_collector.adapter.output.naver_http_review_adapter import (
+    REVIEW_QUERY_PATH,
+    NaverHttpReviewAdapter,
+    NaverReviewFetchError,
+)
+from tests.conftest import read_fixture
+
+API_BASE = "https://review-stub.test"
+PRODUCT_URL = "https://smartstore.naver.com/stub/products/8123456789"
+
+
+class _ReviewApiStub:
+    """기록해 둔 상품 페이지/리뷰 API 응답을 재생하는 httpx.MockTransport 핸들러."""
+
+    def __init__(self, product_html: str, pages: dict):
+        self.product_html = product_html
+        self.pages = pages
+        self.requested_pages = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET" and str(request.url) == PRODUCT_URL:
+            return httpx.Response(200, text=self.product_html, headers={"content-type": "text/html"})
+
+        if request.method == "POST" and str(request.url) == f"{API_BASE}{REVIEW_QUERY_PATH}":
+            body = json.loads(request.content)
+            assert body["checkoutMerchantNo"] == "510123456"
+            assert body["originProductNo"] == "8101234567"
+            self.requested_pages.append(body["page"])
+            page = self.pages.get(str(body["page"]))
+            if page is None:
+                return httpx.Response(404)
+            return httpx.Response(200, json=page)
+
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def stub() -> _ReviewApiStub:
+    return _ReviewApiStub(
+        read_fixture("naver_product_page.html"),
+        json.loads(read_fixture("naver_review_api_pages.json")),
+    )
+
+
+def _adapter(stub: _ReviewApiStub, **options) -> NaverHttpReviewAdapter:
+    options.setdefault("page_size", 2)
+    options.setdefault("max_reviews", 100)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(stub))
+    return NaverHttpReviewAdapter(client, api_base=API_BASE, concurrency=2, **options)
+
+
+def test_fetch_reviews_collects_every_page_in_order(stub):
+    async def run():
+        adapter = _adapter(stub)
+        try:
+            return await adapter.fetch_reviews(PRODUCT_URL)
+        finally:
+            await adapter.aclose()
+
+    reviews = asyncio.run(run())
+
+    assert list(reviews) == [1, 2, 3, 4, 5]
+    assert [review["content"] for review in reviews.values()] == [
+        "배송이 빨라요 정말로",
+        "품질이 좋아요 정말로",
+        "사이즈가 작아요 정말로",
+        "색상이 예뻐요 정말로",
+        "재구매 의사 있어요 정말로",
+    ]
+    assert [review["rating"] for review in reviews.values()] == [5.0, 4.0, 2.0, 5.0, 5.0]
+    assert reviews[1]["created_at"] == datetime(2024, 3, 1, 10, 0)
+    assert reviews[1]["review_writer"] == "user1****"
+    assert sorted(stub.requested_pages) == [1, 2, 3]
+
+
+def test_stream_reviews_stops_at_max_reviews(stub):
+    async def run():
+        adapter = _adapter(stub, max_reviews=3)
+        try:
+            return [page async for page in adapter.stream_reviews(PRODUCT_URL)]
+        finally:
+            await adapter.aclose()
+
+    pages = asyncio.run(run())
+
+    assert [len(page) for page in pages] == [2, 1]
+    assert 3 not in stub.requested_pages
+
+
+def test_fetch_reviews_fails_without_product_keys(stub):
+    stub.product_html = "<html><body>상품 정보 없음</body></html>"
+
+    async def run():
+        adapter = _adapter(stub)
+        try:
+            await adapter.fetch_reviews(PRODUCT_URL)
+        finally:
+            await adapter.aclose()
+
+    with pytest.raises(NaverReviewFetchError):
+        asyncio.run(run())
+
+
+def test_fetch_reviews_stops_when_client_disconnects(stub):
+    async def disconnected() -> bool:
+        return True
+
+    async def run():
+        adapter = _adapter(stub)
+        try:
+            await adapter.fetch_reviews(PRODUCT_URL, is_disconnected=disconnected)
+        finally:
+            await adapter.aclose()
+
+    with pytest.raises(CrawlCancelledError):
+        asyncio.run(run())
+    assert stub.requested_pages == []
+
+
+def test_closing_stream_early_awaits_prefetched_pages(stub):
+    async def slow_api(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST" and json.loads(request.content)["page"] > 2:
+            await asyncio.sleep(10)
+        return stub(request)
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(slow_api))
+        adapter = NaverHttpReviewAdapter(client, api_base=API_BASE, concurrency=2, page_size=2, max_reviews=100)
+        try:
+            stream = adapter.stream_reviews(PRODUCT_URL)
+            pages = [await stream.__anext__(), await stream.__anext__()]
+            await stream.aclose()
+            leftover = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            return pages, leftover
+        finally:
+            await adapter.aclose()
+
+    pages, leftover = asyncio.run(run())
+
+    assert [len(page) for page in pages] == [2, 2]
+    # 미리 요청해 둔 3 페이지 요청은 취소가 끝날 때까지 기다린 뒤 스트림이 닫힘
+    assert leftover == []
@@ -0,0 +1,51 @@
+import importlib.util
+from datetime import datetime
+
+import pytest
+
+from product_review_collector.adapter.output.naver_review_html_parser import (
+    parse_review_page,
+    parse_total_review_count,
+)
+from tests.conftest import read_fixture
+
+_BACKEND_MODULES = {"selectolax": "selectolax", "lxml": "lxml", "bs4": "bs4"}
+BACKENDS = [
+    pytest.param(
+        backend,
+        marks=pytest.mark.skipif(importlib.util.find_spec(module) is None, reason=f"{module} 미설치"),
+    )
+    for backend, module in _BACKEND_MODULES.items()
+]
+
+
+@pytest.fixture(scope="module")
+def review_html() -> str:
+    return read_fixture("naver_review_page.html")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_parse_review_page(review_html, backend):
+    reviews = parse_review_page(review_html, backend)
+
+    assert [review["content"] for review in reviews] == [
+        "배송이 정말 빨라요. 포장도 꼼꼼하고 품질도 좋습니다.",
+        "사이즈가 생각보다 작아서 교환했어요.",
+        "가격 대비 만족합니다",
+    ]
+    assert [review["rating"] for review in reviews] == [5.0, 2.0, 4.0]
+    assert reviews[0]["created_at"] == datetime(2024, 3, 15)
+    assert reviews[2]["created_at"] is None
+    assert reviews[0]["review_writer"] == "abcd****"
+    assert reviews[2]["review_writer"] is None
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_parse_total_review_count(review_html, backend):
+    assert parse_total_review_count(review_html, backend) == 1234
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_agree_on_empty_page(backend):
+    assert parse_review_page("<html><body></body></html>", backend) == []
+    assert parse_total_review_count("<html><body></body></html>", backend) == 0
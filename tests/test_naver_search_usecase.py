@@ -0,0 +1,75 @@
+import asyncio
+from typing import List
+
+from naver.application.port.naver_search_port import NaverSearchPort
+from naver.application.usecase.naver_search_usecase import NaverSearchUseCase
+from naver.domain.product import Product
+from naver.infrastructure.cache.search_cursor_cache import SearchCursorCache
+
+
+class _FakeShoppingApi(NaverSearchPort):
+    """Every other upstream item is a SmartStore product; pages answer with a small delay."""
+
+    def __init__(self, total: int = 1000):
+        self.total = total
+        self.calls: List[int] = []
+
+    def _page(self, start: int, display: int) -> List[Product]:
+        products = []
+        for position in range(start, min(start + display, self.total + 1)):
+            host = "smartstore.naver.com" if position % 2 else "shopping.example.com"
+            products.append(Product(name=f"상품 {position}", thumbnail_url="", price=position,
+                                    info_url=f"https://{host}/products/{position}"))
+        return products
+
+    def search_products(self, query: str, start: int = 1, display: int = 10) -> List[Product]:
+        self.calls.append(start)
+        return self._page(start, display)
+
+    async def search_products_async(self, query: str, start: int = 1, display: int = 10) -> List[Product]:
+        self.calls.append(start)
+        await asyncio.sleep(0.01)
+        return self._page(start, display)
+
+
+def _usecase(api: _FakeShoppingApi) -> NaverSearchUseCase:
+    cache = SearchCursorCache(max_entries=8, ttl_seconds=60)
+    return NaverSearchUseCase(api, max_concurrency=2, cursor_cache=cache, max_upstream_calls=10)
+
+
+def test_concurrent_deeper_pages_do_not_lose_cursor_progress():
+    api = _FakeShoppingApi()
+    usecase = _usecase(api)
+
+    async def run():
+        await usecase.search_products_async("이어폰", start=1, display=10)
+        # Two requests extend the same cursor at once; the longer progress must survive whichever stores last
+        deep, shallow = await asyncio.gather(
+            usecase.search_products_async("이어폰", start=41, display=20),
+            usecase.search_products_async("이어폰", start=21, display=10),
+        )
+        return deep, shallow, await usecase.cursor_cache.get("이어폰")
+
+    deep, shallow, cursor = asyncio.run(run())
+
+    assert [product.price for product in deep.items] == list(range(81, 120, 2))
+    assert [product.price for product in shallow.items] == list(range(41, 60, 2))
+    assert len(cursor.products) >= 60
+    assert cursor.raw_positions == sorted(set(cursor.raw_positions))
+
+
+def test_cached_cursor_answers_without_upstream_calls():
+    api = _FakeShoppingApi()
+    usecase = _usecase(api)
+
+    async def run():
+        await usecase.search_products_async("이어폰", start=1, display=20)
+        calls = len(api.calls)
+        page = await usecase.search_products_async("이어폰", start=11, display=10)
+        return calls, page
+
+    calls, page = asyncio.run(run())
+
+    assert page.upstream_calls == 0
+    assert len(api.calls) == calls
+    assert page.raw_start == 21 and page.raw_end == 39
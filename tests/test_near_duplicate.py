@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from review.infrastructure.near_duplicate import NearDuplicateIndex
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+_SIGNATURE_SCRIPT = """
+from review.infrastructure.near_duplicate import NearDuplicateIndex
+index = NearDuplicateIndex(threshold=0.8)
+print(index._signature(index._shingle("배송이 빠르고 포장이 꼼꼼해요")))
+"""
+
+
+def _signature_with_hash_seed(seed: str) -> str:
+    env = {**os.environ, "PYTHONHASHSEED": seed}
+    return subprocess.run(
+        [sys.executable, "-c", _SIGNATURE_SCRIPT], cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+
+
+def test_signature_is_stable_across_processes():
+    assert _signature_with_hash_seed("1") == _signature_with_hash_seed("2")
+
+
+def test_add_if_unique_drops_near_duplicates_only():
+    index = NearDuplicateIndex(threshold=0.8)
+
+    assert index.add_if_unique("배송이 빠르고 포장이 꼼꼼해서 만족합니다 재구매 의사 있어요")
+    assert not index.add_if_unique("배송이 빠르고 포장이 꼼꼼해서 만족합니다 재구매 의사 있어요!")
+    assert index.add_if_unique("사이즈가 생각보다 작아서 교환했어요")
+    assert len(index) == 2
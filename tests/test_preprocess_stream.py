@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from review.application.usecase.preprocess_usecase import PreprocessStats, PreprocessUseCase
+
+REVIEWS = [
+    "배송이 정말 빨라요 <br> 포장도 꼼꼼해요!!!",
+    "ㅋㅋㅋㅋ",
+    "사이즈가 생각보다 작아서 교환했어요",
+    "배송이 정말 빨라요 <br> 포장도 꼼꼼해요!!!",   # 완전 일치 중복
+    "배송이 정말 빨라요 포장도 꼼꼼해요",            # 근사 중복
+    {"text": "색상이 사진이랑 똑같고 마감도 좋아요", "rating": 5},
+    {"content": "한 달 만에 고장 나서 환불했어요", "rating": 1},
+]
+
+
+def _execute_input():
+    # execute 는 dict 리뷰의 text 만 읽으므로 content 를 text 로 맞춤
+    items = []
+    for review in REVIEWS:
+        if isinstance(review, dict):
+            items.append({"text": review.get("text", review.get("content")), "rating": review["rating"]})
+        else:
+            items.append({"text": review, "rating": None})
+    return items
+
+
+async def _aiter(elements):
+    for element in elements:
+        await asyncio.sleep(0)
+        yield element
+
+
+async def _collect(stream):
+    return [item async for item in stream]
+
+
+def test_stream_matches_execute_items_and_stats():
+    usecase = PreprocessUseCase()
+    expected = usecase.execute(_execute_input())
+    stats = PreprocessStats()
+
+    items = list(usecase.stream(REVIEWS, stats))
+
+    assert items == expected["clean_reviews"]
+    assert stats.to_dict() == expected["stats"]
+    assert [item.get("rating") for item in items] == [None, None, 5, 1]
+
+
+def test_stream_reads_values_of_review_mapping():
+    reviews = {"1": "배송이 정말 빨라요 좋아요", "2": "사이즈가 생각보다 작아서 교환했어요"}
+
+    items = list(PreprocessUseCase().stream(reviews))
+
+    assert [item["text"] for item in items] == list(reviews.values())
+
+
+@pytest.mark.parametrize("as_async", [False, True])
+def test_astream_flattens_crawler_pages(as_async):
+    usecase = PreprocessUseCase()
+    pages = [REVIEWS[:3], REVIEWS[3:5], REVIEWS[5:]]
+    stats = PreprocessStats()
+
+    items = asyncio.run(_collect(usecase.astream(_aiter(pages) if as_async else pages, stats)))
+
+    assert items == list(usecase.stream(REVIEWS))
+    assert stats.to_dict() == usecase.execute(_execute_input())["stats"]
+
+
+def test_stream_dedup_memory_is_bounded_by_max_dedup_entries():
+    reviews = ["배송이 정말 빨라요 좋아요", "사이즈가 생각보다 작아서 교환했어요", "색상이 사진이랑 똑같아요 예뻐요"]
+
+    unbounded = list(PreprocessUseCase().stream(reviews + reviews[:1]))
+    # 최근 2개만 기억하므로 세 리뷰 뒤에 다시 나온 첫 리뷰는 중복으로 알아채지 못함
+    bounded_stats = PreprocessStats()
+    bounded = list(PreprocessUseCase(max_dedup_entries=2).stream(reviews + reviews[:1], bounded_stats))
+
+    assert len(unbounded) == 3
+    assert len(bounded) == 4 and bounded_stats.deduplicated_count == 0
+    # 최근 항목과의 중복은 계속 걸러냄
+    assert len(list(PreprocessUseCase(max_dedup_entries=2).stream(reviews + reviews[-1:]))) == 3
+
+
+def test_stream_dedup_state_never_exceeds_max_dedup_entries(monkeypatch):
+    usecase = PreprocessUseCase(max_dedup_entries=50)
+    states = []
+    new_state = usecase._new_dedup_state
+    monkeypatch.setattr(usecase, "_new_dedup_state", lambda: states.append(new_state()) or states[-1])
+
+    sizes = []
+    for _ in usecase.stream(f"{index}번째 구매인데 배송이 빨라요 {index * 7919}" for index in range(1000)):
+        recent_texts, near_duplicates = states[0]
+        sizes.append((len(recent_texts._digests), len(near_duplicates)))
+
+    assert len(sizes) > 500
+    assert max(max(size) for size in sizes) == 50
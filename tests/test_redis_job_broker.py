@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from review.adapter.output.redis_job_broker import QUEUE_KEY, RedisJobBroker
+from review.domain.summary_job import SummaryJob
+
+
+def _redis_brokers(count: int):
+    server = fakeredis.FakeServer()
+    return [
+        RedisJobBroker(
+            fakeredis.FakeAsyncRedis(server=server, decode_responses=True),
+            ttl_seconds=60,
+            heartbeat_ttl_seconds=30,
+            worker_id=f"worker-{index}",
+        )
+        for index in range(count)
+    ]
+
+
+def test_redis_dequeue_keeps_job_until_ack():
+    async def run():
+        (broker,) = _redis_brokers(1)
+        job = SummaryJob(name="이어폰", price="10000", info_url="https://smartstore.naver.com/p/1")
+        await broker.enqueue(job)
+        job_id = await broker.dequeue(1)
+        processing = await broker._redis.lrange(broker._processing_key(broker.worker_id), 0, -1)
+        await broker.ack(job_id)
+        after_ack = await broker._redis.lrange(broker._processing_key(broker.worker_id), 0, -1)
+        return job.job_id, job_id, processing, after_ack
+
+    job_id, dequeued, processing, after_ack = asyncio.run(run())
+
+    assert dequeued == job_id
+    assert processing == [job_id]
+    assert after_ack == []
+
+
+def test_redis_jobs_of_dead_worker_are_recovered_once():
+    async def run():
+        dead, first, second = _redis_brokers(3)
+        job = SummaryJob(name="이어폰", price="10000", info_url="https://smartstore.naver.com/p/1")
+        await dead.keepalive()
+        await dead.enqueue(job)
+        await dead.dequeue(1)
+
+        alive_recovered = await first.keepalive()
+        # 생존 키 만료 = 워커 프로세스가 죽음
+        await dead._redis.delete(dead._heartbeat_key(dead.worker_id))
+        recovered = [await first.keepalive(), await second.keepalive()]
+        return job.job_id, alive_recovered, recovered, await first._redis.lrange(QUEUE_KEY, 0, -1)
+
+    job_id, alive_recovered, recovered, queue = asyncio.run(run())
+
+    assert alive_recovered == 0
+    assert sorted(recovered) == [0, 1]
+    assert queue == [job_id]
+
+
+def test_redis_requeue_puts_job_back_at_front():
+    async def run():
+        (broker,) = _redis_brokers(1)
+        jobs = [SummaryJob(name=f"상품 {index}", price="1", info_url="u") for index in range(2)]
+        for job in jobs:
+            await broker.enqueue(job)
+        first = await broker.dequeue(1)
+        await broker.requeue(first)
+        await broker.requeue(first)  # 두 번 되돌려도 한 번만 들어감
+        return first, await broker._redis.lrange(QUEUE_KEY, 0, -1), [job.job_id for job in jobs]
+
+    first, queue, job_ids = asyncio.run(run())
+
+    assert first == job_ids[0]
+    assert queue == job_ids
@@ -0,0 +1,90 @@
+from collections import Counter
+
+import pytest
+
+from review.application.usecase.review_selection_usecase import ReviewSelectionUseCase, polarity
+from review.infrastructure.token_counter import count_tokens
+
+MODEL = "gpt-4.1"
+TEMPLATES = {
+    5: "배송이 빠르고 포장이 꼼꼼해서 만족합니다 색상도 사진과 같아요 {index}번째 구매",
+    3: "무난하게 쓰고 있어요 가격은 적당하고 마감은 보통 수준입니다 {index}번째 구매",
+    1: "일주일 만에 고장 나서 환불 요청했어요 품질이 실망스럽습니다 {index}번째 구매",
+}
+POLARITY_TEMPLATES = {
+    "positive": "배송이 빠르고 품질이 좋아서 만족합니다 재구매 할게요 {index}번째",
+    "negative": "포장이 불량이라 반품했어요 냄새도 심해서 실망입니다 {index}번째",
+    "neutral": "주말에 받아서 아직 써보지는 못했습니다 상자는 두 개로 왔어요 {index}번째",
+}
+
+
+def _rated_reviews():
+    counts = {5: 60, 3: 30, 1: 10}
+    reviews = []
+    for rating, count in counts.items():
+        reviews += [{"text": TEMPLATES[rating].format(index=index), "rating": rating} for index in range(count)]
+    # 별점이 섞여 들어오도록 순서를 섞고 원래 위치를 id 로 기록
+    reviews = reviews[::3] + reviews[1::3] + reviews[2::3]
+    return [{"id": position, **review} for position, review in enumerate(reviews)]
+
+
+def _polarity_reviews():
+    counts = {"positive": 50, "negative": 30, "neutral": 20}
+    reviews = []
+    for group, count in counts.items():
+        reviews += [{"text": POLARITY_TEMPLATES[group].format(index=index)} for index in range(count)]
+    return [{"id": position, **review} for position, review in enumerate(reviews)]
+
+
+def _tokens(reviews):
+    return sum(count_tokens(review["text"], MODEL) for review in reviews)
+
+
+@pytest.mark.parametrize("reviews", [_rated_reviews(), _polarity_reviews()], ids=["rating", "polarity"])
+def test_select_respects_budget_keeps_order_and_reports_savings(reviews):
+    budget = _tokens(reviews) // 4
+
+    result = ReviewSelectionUseCase(token_budget=budget, model=MODEL).select(reviews)
+    selected, stats = result["selected_reviews"], result["stats"]
+
+    assert 0 < len(selected) < len(reviews)
+    assert _tokens(selected) == stats["selected_tokens"] <= budget
+    assert [item["id"] for item in selected] == sorted(item["id"] for item in selected)
+    assert all(item in reviews for item in selected)
+    assert stats["input_tokens"] == _tokens(reviews)
+    assert stats["tokens_saved"] == stats["input_tokens"] - stats["selected_tokens"]
+    assert stats["selected_count"] == len(selected)
+
+
+def test_select_preserves_rating_shares():
+    reviews = _rated_reviews()
+
+    selected = ReviewSelectionUseCase(token_budget=_tokens(reviews) // 4, model=MODEL).select(reviews)["selected_reviews"]
+
+    shares = Counter(item["rating"] for item in selected)
+    for rating, expected in {5: 0.6, 3: 0.3, 1: 0.1}.items():
+        # 그룹 예산을 리뷰 단위로 채우므로 리뷰 한 개 차이까지 허용
+        assert abs(shares[rating] / len(selected) - expected) <= 1 / len(selected) + 1e-9
+
+
+def test_select_preserves_polarity_shares_without_ratings():
+    reviews = _polarity_reviews()
+    assert Counter(polarity(item["text"]) for item in reviews) == {"positive": 50, "negative": 30, "neutral": 20}
+
+    result = ReviewSelectionUseCase(token_budget=_tokens(reviews) // 4, model=MODEL).select(reviews)
+    selected = result["selected_reviews"]
+
+    groups = result["stats"]["selected_groups"]
+    assert sum(groups.values()) == len(selected)
+    for group, expected in {"positive": 0.5, "negative": 0.3, "neutral": 0.2}.items():
+        assert abs(groups[group] / len(selected) - expected) <= 1 / len(selected) + 1e-9
+
+
+@pytest.mark.parametrize("budget", [0, 10 ** 6])
+def test_select_passes_everything_through_without_a_binding_budget(budget):
+    reviews = _rated_reviews()
+
+    result = ReviewSelectionUseCase(token_budget=budget, model=MODEL).select(reviews)
+
+    assert result["selected_reviews"] == reviews
+    assert result["stats"]["tokens_saved"] == 0
@@ -0,0 +1,79 @@
+import asyncio
+import importlib
+import threading
+
+from review.application.usecase.preprocess_usecase import PreprocessUseCase
+from review.application.usecase.review_selection_usecase import ReviewSelectionUseCase
+from review.application.usecase.review_summary_pipeline_usecase import ReviewSummaryPipelineUseCase
+
+# 불만 리뷰지만 긍정 어휘("좋")가 더 많아 어휘 기반 극성으로는 긍정으로 분류됨
+LOW_RATED = "포장은 좋았고 사진도 좋아 보였는데 한 달 만에 고장 났어요 {index}번"
+HIGH_RATED = "배송이 빠르고 마감이 깔끔해서 만족하며 쓰고 있어요 가족들도 만족해요 {index}번"
+
+
+class _Crawler:
+    def __init__(self, reviews):
+        self.reviews = reviews
+
+    async def crawling_naver_review_items(self, info_url, is_disconnected=None):
+        return self.reviews
+
+
+def _pipeline(reviews, token_budget):
+    return ReviewSummaryPipelineUseCase(
+        _Crawler(reviews),
+        PreprocessUseCase(near_duplicate_threshold=0),
+        summarize_usecase=None,
+        pdf_usecase=None,
+        selection_usecase=ReviewSelectionUseCase(token_budget=token_budget),
+    )
+
+
+def test_collect_reviews_keeps_rating_distribution_from_crawler():
+    reviews = [{"text": HIGH_RATED.format(index=index), "rating": 5.0} for index in range(80)]
+    reviews += [{"text": LOW_RATED.format(index=index), "rating": 1.0} for index in range(20)]
+
+    texts = asyncio.run(_pipeline(reviews, token_budget=600).collect_reviews("https://smartstore.naver.com/p/1"))
+
+    low_rated = sum("고장" in text for text in texts)
+    assert 0 < len(texts) < len(reviews)
+    # 별점 그룹별로 예산을 나누므로 1점 리뷰도 전체 비율(20%)만큼 남음
+    assert abs(low_rated / len(texts) - 0.2) < 0.05
+
+
+def test_selection_budget_is_never_below_chunk_size(monkeypatch):
+    from config import review_config
+
+    monkeypatch.setenv("REVIEW_SUMMARY_CHUNK_TOKENS", "6000")
+    monkeypatch.setenv("REVIEW_SUMMARY_MAP_CONCURRENCY", "4")
+    try:
+        monkeypatch.delenv("REVIEW_SELECTION_TOKEN_BUDGET", raising=False)
+        assert importlib.reload(review_config).REVIEW_SELECTION_TOKEN_BUDGET == 24000
+
+        monkeypatch.setenv("REVIEW_SELECTION_TOKEN_BUDGET", "5000")
+        assert importlib.reload(review_config).REVIEW_SELECTION_TOKEN_BUDGET == 6000
+
+        monkeypatch.setenv("REVIEW_SELECTION_TOKEN_BUDGET", "0")
+        assert importlib.reload(review_config).REVIEW_SELECTION_TOKEN_BUDGET == 0
+    finally:
+        monkeypatch.undo()
+        importlib.reload(review_config)
+
+
+def test_selection_runs_off_the_event_loop_thread():
+    threads = []
+
+    class _RecordingSelection(ReviewSelectionUseCase):
+        def select(self, clean_reviews):
+            threads.append(threading.get_ident())
+            return super().select(clean_reviews)
+
+    pipeline = _pipeline([{"text": HIGH_RATED.format(index=0), "rating": 5.0}], token_budget=600)
+    pipeline.selection_usecase = _RecordingSelection(token_budget=600)
+
+    async def run():
+        await pipeline.collect_reviews("https://smartstore.naver.com/p/1")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert threads and threads[0] != loop_thread
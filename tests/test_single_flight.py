@@ -0,0 +1,85 @@
+import asyncio
+from datetime import datetime
+
+from config.cache.cache_backend import InMemoryCacheBackend
+from config.cache.single_flight import SingleFlight
+
+
+def _worker(name: str, backend: InMemoryCacheBackend) -> SingleFlight:
+    # 같은 backend 를 공유하는 SingleFlight 인스턴스 = 서로 다른 워커
+    return SingleFlight(
+        name,
+        backend,
+        lock_ttl_seconds=5,
+        result_ttl_seconds=60,
+        wait_timeout_seconds=5,
+        poll_interval_seconds=0.01,
+    )
+
+
+def test_leader_and_remote_follower_get_same_value():
+    backend = InMemoryCacheBackend()
+    leader, follower = _worker("crawl", backend), _worker("crawl", backend)
+    calls = []
+
+    async def crawl(_probe):
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"reviews": [{"content": "좋아요", "created_at": datetime(2024, 3, 1)}]}
+
+    async def follow(_probe):
+        raise AssertionError("follower must not run the flight")
+
+    async def run():
+        leader_task = asyncio.create_task(leader.do("product-1", crawl))
+        await asyncio.sleep(0.01)
+        return await asyncio.gather(leader_task, follower.do("product-1", follow))
+
+    leader_result, follower_result = asyncio.run(run())
+
+    assert calls == [1]
+    assert leader_result == follower_result
+    assert leader_result["reviews"][0]["created_at"] == "2024-03-01T00:00:00"
+    assert follower.stats()["coalesced_remote"] == 1
+
+
+def test_follower_ignores_result_of_previous_flight():
+    backend = InMemoryCacheBackend()
+    first, leader, follower = _worker("crawl", backend), _worker("crawl", backend), _worker("crawl", backend)
+
+    def returning(value, delay=0.0):
+        async def func(_probe):
+            await asyncio.sleep(delay)
+            return value
+        return func
+
+    async def run():
+        # 이전 실행의 결과가 result TTL 동안 남아 있어도, 새 실행의 대기자는 새 결과를 기다림
+        await first.do("product-1", returning("old"))
+        leader_task = asyncio.create_task(leader.do("product-1", returning("new", delay=0.05)))
+        await asyncio.sleep(0.01)
+        return await asyncio.gather(leader_task, follower.do("product-1", returning("unused")))
+
+    assert asyncio.run(run()) == ["new", "new"]
+
+
+def test_follower_takes_over_when_leader_fails():
+    backend = InMemoryCacheBackend()
+    leader, follower = _worker("crawl", backend), _worker("crawl", backend)
+
+    async def failing(_probe):
+        await asyncio.sleep(0.03)
+        raise RuntimeError("crawl failed")
+
+    async def succeeding(_probe):
+        return ["retried"]
+
+    async def run():
+        leader_task = asyncio.create_task(leader.do("product-1", failing))
+        await asyncio.sleep(0.01)
+        return await asyncio.gather(leader_task, follower.do("product-1", succeeding), return_exceptions=True)
+
+    leader_result, follower_result = asyncio.run(run())
+
+    assert isinstance(leader_result, RuntimeError)
+    assert follower_result == ["retried"]
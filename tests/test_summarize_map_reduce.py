@@ -0,0 +1,93 @@
+import asyncio
+import json
+import re
+from typing import List, Optional, Sequence
+
+import pytest
+
+from review.application.port.llm_port import LLMPort
+from review.application.usecase.summarize_usecase import SummarizeUseCase
+from review.infrastructure.token_counter import count_tokens
+from tests.conftest import read_fixture
+
+MODEL = "gpt-4.1"
+_PART_RE = re.compile(r"(\d+)/(\d+) 번째 묶음")
+_TAG_RE = re.compile(r"part\d+")
+_REVIEWS_RE = re.compile(r"입력 리뷰\(전처리 완료\):\n(.*?)\n\n\s*반드시", re.DOTALL)
+_PARTIALS_RE = re.compile(r"부분 요약 목록:\n(.*?)\n\n\s*요구 사항", re.DOTALL)
+
+
+class _FakeLLM(LLMPort):
+    """묶음 요약은 partN 태그를, 병합은 입력에 보인 태그를 모두 모아 돌려주는 가짜 LLM."""
+
+    model_name = MODEL
+
+    def __init__(self, padding: int = 0):
+        self.padding = padding
+        self.chunk_inputs: List[str] = []
+        self.merge_inputs: List[str] = []
+
+    def summarize(self, prompt: str, fields: Optional[Sequence[str]] = None) -> str:
+        raise AssertionError("sync path is not used")
+
+    async def summarize_async(self, prompt: str, fields: Optional[Sequence[str]] = None) -> str:
+        part = _PART_RE.search(prompt)
+        if part:
+            self.chunk_inputs.append(_REVIEWS_RE.search(prompt).group(1).strip())
+            tags = [f"part{part.group(1)}"]
+        elif "부분 요약 목록" in prompt:
+            partials = _PARTIALS_RE.search(prompt).group(1).strip()
+            self.merge_inputs.append(partials)
+            tags = sorted(set(_TAG_RE.findall(partials)), key=lambda tag: int(tag[4:]))
+        else:
+            tags = ["single"]
+
+        return json.dumps({
+            "summary": " ".join(tags) + " 요약" + " 내용" * self.padding,
+            "positive_features": "배송이 빠름",
+            "negative_features": "사이즈가 작음",
+            "keywords": ["배송", "포장"],
+        }, ensure_ascii=False)
+
+
+@pytest.fixture(scope="module")
+def oversized_reviews() -> List[str]:
+    return read_fixture("oversized_reviews.txt").splitlines()
+
+
+def _usecase(llm: _FakeLLM, chunk_tokens: int) -> SummarizeUseCase:
+    return SummarizeUseCase(llm, chunk_tokens=chunk_tokens, map_concurrency=4)
+
+
+def test_small_input_uses_single_prompt(oversized_reviews):
+    llm = _FakeLLM()
+    summary = asyncio.run(_usecase(llm, 100_000).summarize_reviews_async("이어폰", oversized_reviews))
+
+    assert summary["summary"] == "single 요약"
+    assert llm.chunk_inputs == [] and llm.merge_inputs == []
+
+
+def test_map_reduce_covers_every_chunk_within_budget(oversized_reviews):
+    chunk_tokens = 400
+    llm = _FakeLLM()
+    summary = asyncio.run(_usecase(llm, chunk_tokens).summarize_reviews_async("이어폰", oversized_reviews))
+
+    total_parts = len(llm.chunk_inputs)
+    assert total_parts > 3
+    # 예산보다 긴 리뷰 하나도 잘라서 나누므로 어떤 묶음도 예산을 넘지 않음
+    assert all(count_tokens(chunk, MODEL) <= chunk_tokens for chunk in llm.chunk_inputs)
+    assert summary["summary"] == " ".join(f"part{index}" for index in range(1, total_parts + 1)) + " 요약"
+
+
+def test_reduce_keeps_every_group_when_merging_does_not_shrink(oversized_reviews):
+    # 부분 요약 하나가 예산의 절반을 넘으면 그룹마다 하나씩만 들어가 병합해도 개수가 줄지 않음
+    chunk_tokens = 400
+    llm = _FakeLLM(padding=300)
+    summary = asyncio.run(_usecase(llm, chunk_tokens).summarize_reviews_async("이어폰", oversized_reviews))
+
+    total_parts = len(llm.chunk_inputs)
+    tags = " ".join(f"part{index}" for index in range(1, total_parts + 1))
+    assert summary["summary"].startswith(tags + " 요약")
+    # 마지막 병합 입력은 부분 요약을 chunk_tokens / 개수 로 잘라 예산 안에 맞춤
+    final_input = llm.merge_inputs[-1]
+    assert count_tokens(final_input, MODEL) <= chunk_tokens + total_parts
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import re
+from typing import Dict, List, Optional, Sequence
+
+from config.cache.cache_backend import InMemoryCacheBackend
+from review.adapter.output.fake_batch_adapter import FakeBatchAdapter
+from review.application.port.llm_port import LLMPort
+from review.application.usecase.summarize_usecase import SummarizeUseCase
+from review.application.usecase.summary_batch_usecase import SummaryBatchUseCase
+from review.domain.summary_job import JOB_FAILED, JOB_SUCCEEDED
+from review.infrastructure.cache.summary_cache import SummaryCache
+
+_PRODUCT_RE = re.compile(r"상품 '([^']+)'")
+
+
+def _summary(product_name: str, **overrides) -> str:
+    summary = {
+        "summary": f"{product_name} 요약",
+        "positive_features": "배송이 빠름",
+        "negative_features": "없음",
+        "keywords": ["배송", "포장"],
+    }
+    summary.update(overrides)
+    return json.dumps({key: value for key, value in summary.items() if value is not None}, ensure_ascii=False)
+
+
+class _OnlineLLM(LLMPort):
+    """배치로 처리하지 못한 요청(깨진 필드 재요청, map-reduce)을 받는 온라인 LLM."""
+
+    model_name = "gpt-4.1"
+
+    def __init__(self):
+        self.prompts: List[str] = []
+
+    def summarize(self, prompt: str, fields: Optional[Sequence[str]] = None) -> str:
+        raise AssertionError("sync path is not used")
+
+    async def summarize_async(self, prompt: str, fields: Optional[Sequence[str]] = None) -> str:
+        self.prompts.append(prompt)
+        return _summary(_PRODUCT_RE.search(prompt).group(1))
+
+
+class _BatchResponder:
+    def __init__(self):
+        self.prompts: List[str] = []
+
+    def __call__(self, prompt: str) -> Optional[str]:
+        self.prompts.append(prompt)
+        product_name = _PRODUCT_RE.search(prompt).group(1)
+        if product_name == "키워드 누락 상품":
+            return _summary(product_name, keywords=None)
+        if product_name == "배치 실패 상품":
+            return None
+        return _summary(product_name)
+
+
+class _Pipeline:
+    """SummaryBatchUseCase 가 쓰는 collect_reviews / summarize_usecase 만 제공하는 파이프라인."""
+
+    def __init__(self, summarize_usecase: SummarizeUseCase, reviews: Dict[str, List[str]]):
+        self.summarize_usecase = summarize_usecase
+        self.reviews = reviews
+
+    async def collect_reviews(self, info_url: str) -> List[str]:
+        if info_url not in self.reviews:
+            raise RuntimeError("crawl failed")
+        return self.reviews[info_url]
+
+
+def _reviews(count: int) -> List[str]:
+    return [f"배송이 빠르고 포장이 꼼꼼해요 {index}" for index in range(count)]
+
+
+def test_batch_flow_submits_only_uncached_prompts_and_fills_cache():
+    llm, responder = _OnlineLLM(), _BatchResponder()
+    cache = SummaryCache(InMemoryCacheBackend(), ttl_seconds=60)
+    summarize = SummarizeUseCase(llm, cache, chunk_tokens=300, batch_port=FakeBatchAdapter(responder))
+    pipeline = _Pipeline(summarize, {
+        "u-normal": _reviews(3),
+        "u-duplicate": _reviews(3),
+        "u-repair": _reviews(2),
+        "u-failed": _reviews(1),
+        "u-large": _reviews(80),
+        "u-cached": _reviews(4),
+    })
+    usecase = SummaryBatchUseCase(pipeline, poll_interval=0.01, prepare_concurrency=2, ttl_seconds=60)
+
+    products = [
+        ("일반 상품", "1000", "u-normal"),
+        ("일반 상품", "1000", "u-duplicate"),   # 같은 입력은 한 번만 제출
+        ("키워드 누락 상품", "1000", "u-repair"),
+        ("배치 실패 상품", "1000", "u-failed"),
+        ("대용량 상품", "1000", "u-large"),      # 한 프롬프트에 담기지 않아 map-reduce
+        ("캐시 상품", "1000", "u-cached"),
+        ("크롤링 실패 상품", "1000", "u-missing"),
+    ]
+
+    async def run():
+        await summarize.summarize_reviews_async("캐시 상품", _reviews(4))
+        llm.prompts.clear()
+
+        batch = usecase.submit(products)
+        while not batch.is_finished:
+            await asyncio.sleep(0.01)
+
+        # 두 번째 배치: 성공한 상품은 모두 캐시에서 바로 채워져 새 배치를 제출하지 않음
+        submitted = len(responder.prompts)
+        again = usecase.submit([product for product in products if product[0] in ("일반 상품", "키워드 누락 상품")])
+        while not again.is_finished:
+            await asyncio.sleep(0.01)
+        return batch, again, submitted
+
+    batch, again, submitted = asyncio.run(run())
+    items = {item.info_url: item for item in batch.items}
+
+    assert batch.status == JOB_SUCCEEDED and batch.provider_batch_id.startswith("fake-batch-")
+    assert submitted == 3  # 일반 / 키워드 누락 / 배치 실패 (중복·캐시·대용량 제외)
+    assert items["u-normal"].summary["summary"] == "일반 상품 요약"
+    assert items["u-duplicate"].summary == items["u-normal"].summary
+    assert items["u-cached"].summary["summary"] == "캐시 상품 요약"
+    assert items["u-large"].status == JOB_SUCCEEDED
+    # 깨진 필드(keywords)만 온라인으로 다시 요청해 채움
+    assert items["u-repair"].summary["keywords"] == ["배송", "포장"]
+    assert any("keywords" in prompt and "키워드 누락 상품" in prompt for prompt in llm.prompts)
+    assert items["u-failed"].status == JOB_FAILED and items["u-failed"].error == "batch request failed"
+    assert items["u-missing"].status == JOB_FAILED and "crawl failed" in items["u-missing"].error
+
+    assert again.status == JOB_SUCCEEDED and again.provider_batch_id is None
+    assert all(item.status == JOB_SUCCEEDED for item in again.items)
+    assert len(responder.prompts) == submitted
@@ -0,0 +1,111 @@
+import asyncio
+
+from review.adapter.output.in_memory_job_broker import InMemoryJobBroker
+from review.application.usecase.summary_job_usecase import SummaryJobUseCase
+from review.domain.summary_job import JOB_QUEUED, JOB_SUCCEEDED
+
+
+class _SlowPipeline:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.runs = 0
+
+    async def run(self, name, price, info_url, *, on_stage=None):
+        self.runs += 1
+        await on_stage("crawl")
+        await asyncio.sleep(self.delay)
+        return {"summary": {"summary": f"{name} 요약"}, "pdf_url": None}
+
+
+class _HangingNotifier:
+    def __init__(self):
+        self.started = asyncio.Event()
+
+    async def validate(self, url):
+        return None
+
+    async def notify(self, url, payload):
+        self.started.set()
+        await asyncio.sleep(60)
+        return True
+
+
+def _usecase(broker, pipeline, notifier=None) -> SummaryJobUseCase:
+    return SummaryJobUseCase(broker, pipeline, notifier, workers=1, heartbeat_interval=0.05)
+
+
+async def _wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not await predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+def test_job_runs_and_is_acked():
+    async def run():
+        broker = InMemoryJobBroker()
+        usecase = _usecase(broker, _SlowPipeline(0.01))
+        usecase.start()
+        job = await usecase.submit("이어폰", "10000", "https://smartstore.naver.com/p/1")
+        await _wait_for(lambda: _finished(broker, job.job_id))
+        await usecase.stop()
+        return await broker.load(job.job_id), broker
+
+    job, broker = asyncio.run(run())
+
+    assert job.status == JOB_SUCCEEDED
+    assert job.result["summary"] == {"summary": "이어폰 요약"}
+    assert broker._processing == set()
+
+
+def test_stop_requeues_in_flight_job():
+    async def run():
+        broker = InMemoryJobBroker()
+        pipeline = _SlowPipeline(60)
+        usecase = _usecase(broker, pipeline)
+        usecase.start()
+        job = await usecase.submit("이어폰", "10000", "https://smartstore.naver.com/p/1")
+        await _wait_for(lambda: _has_stage(broker, job.job_id))
+        await usecase.stop()
+
+        stopped = await broker.load(job.job_id)
+        # 다시 시작한 워커가 되돌려진 작업을 이어서 처리
+        pipeline.delay = 0
+        usecase.start()
+        await _wait_for(lambda: _finished(broker, job.job_id))
+        await usecase.stop()
+        return stopped, await broker.load(job.job_id), pipeline.runs
+
+    stopped, finished, runs = asyncio.run(run())
+
+    assert stopped.status == JOB_QUEUED and stopped.stage is None
+    assert finished.status == JOB_SUCCEEDED
+    assert runs == 2
+
+
+def test_stop_during_webhook_does_not_rerun_finished_job():
+    async def run():
+        broker = InMemoryJobBroker()
+        notifier = _HangingNotifier()
+        pipeline = _SlowPipeline(0)
+        usecase = _usecase(broker, pipeline, notifier)
+        usecase.start()
+        job = await usecase.submit("이어폰", "10000", "https://smartstore.naver.com/p/1", webhook_url="https://hook")
+        await asyncio.wait_for(notifier.started.wait(), 2)
+        await usecase.stop()
+        return await broker.load(job.job_id), broker
+
+    job, broker = asyncio.run(run())
+
+    assert job.status == JOB_SUCCEEDED
+    assert broker._queue.empty() and broker._processing == set()
+
+
+async def _finished(broker, job_id) -> bool:
+    job = await broker.load(job_id)
+    return job is not None and job.is_finished
+
+
+async def _has_stage(broker, job_id) -> bool:
+    job = await broker.load(job_id)
+    return job is not None and job.stage == "crawl"
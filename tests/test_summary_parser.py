@@ -0,0 +1,36 @@
+import pytest
+
+from review.infrastructure.summary_parser import extract_json_object, parse_summary
+
+
+@pytest.mark.parametrize("raw", [
+    '{"summary": "좋아요"}',
+    '요약 결과입니다.\n```json\n{"summary": "좋아요"}\n```',
+    # 객체 뒤의 설명에 '}' 가 있어도 첫 객체만 읽음
+    '{"summary": "좋아요"}\n참고: {중괄호} 가 들어간 설명',
+    '{"summary": "좋아요"} {"summary": "두 번째 객체"}',
+])
+def test_extract_json_object_reads_first_object(raw):
+    assert extract_json_object(raw) == {"summary": "좋아요"}
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ('{"summary": "좋아요", "keywords": ["배송", "포장",],}', {"summary": "좋아요", "keywords": ["배송", "포장"]}),
+    # max_tokens 로 잘린 응답
+    ('{"summary": "좋아요", "keywords": ["배송", "포', {"summary": "좋아요", "keywords": ["배송", "포"]}),
+    ('{"summary": "좋아요", "positive_', {"summary": "좋아요"}),
+])
+def test_extract_json_object_repairs_broken_json(raw, expected):
+    assert extract_json_object(raw) == expected
+
+
+@pytest.mark.parametrize("raw", [None, "", "JSON 없음", "[1, 2]"])
+def test_extract_json_object_returns_none_without_object(raw):
+    assert extract_json_object(raw) is None
+
+
+def test_parse_summary_reports_broken_fields():
+    summary, broken = parse_summary('{"summary": "좋아요", "keywords": "배송, 포장, 배송", "negative_features": null}')
+
+    assert summary == {"summary": "좋아요", "keywords": ["배송", "포장"]}
+    assert broken == ["positive_features", "negative_features"]
@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from config import crawler_config
+from config.stage_timer import StageTimer
+from config.webdriver.waits import content_signature, wait_for_content_change
+
+REVIEW_SELECTOR = "li.PxsZltB5tV"
+
+
+class _ReplayDriver:
+    """기록해 둔 리뷰 목록 상태를 시간 순서대로 돌려주는 가짜 드라이버."""
+
+    def __init__(self, signatures, interval: float):
+        self._signatures = signatures
+        self._interval = interval
+        self._started_at = time.perf_counter()
+
+    def execute_script(self, script, *args):
+        step = int((time.perf_counter() - self._started_at) / self._interval)
+        return self._signatures[min(step, len(self._signatures) - 1)]
+
+
+def _signatures():
+    return ["20|첫 페이지 첫 리뷰|첫 페이지 끝 리뷰", "", "20|둘째 페이지 첫 리뷰|둘째 페이지 끝 리뷰"]
+
+
+def test_content_signature_reads_current_list():
+    driver = _ReplayDriver(_signatures(), interval=60)
+    assert content_signature(driver, REVIEW_SELECTOR) == "20|첫 페이지 첫 리뷰|첫 페이지 끝 리뷰"
+
+
+def test_condition_wait_is_faster_than_fixed_sleep(monkeypatch):
+    legacy_sleep = 1.0
+    timer = StageTimer("fixture")
+
+    monkeypatch.setattr(crawler_config, "CRAWL_WAIT_STRATEGY", "sleep")
+    with timer.stage("sleep"):
+        wait_for_content_change(_ReplayDriver(_signatures(), 0.05), REVIEW_SELECTOR, "", legacy_sleep=legacy_sleep)
+
+    monkeypatch.setattr(crawler_config, "CRAWL_WAIT_STRATEGY", "condition")
+    driver = _ReplayDriver(_signatures(), 0.05)
+    previous = content_signature(driver, REVIEW_SELECTOR)
+    with timer.stage("condition"):
+        wait_for_content_change(driver, REVIEW_SELECTOR, previous, legacy_sleep=legacy_sleep)
+
+    # 목록이 빈 상태("")를 지나 다음 페이지 내용으로 바뀐 뒤에만 반환
+    assert content_signature(driver, REVIEW_SELECTOR).startswith("20|둘째 페이지")
+    assert timer.durations["sleep"] >= legacy_sleep
+    assert timer.durations["condition"] < timer.durations["sleep"]
+
+
+def test_condition_wait_gives_up_after_timeout(monkeypatch):
+    monkeypatch.setattr(crawler_config, "CRAWL_WAIT_STRATEGY", "condition")
+    monkeypatch.setattr(crawler_config, "CRAWL_WAIT_TIMEOUT", 0.2)
+    driver = _ReplayDriver(["20|같은 목록|같은 목록"], interval=60)
+
+    started_at = time.perf_counter()
+    wait_for_content_change(driver, REVIEW_SELECTOR, "20|같은 목록|같은 목록", legacy_sleep=5)
+    assert time.perf_counter() - started_at < 5
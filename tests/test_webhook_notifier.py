@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from review.adapter.output.webhook_notifier import WebhookNotifier, WebhookUrlError
+
+
+def _notifier(handler=None, allowed_hosts=()):
+    sent = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        sent.append(str(request.url))
+        return handler(request) if handler else httpx.Response(200)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+    return WebhookNotifier(client, timeout=1, max_retries=0, allowed_hosts=allowed_hosts), sent
+
+
+@pytest.mark.parametrize("url", [
+    "http://93.184.216.34/hook",           # https 아님
+    "https://127.0.0.1/hook",              # 루프백
+    "https://10.0.0.5/hook",               # 사설
+    "https://169.254.169.254/latest/meta-data",  # 링크로컬 (클라우드 메타데이터)
+    "https://100.64.0.1/hook",             # 공유 주소 대역
+    "https://[::1]/hook",
+    "https://[::ffff:192.168.0.1]/hook",   # IPv4-mapped 사설 주소
+    "https://localhost/hook",
+])
+def test_rejects_non_https_or_internal_targets(url):
+    notifier, sent = _notifier()
+
+    with pytest.raises(WebhookUrlError):
+        asyncio.run(notifier.validate(url))
+    assert asyncio.run(notifier.notify(url, {"job_id": "1"})) is False
+    assert sent == []
+
+
+def test_posts_to_public_https_target():
+    notifier, sent = _notifier()
+
+    assert asyncio.run(notifier.notify("https://93.184.216.34/hook", {"job_id": "1"})) is True
+    assert sent == ["https://93.184.216.34/hook"]
+
+
+def test_allowlist_replaces_address_check():
+    notifier, sent = _notifier(allowed_hosts=["hooks.internal.example", " "])
+
+    asyncio.run(notifier.validate("https://hooks.internal.example/done"))
+    with pytest.raises(WebhookUrlError):
+        asyncio.run(notifier.validate("https://93.184.216.34/hook"))
+    with pytest.raises(WebhookUrlError):
+        asyncio.run(notifier.validate("http://hooks.internal.example/done"))
+
+
+def test_redirect_is_not_followed():
+    notifier, sent = _notifier(lambda request: httpx.Response(302, headers={"location": "https://127.0.0.1/"}))
+
+    assert asyncio.run(notifier.notify("https://93.184.216.34/hook", {"job_id": "1"})) is False
+    assert sent == ["https://93.184.216.34/hook"]